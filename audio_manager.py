@@ -13,19 +13,22 @@ This module provides comprehensive audio support for whiteboard animations:
 
 Dependencies:
 - pydub: For audio manipulation
+- numpy: For typewriter and drawing sound synthesis (cached templates)
 - FFmpeg: For audio/video encoding (with audio support enabled)
 """
 
 import os
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import json
 
+import numpy as np
+
 # Try to import pydub
 try:
     from pydub import AudioSegment
-    from pydub.generators import WhiteNoise
     PYDUB_AVAILABLE = True
 except ImportError:
     PYDUB_AVAILABLE = False
@@ -33,6 +36,99 @@ except ImportError:
     print("   Install with: pip install pydub")
 
 
+# Synthesized sounds: one click template and one noise loop per sample rate,
+# generated once (seeded) and reused by every AudioManager of the process
+SYNTH_SEED = 1903
+TYPEWRITER_CLICK_MS = 50
+TYPEWRITER_CLICK_GAIN_DB = -20
+TYPEWRITER_CLICK_FADE_MS = (5, 20)  # attack, decay
+DRAWING_NOISE_LOOP_MS = 2000
+DRAWING_NOISE_GAIN_DB = -25
+DRAWING_FADE_MS = (100, 200)  # fade in, fade out
+INT16_MAX = 32767
+
+
+def db_to_gain(db: float) -> float:
+    """Amplitude factor of a gain in dB."""
+    return 10 ** (db / 20)
+
+
+def volume_to_db(volume: float) -> float:
+    """Gain in dB of a volume multiplier (same convention as the rest of this module)."""
+    return 20 * (volume - 1)
+
+
+def ms_to_samples(duration_ms: float, sample_rate: int) -> int:
+    """Number of samples in duration_ms milliseconds."""
+    return int(sample_rate * duration_ms / 1000)
+
+
+def to_int16(samples: np.ndarray) -> np.ndarray:
+    """Round and clip float samples to 16-bit PCM."""
+    return np.clip(np.rint(samples), -INT16_MAX - 1, INT16_MAX).astype(np.int16)
+
+
+def apply_fades(samples: np.ndarray, fade_in: int, fade_out: int) -> np.ndarray:
+    """Linear fade in/out (in samples) applied in place to the ends of samples."""
+    fade_in = min(fade_in, len(samples))
+    fade_out = min(fade_out, len(samples))
+    if fade_in:
+        samples[:fade_in] = to_int16(samples[:fade_in] * (np.arange(fade_in) / fade_in))
+    if fade_out:
+        samples[-fade_out:] = to_int16(samples[-fade_out:] * (1 - np.arange(fade_out) / fade_out))
+    return samples
+
+
+@lru_cache(maxsize=None)
+def click_template(sample_rate: int) -> np.ndarray:
+    """Typewriter click: a white noise burst at -20 dB with a short attack and decay (float samples)."""
+    rng = np.random.default_rng(SYNTH_SEED)
+    length = ms_to_samples(TYPEWRITER_CLICK_MS, sample_rate)
+    click = rng.uniform(-1.0, 1.0, length) * INT16_MAX * db_to_gain(TYPEWRITER_CLICK_GAIN_DB)
+    attack, decay = (ms_to_samples(ms, sample_rate) for ms in TYPEWRITER_CLICK_FADE_MS)
+    click[:attack] *= np.arange(attack) / attack
+    click[-decay:] *= 1 - np.arange(decay) / decay
+    click.flags.writeable = False
+    return click
+
+
+@lru_cache(maxsize=None)
+def noise_loop(sample_rate: int) -> np.ndarray:
+    """White noise loop at -25 dB repeated under drawing sounds (float samples)."""
+    rng = np.random.default_rng(SYNTH_SEED + 1)
+    length = ms_to_samples(DRAWING_NOISE_LOOP_MS, sample_rate)
+    noise = rng.uniform(-1.0, 1.0, length) * INT16_MAX * db_to_gain(DRAWING_NOISE_GAIN_DB)
+    noise.flags.writeable = False
+    return noise
+
+
+def synthesize_typewriter(num_characters: int, char_interval: float, volume: float,
+                          sample_rate: int) -> np.ndarray:
+    """16-bit samples of a typewriter track: for each character, char_interval of silence then a click."""
+    click = to_int16(click_template(sample_rate) * db_to_gain(volume_to_db(volume)))
+    silence = ms_to_samples(int(char_interval * 1000), sample_rate)
+    period = silence + len(click)
+    count = max(0, num_characters)
+    buffer = np.zeros(count * period, dtype=np.int16)
+    # One row per character: the click fills the end of each row, written in place
+    buffer.reshape(count, period)[:, silence:] = click
+    return buffer
+
+
+def synthesize_drawing(duration: float, volume: float, sample_rate: int) -> np.ndarray:
+    """16-bit samples of a drawing sound: the noise loop repeated for duration, faded in and out."""
+    loop = to_int16(noise_loop(sample_rate) * db_to_gain(volume_to_db(volume)))
+    samples = np.resize(loop, ms_to_samples(int(duration * 1000), sample_rate))
+    fade_in, fade_out = (ms_to_samples(ms, sample_rate) for ms in DRAWING_FADE_MS)
+    return apply_fades(samples, fade_in, fade_out)
+
+
+def samples_to_segment(samples: np.ndarray, sample_rate: int) -> 'AudioSegment':
+    """Mono 16-bit AudioSegment holding samples."""
+    return AudioSegment(data=np.ascontiguousarray(samples, dtype=np.int16).tobytes(), sample_width=2,
+                        frame_rate=sample_rate, channels=1)
+
+
 class AudioManager:
     """
     Manages all audio aspects of whiteboard animation.
@@ -259,27 +355,12 @@ class AudioManager:
             return False
         
         try:
-            # Generate simple click sound for each character
-            # In a real implementation, you could load actual typewriter samples
-            click_duration = 50  # ms
-            
-            typewriter_audio = AudioSegment.silent(duration=0)
-            
-            for i in range(num_characters):
-                # Add silence before click
-                silence = AudioSegment.silent(duration=int(char_interval * 1000))
-                # Generate a simple click (short white noise burst)
-                click = WhiteNoise().to_audio_segment(duration=click_duration)
-                # Apply volume and envelope to make it sound like a click
-                click = click - 20  # Reduce volume
-                click = click.fade_in(5).fade_out(20)
-                
-                typewriter_audio += silence + click
-            
-            # Apply overall volume
-            if volume != 1.0:
-                db_change = 20 * (volume - 1)
-                typewriter_audio = typewriter_audio + db_change
+            # One cached click template, written into a preallocated buffer
+            # at each keystroke (no per-character segment concatenation)
+            typewriter_audio = samples_to_segment(
+                synthesize_typewriter(num_characters, char_interval, volume, self.sample_rate),
+                self.sample_rate
+            )
             
             # Store with timing information
             start_time_ms = int(start_time * 1000)
@@ -317,22 +398,11 @@ class AudioManager:
             return False
         
         try:
-            # Generate a subtle scratching/drawing sound
-            # In a real implementation, you could load actual drawing samples
-            duration_ms = int(duration * 1000)
-            
-            # Create a continuous low-level noise to simulate drawing
-            drawing_audio = WhiteNoise().to_audio_segment(duration=duration_ms)
-            # Apply filtering and volume to make it subtle
-            drawing_audio = drawing_audio - 25  # Reduce volume significantly
-            
-            # Apply overall volume
-            if volume != 1.0:
-                db_change = 20 * (volume - 1)
-                drawing_audio = drawing_audio + db_change
-            
-            # Add fade in and out for smoothness
-            drawing_audio = drawing_audio.fade_in(100).fade_out(200)
+            # Subtle continuous noise: the cached noise loop repeated for the duration
+            drawing_audio = samples_to_segment(
+                synthesize_drawing(duration, volume, self.sample_rate),
+                self.sample_rate
+            )
             
             # Store with timing information
             start_time_ms = int(start_time * 1000)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: typewriter and drawing sound generation.
+
+Compares the previous pydub implementation (one WhiteNoise segment per
+character appended to an ever-growing AudioSegment, white noise generated
+for the whole drawing) with the NumPy synthesis from cached templates used
+by AudioManager.
+
+Usage:
+    python benchmark_audio_synthesis.py
+"""
+
+import sys
+import time
+
+from pydub import AudioSegment
+from pydub.generators import WhiteNoise
+
+from audio_manager import AudioManager
+
+CHARACTER_COUNTS = [100, 500, 2000]
+DRAWING_SECONDS = [10, 60]
+
+
+def legacy_typewriter(num_characters, char_interval=0.1, volume=0.3):
+    """The typewriter track AudioManager built before (kept for comparison)."""
+    typewriter_audio = AudioSegment.silent(duration=0)
+    for _ in range(num_characters):
+        silence = AudioSegment.silent(duration=int(char_interval * 1000))
+        click = WhiteNoise().to_audio_segment(duration=50)
+        click = click - 20
+        click = click.fade_in(5).fade_out(20)
+        typewriter_audio += silence + click
+    if volume != 1.0:
+        typewriter_audio = typewriter_audio + 20 * (volume - 1)
+    return typewriter_audio
+
+
+def legacy_drawing(duration, volume=0.2):
+    """The drawing sound AudioManager built before (kept for comparison)."""
+    drawing_audio = WhiteNoise().to_audio_segment(duration=int(duration * 1000))
+    drawing_audio = drawing_audio - 25
+    if volume != 1.0:
+        drawing_audio = drawing_audio + 20 * (volume - 1)
+    return drawing_audio.fade_in(100).fade_out(200)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def new_track(generate):
+    manager = AudioManager()
+    generate(manager)
+    return manager.audio_tracks[0]['audio']
+
+
+def main():
+    print("=" * 66)
+    print("Audio synthesis benchmark")
+    print("=" * 66)
+    same_lengths = True
+    for count in CHARACTER_COUNTS:
+        legacy_time, legacy = timed(lambda: legacy_typewriter(count))
+        new_time, new = timed(lambda: new_track(lambda m: m.generate_typewriter_sound(0.0, count)))
+        # pydub's short fades dropped 5 samples (~0.11 ms) from every legacy click
+        same_lengths &= abs(len(legacy) - len(new)) <= 0.2 * count
+        print(f"typewriter {count:>5} chars: legacy {legacy_time * 1000:>9.1f} ms, "
+              f"numpy {new_time * 1000:>7.1f} ms ({legacy_time / new_time:.0f}x), "
+              f"{len(new) / 1000:.1f}s of audio")
+    for seconds in DRAWING_SECONDS:
+        legacy_time, legacy = timed(lambda: legacy_drawing(seconds))
+        new_time, new = timed(lambda: new_track(lambda m: m.generate_drawing_sound(0.0, seconds)))
+        same_lengths &= len(legacy) == len(new)
+        print(f"drawing    {seconds:>5} s:     legacy {legacy_time * 1000:>9.1f} ms, "
+              f"numpy {new_time * 1000:>7.1f} ms ({legacy_time / new_time:.0f}x)")
+    print("-" * 66)
+    if same_lengths:
+        print("✅ Same track durations as the previous implementation (within the click fade rounding)")
+    else:
+        print("❌ Track durations differ from the previous implementation")
+    return 0 if same_lengths else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cubic-bezier easing solvers.
+
+Compares, for common CSS timing curves:
+- the previous scalar solver (Newton from t, x tolerance 1e-3, no fallback)
+- cubic_bezier (scalar Newton-Raphson with bisection fallback)
+- cubic_bezier_array (the same solver, vectorized)
+- CubicBezierEasing lookup tables of several sizes
+
+Accuracy is the maximum |y| error against a 60-step bisection reference;
+times are for evaluating one value per frame of a 5-minute 30 fps track.
+
+Usage:
+    python benchmark_bezier_easing.py
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from timeline_system import CubicBezierEasing, cubic_bezier, cubic_bezier_array
+
+CURVES = [
+    ("ease", (0.25, 0.1, 0.25, 1.0)),
+    ("ease-in", (0.42, 0.0, 1.0, 1.0)),
+    ("ease-out", (0.0, 0.0, 0.58, 1.0)),
+    ("ease-in-out", (0.42, 0.0, 0.58, 1.0)),
+    ("back", (0.68, -0.55, 0.265, 1.55)),
+]
+
+TABLE_SIZES = [64, 256, 1024]
+FRAMES = 5 * 60 * 30
+
+
+def legacy_cubic_bezier(t, cp1x, cp1y, cp2x, cp2y):
+    """The solver timeline_system used before (kept for comparison)."""
+    def bezier_x(t):
+        return 3 * (1 - t) ** 2 * t * cp1x + 3 * (1 - t) * t ** 2 * cp2x + t ** 3
+
+    def bezier_y(t):
+        return 3 * (1 - t) ** 2 * t * cp1y + 3 * (1 - t) * t ** 2 * cp2y + t ** 3
+
+    t_guess = t
+    for _ in range(8):
+        x = bezier_x(t_guess)
+        if abs(x - t) < 0.001:
+            break
+        dx = 3 * (1 - t_guess) ** 2 * cp1x + 6 * (1 - t_guess) * t_guess * (cp2x - cp1x) + 3 * t_guess ** 2 * (1 - cp2x)
+        if abs(dx) < 0.000001:
+            break
+        t_guess -= (x - t) / dx
+
+    return bezier_y(t_guess)
+
+
+def reference_bezier(progress, cp1x, cp1y, cp2x, cp2y):
+    """y(x) by plain bisection on the curve parameter (x increasing)."""
+    curve = CubicBezierEasing(cp1x, cp1y, cp2x, cp2y)
+    lo = np.zeros_like(progress)
+    hi = np.ones_like(progress)
+    for _ in range(60):
+        mid = (lo + hi) * 0.5
+        below = curve._sample_x(mid) < progress
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return curve._sample_y((lo + hi) * 0.5)
+
+
+def timed(fn, repeat=3):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run_curve(label, handles):
+    progress = np.linspace(0.0, 1.0, FRAMES)
+    values = progress.tolist()
+    reference = reference_bezier(progress, *handles)
+
+    rows = []
+    legacy_time, legacy = timed(lambda: np.array([legacy_cubic_bezier(p, *handles) for p in values]))
+    rows.append(("legacy scalar", legacy_time, legacy))
+    scalar_time, scalar = timed(lambda: np.array([cubic_bezier(p, *handles) for p in values]))
+    rows.append(("scalar", scalar_time, scalar))
+    vector_time, vector = timed(lambda: cubic_bezier_array(progress, *handles))
+    rows.append(("vectorized", vector_time, vector))
+    for size in TABLE_SIZES:
+        easing = CubicBezierEasing(*handles, table_size=size)
+        table_time, table = timed(lambda: easing(progress))
+        rows.append((f"table {size}", table_time, table))
+
+    print(f"{label} {handles}")
+    for name, elapsed, result in rows:
+        error = np.abs(result - reference).max()
+        speedup = legacy_time / elapsed if elapsed > 0 else float('inf')
+        print(f"  {name:<14} {elapsed * 1000:>9.2f} ms {speedup:>9.1f}x   max error {error:.2e}")
+    return np.array_equal(scalar, vector)
+
+
+def main():
+    print("=" * 66)
+    print(f"Cubic bezier easing benchmark ({FRAMES} values per curve)")
+    print("=" * 66)
+    identical = True
+    for label, handles in CURVES:
+        identical &= run_curve(label, handles)
+    print("-" * 66)
+    if identical:
+        print("✅ Vectorized solver identical to cubic_bezier for all curves")
+    else:
+        print("❌ Vectorized solver differs from cubic_bezier")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark: mp4v + ffmpeg_convert vs direct H.264 encoding with PyAVFrameSink.
+
+Renders each slide of a multi-slide deck through draw_whiteboard_animations
+twice: once with the OpenCV fallback sink followed by ffmpeg_convert (the
+original two-pass path) and once with PyAVFrameSink (single pass).
+
+Usage:
+    python benchmark_frame_sink.py [image ...] [--aspect-ratio 16:9]
+"""
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+
+import cv2
+
+import whiteboard_animator as wa
+from frame_sink import OpenCVFrameSink, PyAVFrameSink
+
+
+def render_slide(image_bgr, width, height, sink):
+    variables = wa.AllVariables(
+        frame_rate=wa.DEFAULT_FRAME_RATE, resize_wd=width, resize_ht=height,
+        split_len=wa.DEFAULT_SPLIT_LEN, object_skip_rate=wa.DEFAULT_OBJECT_SKIP_RATE,
+        bg_object_skip_rate=wa.DEFAULT_BG_OBJECT_SKIP_RATE,
+        end_gray_img_duration_in_sec=wa.DEFAULT_MAIN_IMG_DURATION
+    )
+    wa.draw_whiteboard_animations(
+        image_bgr, None, wa.hand_path, wa.hand_mask_path, sink.path, variables, frame_sink=sink
+    )
+    return variables.frames_written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('images', nargs='*', default=['demo/1.jpg', 'demo/2.jpg', 'demo/3.jpeg'])
+    parser.add_argument('--aspect-ratio', default='16:9', choices=['1:1', '16:9', '9:16'])
+    args = parser.parse_args()
+
+    out_dir = tempfile.mkdtemp(prefix="bench_sink_")
+    rows = []
+
+    for idx, image_path in enumerate(args.images):
+        image_bgr = cv2.imread(image_path)
+        width, height = wa.calculate_aspect_ratio_dimensions(
+            image_bgr.shape[1], image_bgr.shape[0], args.aspect_ratio
+        )
+        image_bgr = wa.apply_aspect_ratio_padding(image_bgr, width, height)
+
+        # Two-pass: mp4v, then decode + re-encode to H.264
+        raw_path = os.path.join(out_dir, f"slide{idx}_raw.mp4")
+        h264_path = os.path.join(out_dir, f"slide{idx}_h264.mp4")
+        start = time.perf_counter()
+        frames = render_slide(image_bgr, width, height, OpenCVFrameSink(raw_path, wa.DEFAULT_FRAME_RATE, width, height))
+        wa.ffmpeg_convert(raw_path, h264_path, crf=wa.DEFAULT_CRF)
+        two_pass = time.perf_counter() - start
+
+        # Single pass: straight to H.264
+        direct_path = os.path.join(out_dir, f"slide{idx}_direct.mp4")
+        start = time.perf_counter()
+        render_slide(image_bgr, width, height, PyAVFrameSink(direct_path, wa.DEFAULT_FRAME_RATE, width, height, crf=wa.DEFAULT_CRF))
+        single_pass = time.perf_counter() - start
+
+        rows.append((os.path.basename(image_path), f"{width}x{height}", frames, two_pass, single_pass))
+
+    print("\n" + "=" * 64)
+    print("Frame sink benchmark (draw + encode per slide)")
+    print("=" * 64)
+    print(f"{'Slide':<12} {'Size':>10} {'Frames':>7} {'mp4v+convert':>13} {'direct H.264':>13}")
+    print("-" * 64)
+    for name, size, frames, two_pass, single_pass in rows:
+        print(f"{name:<12} {size:>10} {frames:>7} {two_pass:>12.2f}s {single_pass:>12.2f}s")
+    total_two = sum(r[3] for r in rows)
+    total_single = sum(r[4] for r in rows)
+    print("-" * 64)
+    print(f"{'Total':<12} {'':>10} {sum(r[2] for r in rows):>7} {total_two:>12.2f}s {total_single:>12.2f}s")
+    print(f"Outputs kept in {out_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark: particle effect simulation and rendering.
+
+The layered renderer used to call apply_particle_effect for every frame,
+which rebuilds the particle system and replays frame_index + 1 updates
+(O(N²) updates for an N-frame effect). ParticleEffectRunner advances one
+step per frame (O(N)). Both are timed for increasing effect durations.
+
+The engine comparison runs a confetti burst with the object-based
+ParticleEmitter and the array-backed ArrayParticleEmitter.
+
+Usage:
+    python benchmark_particle_effects.py [--effect sparkle]
+"""
+
+import sys
+import time
+import random
+import argparse
+
+import numpy as np
+
+from particle_system import (
+    ArrayParticleEmitter, ParticleEmitter, ParticleEffectRunner,
+    apply_particle_effect, create_particle_system_from_config
+)
+
+
+FRAME_RATE = 30
+DURATIONS = [1.0, 2.0, 4.0, 8.0]
+SIMULATION_DURATIONS = [2.0, 4.0, 8.0, 16.0]
+BURST_COUNTS = [100, 1000, 5000]
+ENGINE_FRAMES = 30
+
+
+def time_engine(emitter_class, burst_count, frame):
+    """Simulate and render a confetti burst; returns seconds per frame."""
+    emitter = emitter_class(
+        position=(frame.shape[1] / 2, frame.shape[0] / 3), emission_rate=0,
+        particle_lifetime=3.0, direction=90, spread=180, speed=(100, 300),
+        colors=[(0, 0, 0), (50, 50, 50), (100, 100, 100)], sizes=(4, 10),
+        shapes=['square', 'circle', 'triangle'], gravity=200, rng=random.Random(0)
+    )
+    emitter.burst_mode = True
+    emitter.emit_burst(burst_count)
+    start = time.perf_counter()
+    for _ in range(ENGINE_FRAMES):
+        emitter.update(1 / FRAME_RATE)
+        emitter.render(frame.copy())
+    return (time.perf_counter() - start) / ENGINE_FRAMES
+
+
+def simulate_replay(frame, config, num_frames):
+    """Updates performed by the per-frame replay, without rendering."""
+    start = time.perf_counter()
+    for frame_idx in range(num_frames):
+        system = create_particle_system_from_config(config, frame.shape)
+        for _ in range(frame_idx + 1):
+            system.update()
+    return time.perf_counter() - start
+
+
+def simulate_runner(frame, config, num_frames):
+    """Updates performed by the runner, without rendering."""
+    start = time.perf_counter()
+    system = create_particle_system_from_config(config, frame.shape)
+    for _ in range(num_frames):
+        system.update()
+    return time.perf_counter() - start
+
+
+def time_replay(frame, config, num_frames):
+    start = time.perf_counter()
+    for frame_idx in range(num_frames):
+        apply_particle_effect(frame, config, frame_idx, num_frames, FRAME_RATE)
+    return time.perf_counter() - start
+
+
+def time_runner(frame, config, num_frames):
+    start = time.perf_counter()
+    runner = ParticleEffectRunner(config, frame.shape, FRAME_RATE)
+    for _ in range(num_frames):
+        runner.render_next(frame)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--effect', default='sparkle',
+                        choices=['confetti', 'sparkle', 'smoke', 'explosion', 'magic'])
+    args = parser.parse_args()
+
+    frame = np.full((360, 640, 3), 255, dtype=np.uint8)
+
+    print("=" * 62)
+    print(f"Particle effect benchmark ({args.effect}, 640x360 @ {FRAME_RATE} fps)")
+    print("=" * 62)
+    print("Simulation only")
+    print(f"{'Duration':>9} {'Frames':>7} {'Replay':>10} {'Runner':>10} {'Runner/frame':>14}")
+    print("-" * 62)
+    for duration in SIMULATION_DURATIONS:
+        config = {"type": args.effect, "position": [320, 180], "duration": duration}
+        num_frames = int(duration * FRAME_RATE)
+        replay = simulate_replay(frame, config, num_frames)
+        runner = simulate_runner(frame, config, num_frames)
+        print(f"{duration:>8.1f}s {num_frames:>7} {replay:>9.3f}s {runner:>9.3f}s "
+              f"{runner / num_frames * 1000:>11.3f} ms")
+
+    print("\nSimulation + rendering")
+    print(f"{'Duration':>9} {'Frames':>7} {'Replay':>10} {'Runner':>10} {'Runner/frame':>14}")
+    print("-" * 62)
+
+    for duration in DURATIONS:
+        config = {"type": args.effect, "position": [320, 180], "duration": duration}
+        num_frames = int(duration * FRAME_RATE)
+        replay = time_replay(frame, config, num_frames)
+        runner = time_runner(frame, config, num_frames)
+        print(f"{duration:>8.1f}s {num_frames:>7} {replay:>9.2f}s {runner:>9.2f}s "
+              f"{runner / num_frames * 1000:>11.2f} ms")
+
+    print("-" * 62)
+    print("Runner simulation cost per frame stays flat (linear total), replay grows")
+    print("quadratically.")
+
+    print("\nEngine comparison (confetti burst, simulate + render, per frame)")
+    print(f"{'Particles':>9} {'Objects':>12} {'Arrays':>12} {'Speedup':>9}")
+    print("-" * 62)
+    for burst_count in BURST_COUNTS:
+        legacy = time_engine(ParticleEmitter, burst_count, frame)
+        array = time_engine(ArrayParticleEmitter, burst_count, frame)
+        print(f"{burst_count:>9} {legacy * 1000:>9.2f} ms {array * 1000:>9.2f} ms {legacy / array:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
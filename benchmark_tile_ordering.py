@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark: original greedy tile selection vs precomputed tile drawing order.
+
+Compares the O(n²) selection loop that draw_masked_object used to run with
+find_dark_tiles + plan_tile_drawing_order across several grid sizes, and
+checks that both produce the same drawing order.
+
+Usage:
+    python benchmark_tile_ordering.py            # default grid sizes
+    python benchmark_tile_ordering.py --full     # also 4K with small split_len (slow legacy run)
+"""
+
+import sys
+import time
+
+from whiteboard_animator import find_dark_tiles, plan_tile_drawing_order
+from test_tile_ordering import legacy_tile_order, make_test_image
+
+
+# (label, height, width, split_len, dark pixel density)
+DEFAULT_CASES = [
+    ("720p / 20", 720, 1280, 20, 0.01),
+    ("1080p / 15", 1080, 1920, 15, 0.01),
+    ("1080p / 10", 1080, 1920, 10, 0.01),
+]
+
+FULL_CASES = DEFAULT_CASES + [
+    ("4K / 10", 2160, 3840, 10, 0.01),
+]
+
+
+def run_case(label, height, width, split_len, density):
+    img = make_test_image(height, width, density, seed=0)
+
+    start = time.perf_counter()
+    legacy = legacy_tile_order(img, split_len)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tiles, grid_shape = find_dark_tiles(img, split_len)
+    planned = plan_tile_drawing_order(tiles, grid_shape)
+    planned_time = time.perf_counter() - start
+
+    identical = [tuple(t) for t in planned] == legacy
+    speedup = legacy_time / planned_time if planned_time > 0 else float('inf')
+    print(f"{label:<14} {len(planned):>8} {legacy_time:>11.3f}s {planned_time:>11.3f}s "
+          f"{speedup:>8.1f}x  {'yes' if identical else 'NO'}")
+    return identical
+
+
+def main():
+    cases = FULL_CASES if '--full' in sys.argv else DEFAULT_CASES
+
+    print("=" * 66)
+    print("Tile ordering benchmark")
+    print("=" * 66)
+    print(f"{'Grid':<14} {'Tiles':>8} {'Legacy':>12} {'Planned':>12} {'Speedup':>9}  Same")
+    print("-" * 66)
+
+    all_identical = True
+    for case in cases:
+        all_identical &= run_case(*case)
+
+    print("-" * 66)
+    if all_identical:
+        print("✅ Planned order identical to the original algorithm in all cases")
+    else:
+        print("❌ Planned order differs from the original algorithm")
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Shared on-disk cache helpers for whiteboard-it.
+
+The glyph cache and the layer raster cache both keep optional entries in a
+directory shared by batch renders and worker processes. Both use the same
+write path and the same environment-variable plumbing:
+
+- atomic_write: write an entry through a temporary file of its own in the
+  cache directory, then move it into place, so concurrent writers never
+  share a partial file and readers only ever see complete entries
+- cache_dir_from_env / set_cache_dir_env: the cache directory of a process,
+  set through an environment variable inherited by worker processes
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+def atomic_write(path: Path, write: Callable[[Any], None], mode: str = 'wb', encoding: Optional[str] = None):
+    """Create or replace path with the contents write(file) produces.
+
+    Creates the parent directory if needed. On error the temporary file is
+    removed and the exception propagates; path is left untouched.
+    """
+    path = Path(path)
+    path.parent.mkdir(exist_ok=True, parents=True)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(mode, encoding=encoding, dir=path.parent, prefix=path.stem + '_',
+                                         suffix='.tmp', delete=False) as f:
+            temp_path = f.name
+            write(f)
+        os.replace(temp_path, path)
+    except BaseException:
+        if temp_path is not None and os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def cache_dir_from_env(name: str) -> Optional[Path]:
+    """Cache directory set in environment variable name (None when unset or empty)."""
+    value = os.environ.get(name)
+    return Path(value) if value else None
+
+
+def set_cache_dir_env(name: str, cache_dir: Optional[str]) -> Optional[Path]:
+    """Set (or clear with None) environment variable name for this process and its workers."""
+    if cache_dir:
+        os.environ[name] = str(cache_dir)
+    else:
+        os.environ.pop(name, None)
+    return cache_dir_from_env(name)
@@ -0,0 +1,251 @@
+"""
+Font registry for whiteboard-it.
+
+Text layers used to find their font by calling ImageFont.truetype on every
+combination of name, style suffix, fallback font and hard-coded system path,
+each failure walking the font directories again. FontRegistry scans the font
+directories once per process and indexes:
+
+- font files by file name and by file name without extension (the names
+  ImageFont.truetype accepts)
+- families and styles (read from the fonts, e.g. "DejaVu Sans" / bold)
+- unicode coverage of a font (read on first use)
+
+Resolved names and loaded FreeTypeFont objects are cached, so every text
+layer of every slide shares them. Text rendering (render_text_to_image, used
+by compose_layers) and SVG path handwriting resolve fonts through the same
+registry.
+"""
+
+import os
+import sys
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+from PIL import ImageFont
+
+
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# System fonts tried after the requested font and its fallbacks
+DEFAULT_FALLBACK_FONTS = [
+    "DejaVuSans",
+    "Arial",
+    "NotoSans",
+    "NotoSansArabic",  # For Arabic
+    "NotoSansHebrew",  # For Hebrew
+    "NotoSansCJK",     # For Chinese/Japanese/Korean
+]
+
+# File name variations tried for styled fonts
+STYLE_SUFFIXES = {
+    'bold': [" Bold", "-Bold", "bd"],
+    'italic': [" Italic", "-Italic", "i"],
+    'bold_italic': [" Bold Italic", "-BoldItalic", "bi"],
+}
+
+
+def default_font_dirs() -> List[str]:
+    """Font directories searched by ImageFont.truetype on this platform."""
+    dirs = []
+    if sys.platform == "win32":
+        windir = os.environ.get("WINDIR")
+        if windir:
+            dirs.append(os.path.join(windir, "fonts"))
+    elif sys.platform.startswith("linux"):
+        data_home = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+        data_dirs = os.environ.get("XDG_DATA_DIRS") or "/usr/local/share:/usr/share"
+        dirs += [os.path.join(d, "fonts") for d in [data_home] + data_dirs.split(":")]
+    elif sys.platform == "darwin":
+        dirs += ["/Library/Fonts", "/System/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+    return dirs
+
+
+def normalize_family(name: str) -> str:
+    """Family key ignoring case, spaces, dashes and underscores."""
+    return ''.join(c for c in name.lower() if c not in ' -_')
+
+
+def normalize_style(style_name: str) -> str:
+    """Map a font's style name to normal/bold/italic/bold_italic (other weights kept as-is)."""
+    style = style_name.lower()
+    bold = 'bold' in style
+    italic = 'italic' in style or 'oblique' in style
+    if bold and italic:
+        return 'bold_italic'
+    if bold:
+        return 'bold'
+    if italic:
+        return 'italic'
+    if style in ('regular', 'normal', 'book', 'roman', ''):
+        return 'normal'
+    return style
+
+
+class FontRegistry:
+    """Index of the installed fonts and cache of loaded FreeTypeFont objects."""
+
+    def __init__(self, font_dirs: Optional[Sequence[str]] = None):
+        self.font_dirs = list(font_dirs) if font_dirs is not None else default_font_dirs()
+        self._files = None        # file name -> path
+        self._stems = None        # file name without extension -> path (.ttf preferred)
+        self._families = None     # normalized family -> {style: path}
+        self._resolved = {}       # (name, style) -> path or None
+        self._coverage = {}       # path -> code points
+        self._fonts = {}          # (path, size) -> FreeTypeFont or None
+        self.scans = 0
+        self.font_loads = 0
+        self.font_hits = 0
+
+    def _scan(self):
+        """Walk the font directories once (same order as ImageFont.truetype)."""
+        if self._files is not None:
+            return
+        self._files = {}
+        self._stems = {}
+        for directory in self.font_dirs:
+            for walkroot, _, walkfilenames in os.walk(directory):
+                for filename in walkfilenames:
+                    stem, ext = os.path.splitext(filename)
+                    if ext.lower() not in FONT_EXTENSIONS:
+                        continue
+                    path = os.path.join(walkroot, filename)
+                    self._files.setdefault(filename, path)
+                    # Like truetype(), a .ttf wins over other extensions
+                    if stem not in self._stems or (ext == '.ttf' and not self._stems[stem].endswith('.ttf')):
+                        self._stems[stem] = path
+        self.scans += 1
+
+    def _index_families(self):
+        """Read family and style names of every font file (on the first family lookup)."""
+        if self._families is not None:
+            return
+        self._scan()
+        self._families = {}
+        for path in sorted(set(self._files.values())):
+            try:
+                family, style_name = ImageFont.truetype(path, 12).getname()
+            except Exception:
+                continue
+            if family:
+                styles = self._families.setdefault(normalize_family(family), {})
+                styles.setdefault(normalize_style(style_name or ''), path)
+
+    def _find_file(self, name: str) -> Optional[str]:
+        """Path ImageFont.truetype would open for name (a path, a file name or a name without extension)."""
+        if os.path.isfile(name):
+            return name
+        self._scan()
+        filename = os.path.basename(name)
+        if os.path.splitext(filename)[1]:
+            return self._files.get(filename)
+        return self._stems.get(filename)
+
+    def families(self) -> Dict[str, Dict[str, str]]:
+        """Indexed families: normalized family name -> {style: font file}."""
+        self._index_families()
+        return self._families
+
+    def find_path(self, name: str, style: str = 'normal') -> Optional[str]:
+        """Font file for name in style, falling back to the regular face; None if not installed.
+
+        Tries the styled file names ("Name-Bold", ...), then the family and
+        style read from the fonts, then the plain name.
+        """
+        key = (name, style)
+        if key not in self._resolved:
+            path = None
+            if style in STYLE_SUFFIXES:
+                for suffix in STYLE_SUFFIXES[style]:
+                    path = self._find_file(f"{name}{suffix}")
+                    if path:
+                        break
+                if path is None:
+                    path = self.families().get(normalize_family(name), {}).get(style)
+            if path is None:
+                path = self._find_file(name)
+            if path is None:
+                for candidate in [f"{name}.ttf", f"Liberation{name}-Regular", f"{name}-Regular"]:
+                    path = self._find_file(candidate)
+                    if path:
+                        break
+            if path is None:
+                path = self.families().get(normalize_family(name), {}).get('normal')
+            self._resolved[key] = path
+        return self._resolved[key]
+
+    def coverage(self, path: str) -> FrozenSet[int]:
+        """Code points mapped by the font's character map (read once per file)."""
+        if path not in self._coverage:
+            code_points = frozenset()
+            try:
+                from fontTools.ttLib import TTFont
+                font = TTFont(path, lazy=True, fontNumber=0)
+                code_points = frozenset(font.getBestCmap() or ())
+                font.close()
+            except Exception:
+                pass
+            self._coverage[path] = code_points
+        return self._coverage[path]
+
+    def covers(self, path: str, text: str) -> bool:
+        """True if the font has a glyph for every visible character of text."""
+        code_points = self.coverage(path)
+        return all(ord(char) in code_points for char in text if not char.isspace())
+
+    def font(self, path: str, size) -> Optional[ImageFont.FreeTypeFont]:
+        """FreeTypeFont for path at size (loaded once, None if unreadable)."""
+        key = (path, size)
+        if key in self._fonts:
+            self.font_hits += 1
+        else:
+            try:
+                self._fonts[key] = ImageFont.truetype(path, size)
+                self.font_loads += 1
+            except Exception:
+                self._fonts[key] = None
+        return self._fonts[key]
+
+    def get_font(self, name: str, size, style: str = 'normal',
+                 fallbacks: Sequence[str] = (), text: Optional[str] = None) -> Optional[ImageFont.FreeTypeFont]:
+        """Font for a text layer: the requested font, its fallbacks, then common system fonts.
+
+        When text is given, the first of the requested font and its fallbacks
+        that covers every character of text is used (fallbacks are meant for
+        scripts the main font lacks). Otherwise the first installed font wins.
+        Returns None when no font is installed (callers use load_default()).
+        """
+        requested = [name] + list(fallbacks)
+        if text:
+            for candidate in requested:
+                path = self.find_path(candidate, style)
+                if path and self.covers(path, text):
+                    font = self.font(path, size)
+                    if font is not None:
+                        return font
+        for candidate in requested + DEFAULT_FALLBACK_FONTS:
+            path = self.find_path(candidate, style)
+            if path:
+                font = self.font(path, size)
+                if font is not None:
+                    return font
+        return None
+
+    def stats(self) -> Dict[str, int]:
+        """Registry counters (directory scans, fonts loaded, font cache hits)."""
+        return {
+            'scans': self.scans,
+            'font_files': len(self._files or {}),
+            'font_loads': self.font_loads,
+            'font_hits': self.font_hits,
+        }
+
+
+_font_registry = None
+
+
+def get_font_registry() -> FontRegistry:
+    """Process-wide FontRegistry."""
+    global _font_registry
+    if _font_registry is None:
+        _font_registry = FontRegistry()
+    return _font_registry
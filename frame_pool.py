@@ -0,0 +1,91 @@
+"""
+Frame buffer pool for whiteboard-it.
+
+The layered renderer builds several full-resolution temporary arrays for
+every frame it writes (white backgrounds, working copies of the canvas,
+content masks). FrameBufferPool hands out reusable arrays keyed by
+(shape, dtype) instead: hot loops acquire() a buffer, use it, and release()
+it once the frame has been written, so steady-state rendering allocates
+almost nothing.
+
+One pool is created per render (AllVariables.buffer_pool); it is not
+thread-safe and is only used from the rendering thread.
+"""
+
+from collections import defaultdict
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class FrameBufferPool:
+    """Reusable numpy buffers keyed by (shape, dtype), with allocation counters."""
+
+    def __init__(self):
+        self._free = defaultdict(list)
+        self._checked_out = {}
+        self.allocations = 0       # new arrays created
+        self.allocated_bytes = 0
+        self.reuses = 0            # acquire() served from the free lists
+
+    def acquire(self, shape, dtype=np.uint8, fill=None) -> np.ndarray:
+        """Check out a buffer of the given shape/dtype (contents undefined unless fill is given)."""
+        key = (tuple(shape), np.dtype(dtype))
+        free = self._free[key]
+        if free:
+            buffer = free.pop()
+            self.reuses += 1
+        else:
+            buffer = np.empty(key[0], dtype=key[1])
+            self.allocations += 1
+            self.allocated_bytes += buffer.nbytes
+        if fill is not None:
+            buffer.fill(fill)
+        self._checked_out[id(buffer)] = buffer
+        return buffer
+
+    def white(self, shape) -> np.ndarray:
+        """Check out a white uint8 frame."""
+        return self.acquire(shape, np.uint8, fill=255)
+
+    def copy(self, array: np.ndarray) -> np.ndarray:
+        """Check out a buffer holding a copy of array."""
+        buffer = self.acquire(array.shape, array.dtype)
+        np.copyto(buffer, array)
+        return buffer
+
+    def release(self, *buffers):
+        """Return buffers to the pool.
+
+        Arrays that were not checked out from this pool (or were already
+        released) are ignored, so callers can release whatever a helper
+        returned without knowing whether it came from the pool.
+        """
+        for buffer in buffers:
+            if buffer is None:
+                continue
+            owned = self._checked_out.pop(id(buffer), None)
+            if owned is buffer:
+                self._free[(buffer.shape, buffer.dtype)].append(buffer)
+
+    @property
+    def checked_out(self) -> int:
+        """Number of buffers currently in use."""
+        return len(self._checked_out)
+
+    def stats(self) -> Dict[str, int]:
+        """Allocation counters, to check that steady-state rendering reuses buffers."""
+        return {
+            'allocations': self.allocations,
+            'allocated_mb': self.allocated_bytes // (1024 * 1024),
+            'reuses': self.reuses,
+            'checked_out': self.checked_out,
+            'pooled': sum(len(free) for free in self._free.values()),
+        }
+
+
+def white_frame_like(frame: np.ndarray, pool: Optional[FrameBufferPool] = None) -> np.ndarray:
+    """White frame with the shape/dtype of frame, from the pool when one is given."""
+    if pool is None:
+        return np.full_like(frame, 255)
+    return pool.acquire(frame.shape, frame.dtype, fill=255)
@@ -0,0 +1,507 @@
+"""
+Frame sink module for whiteboard-it.
+
+A frame sink receives the rendered BGR frames of a slide and writes them to a
+video file. Sinks expose the same write()/release() interface as
+cv2.VideoWriter, so the renderer uses them through AllVariables.video_object.
+
+- PyAVFrameSink: encodes frames straight into an H.264 stream at the requested
+  CRF (single pass, no intermediate mp4v file)
+- OpenCVFrameSink: cv2.VideoWriter fallback (mp4v/MJPG) used when PyAV is not
+  installed; its output still has to go through ffmpeg_convert
+- SegmentedFrameSink: H.264 output assembled from ordered segments, some of
+  which may be encoded by other processes; segments are joined by stream copy
+- ThreadedFrameSink: wraps any of the above and encodes on a writer thread,
+  fed through a bounded pool of preallocated frame buffers
+- ResumeFrameSink: drops the frames before a start frame, so a render can
+  resume mid-slide; renderers that can seek skip those frames with advance()
+
+Every sink also has write_repeated(frame, count) for static runs (final holds,
+camera holds): the frame is prepared once and emitted count times. Use
+write_static_run() to write a run to any VideoWriter-like object.
+"""
+
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from fractions import Fraction
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+
+class OpenCVFrameSink:
+    """Writes frames with cv2.VideoWriter (raw mp4v/MJPG output)."""
+
+    # The raw output must be re-encoded to H.264 by ffmpeg_convert
+    needs_conversion = True
+
+    def __init__(self, path: str, frame_rate: float, width: int, height: int, fourcc: str = "mp4v"):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.frames_written = 0
+        self.writer = cv2.VideoWriter(
+            path, cv2.VideoWriter_fourcc(*fourcc), frame_rate, (width, height)
+        )
+
+    def write(self, frame):
+        """Write one BGR frame."""
+        self.writer.write(frame)
+        self.frames_written += 1
+
+    def write_repeated(self, frame, count: int):
+        """Write the same BGR frame count times."""
+        for _ in range(count):
+            self.writer.write(frame)
+        self.frames_written += count
+
+    def release(self):
+        """Finalize the video file."""
+        self.writer.release()
+
+
+class PyAVFrameSink:
+    """Encodes BGR frames directly to H.264 with PyAV."""
+
+    # Output is already the final H.264 file
+    needs_conversion = False
+
+    def __init__(
+        self,
+        path: str,
+        frame_rate: float,
+        width: int,
+        height: int,
+        crf: int = 18,
+        codec: str = "h264",
+        pix_fmt: str = "yuv420p"
+    ):
+        if not PYAV_AVAILABLE:
+            raise ImportError("PyAV (av) is required for PyAVFrameSink")
+
+        self.path = path
+        self.width = width
+        self.height = height
+        self.frames_written = 0
+        self._closed = False
+
+        rate = Fraction(frame_rate).limit_denominator(1001)
+        self.container = av.open(path, mode="w")
+        self.stream = self.container.add_stream(codec, rate=rate)
+        self.stream.width = width
+        self.stream.height = height
+        self.stream.pix_fmt = pix_fmt
+        self.stream.options = {"crf": str(crf)}
+        self.stream.codec_context.time_base = 1 / rate
+
+    def write(self, frame):
+        """Encode one BGR frame."""
+        av_frame = av.VideoFrame.from_ndarray(frame, format="bgr24")
+        av_frame.pts = self.frames_written
+        for packet in self.stream.encode(av_frame):
+            self.container.mux(packet)
+        self.frames_written += 1
+
+    def write_repeated(self, frame, count: int):
+        """Encode the same BGR frame count times.
+
+        The frame is converted to the stream pixel format once; each repeat
+        only re-submits it with the next timestamp (the encoder turns them
+        into near-empty skip frames). The stream stays constant frame rate.
+        """
+        if count <= 0:
+            return
+        av_frame = av.VideoFrame.from_ndarray(frame, format="bgr24").reformat(format=self.stream.pix_fmt)
+        for _ in range(count):
+            av_frame.pts = self.frames_written
+            for packet in self.stream.encode(av_frame):
+                self.container.mux(packet)
+            self.frames_written += 1
+
+    def release(self):
+        """Flush the encoder and close the container."""
+        if self._closed:
+            return
+        self._closed = True
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+def remux_segments(segment_paths: List[str], output_path: str, frame_rate: float):
+    """Join H.264 segments by packet copy, without re-encoding.
+
+    The segments must share codec, resolution, frame rate and encoder settings
+    (e.g. all written by PyAVFrameSink with the same parameters). Packet
+    timestamps are shifted so each segment starts where the previous one ends.
+    """
+    fps = Fraction(frame_rate).limit_denominator(1001)
+    with av.open(segment_paths[0], mode="r") as template_container:
+        output_container = av.open(output_path, mode="w")
+        out_stream = output_container.add_stream_from_template(template_container.streams.video[0])
+
+    offset = Fraction(0)  # Start of the current segment, in seconds
+    try:
+        for segment_path in segment_paths:
+            with av.open(segment_path, mode="r") as input_container:
+                in_stream = input_container.streams.video[0]
+                time_base = in_stream.time_base
+                offset_ticks = round(offset / time_base)
+                frame_ticks = round(Fraction(1) / (fps * time_base))
+                segment_end = 0
+
+                for packet in input_container.demux(in_stream):
+                    # Skip the empty end-of-stream packet
+                    if packet.dts is None:
+                        continue
+                    segment_end = max(segment_end, packet.pts + frame_ticks)
+                    packet.pts += offset_ticks
+                    packet.dts += offset_ticks
+                    packet.stream = out_stream
+                    output_container.mux(packet)
+
+                offset += segment_end * time_base
+    finally:
+        output_container.close()
+
+
+class SegmentedFrameSink:
+    """H.264 sink assembled from ordered segments.
+
+    Frames passed to write() are encoded into the current segment. Segments
+    encoded elsewhere (e.g. by worker processes, see segment_path()) are
+    inserted in order with add_segment(). release() joins every segment into
+    the final file by stream copy and removes the temporary files.
+    """
+
+    # Output is already the final H.264 file
+    needs_conversion = False
+
+    def __init__(self, path: str, frame_rate: float, width: int, height: int, crf: int = 18):
+        if not PYAV_AVAILABLE:
+            raise ImportError("PyAV (av) is required for SegmentedFrameSink")
+
+        self.path = path
+        self.frame_rate = frame_rate
+        self.width = width
+        self.height = height
+        self.crf = crf
+        self.frames_written = 0
+        self.segments = []
+        self._current = None
+        self._closed = False
+        self.temp_dir = tempfile.mkdtemp(prefix="segments_", dir=os.path.dirname(os.path.abspath(path)))
+
+    def segment_path(self, name: str) -> str:
+        """Path for a segment encoded outside this sink (with make_segment_sink)."""
+        return os.path.join(self.temp_dir, f"{name}.mp4")
+
+    def make_segment_sink(self, path: str) -> PyAVFrameSink:
+        """Sink whose output can be passed to add_segment (same encoder settings)."""
+        return PyAVFrameSink(path, self.frame_rate, self.width, self.height, crf=self.crf)
+
+    def _close_current(self):
+        if self._current is not None:
+            self._current.release()
+            self._current = None
+
+    def _current_sink(self) -> PyAVFrameSink:
+        if self._current is None:
+            path = self.segment_path(f"local_{len(self.segments)}")
+            self._current = self.make_segment_sink(path)
+            self.segments.append(path)
+        return self._current
+
+    def write(self, frame):
+        """Encode one BGR frame into the current segment."""
+        self._current_sink().write(frame)
+        self.frames_written += 1
+
+    def write_repeated(self, frame, count: int):
+        """Encode the same BGR frame count times into the current segment."""
+        if count <= 0:
+            return
+        self._current_sink().write_repeated(frame, count)
+        self.frames_written += count
+
+    def add_segment(self, path: str, frame_count: int):
+        """Append an encoded segment after the frames written so far."""
+        self._close_current()
+        if frame_count > 0:
+            self.segments.append(path)
+            self.frames_written += frame_count
+
+    def release(self):
+        """Join the segments into the final file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._close_current()
+        try:
+            if self.segments:
+                remux_segments(self.segments, self.path, self.frame_rate)
+            else:
+                PyAVFrameSink(self.path, self.frame_rate, self.width, self.height, crf=self.crf).release()
+        finally:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class ThreadedFrameSink:
+    """Runs another sink's write() on a background writer thread.
+
+    write() copies the frame into one of queue_size preallocated buffers and
+    returns; the writer thread encodes the buffers in order and hands them
+    back. When all buffers are waiting to be encoded, write() blocks until one
+    is free (backpressure), so memory stays bounded. Errors raised by the
+    wrapped sink are re-raised by the next write(), flush() or release().
+
+    Other attributes (path, needs_conversion, segment_path...) are read from
+    the wrapped sink.
+    """
+
+    def __init__(self, sink, queue_size: int = 8):
+        self.sink = sink
+        self.queue_size = max(1, queue_size)
+        self.frames_written = 0
+        self._free = queue.Queue()
+        self._pending = queue.Queue()
+        self._buffers_allocated = 0
+        self._error = None
+        self._closed = False
+
+        # Metrics
+        self.blocked_time = 0.0   # write() waiting for a free buffer
+        self.encode_time = 0.0    # writer thread inside sink.write()
+        self.max_depth = 0        # most frames waiting to be encoded
+        self._depth_total = 0
+        self._frames_queued = 0
+
+        if hasattr(sink, 'add_segment'):
+            self.add_segment = self._add_segment
+
+        self._thread = threading.Thread(target=self._run, name="frame-writer", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name):
+        if name == 'sink':
+            raise AttributeError(name)
+        return getattr(self.sink, name)
+
+    def _run(self):
+        while True:
+            item = self._pending.get()
+            if item is None:
+                self._pending.task_done()
+                return
+            buffer, count = item
+            if self._error is None:
+                start = time.perf_counter()
+                try:
+                    if count == 1:
+                        self.sink.write(buffer)
+                    else:
+                        write_static_run(self.sink, buffer, count)
+                except BaseException as e:
+                    self._error = e
+                self.encode_time += time.perf_counter() - start
+            self._free.put(buffer)
+            self._pending.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _acquire_buffer(self, frame):
+        try:
+            buffer = self._free.get_nowait()
+        except queue.Empty:
+            if self._buffers_allocated < self.queue_size:
+                self._buffers_allocated += 1
+                return np.empty_like(frame)
+            start = time.perf_counter()
+            buffer = self._free.get()
+            self.blocked_time += time.perf_counter() - start
+        if buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty_like(frame)
+        return buffer
+
+    def _queue(self, frame, count: int):
+        self._raise_error()
+        buffer = self._acquire_buffer(frame)
+        np.copyto(buffer, frame)
+        self._pending.put((buffer, count))
+        depth = self._pending.qsize()
+        self.max_depth = max(self.max_depth, depth)
+        self._depth_total += depth
+        self._frames_queued += 1
+        self.frames_written += count
+
+    def write(self, frame):
+        """Queue one BGR frame for encoding (the frame can be reused right away)."""
+        self._queue(frame, 1)
+
+    def write_repeated(self, frame, count: int):
+        """Queue a static run: the frame is copied once and encoded count times."""
+        if count > 0:
+            self._queue(frame, count)
+
+    def flush(self):
+        """Wait until every queued frame has been written to the wrapped sink."""
+        self._pending.join()
+        self._raise_error()
+
+    def _add_segment(self, path: str, frame_count: int):
+        self.flush()
+        self.sink.add_segment(path, frame_count)
+        self.frames_written += frame_count
+
+    def release(self):
+        """Encode the remaining frames, stop the thread and release the wrapped sink."""
+        if self._closed:
+            return
+        self._closed = True
+        self._pending.put(None)
+        self._thread.join()
+        try:
+            self._raise_error()
+        finally:
+            self.sink.release()
+
+    def stats(self) -> Dict[str, float]:
+        """Queue metrics: use them to tune queue_size."""
+        return {
+            'frames': self.frames_written,
+            'queue_size': self.queue_size,
+            'max_depth': self.max_depth,
+            'mean_depth': self._depth_total / self._frames_queued if self._frames_queued else 0.0,
+            'blocked_time': self.blocked_time,
+            'encode_time': self.encode_time,
+        }
+
+
+class ResumeFrameSink:
+    """Forwards the frames from start_frame on to another sink, dropping earlier ones.
+
+    position counts every frame passed to the sink, written or not. Renderers
+    that can compute any frame directly call advance() for the frames still
+    to drop (pending) instead of composing them.
+    """
+
+    def __init__(self, sink, start_frame: int):
+        self.sink = sink
+        self.start_frame = max(0, int(start_frame))
+        self.position = 0
+
+    def __getattr__(self, name):
+        if name == 'sink':
+            raise AttributeError(name)
+        return getattr(self.sink, name)
+
+    @property
+    def pending(self) -> int:
+        """Frames still to drop before start_frame."""
+        return max(0, self.start_frame - self.position)
+
+    def advance(self, count: int):
+        """Count frames as passed without receiving them (count <= pending)."""
+        self.position += count
+
+    def write(self, frame):
+        if self.position >= self.start_frame:
+            self.sink.write(frame)
+        self.position += 1
+
+    def write_repeated(self, frame, count: int):
+        dropped = min(count, self.pending)
+        self.position += count
+        write_static_run(self.sink, frame, count - dropped)
+
+    def release(self):
+        self.sink.release()
+
+
+def write_static_run(sink, frame, count: int):
+    """Write frame count times to sink, as one static run when the sink supports it.
+
+    Falls back to count write() calls for plain VideoWriter-like objects.
+    """
+    if count <= 0:
+        return
+    write_repeated = getattr(sink, 'write_repeated', None)
+    if write_repeated is not None:
+        write_repeated(frame, count)
+    else:
+        for _ in range(count):
+            sink.write(frame)
+
+
+def static_runs(frames: Iterable) -> Iterator[Tuple[object, int]]:
+    """Group consecutive occurrences of the same frame object into (frame, count) runs.
+
+    Frame generators mark static runs by yielding the same array object again
+    (identity, not pixel equality, so the check costs nothing).
+    """
+    run_frame = None
+    run_length = 0
+    for frame in frames:
+        if frame is run_frame:
+            run_length += 1
+            continue
+        if run_length:
+            yield run_frame, run_length
+        run_frame = frame
+        run_length = 1
+    if run_length:
+        yield run_frame, run_length
+
+
+def create_frame_sink(
+    path: str,
+    frame_rate: float,
+    width: int,
+    height: int,
+    crf: int = 18,
+    raw_path: Optional[str] = None,
+    platform: str = "linux",
+    segmented: bool = False
+):
+    """Create the best available frame sink for a slide.
+
+    Args:
+        path: Output path for the final H.264 video
+        frame_rate: Video frame rate
+        width: Frame width
+        height: Frame height
+        crf: Constant Rate Factor (0-51, lower = better quality)
+        raw_path: Output path for the raw video when falling back to OpenCV
+                  (defaults to path); convert it with ffmpeg_convert afterwards
+        platform: Target platform ('android' uses MJPG for the OpenCV fallback)
+        segmented: Return a SegmentedFrameSink, so that parts of the video can
+                   be encoded in other processes
+
+    Returns:
+        PyAVFrameSink (or SegmentedFrameSink) when PyAV is installed, otherwise
+        OpenCVFrameSink. Check sink.needs_conversion to know whether
+        ffmpeg_convert is required.
+    """
+    if PYAV_AVAILABLE:
+        try:
+            if segmented:
+                return SegmentedFrameSink(path, frame_rate, width, height, crf=crf)
+            return PyAVFrameSink(path, frame_rate, width, height, crf=crf)
+        except Exception as e:
+            print(f"⚠️ Direct H.264 encoding unavailable ({e}), falling back to OpenCV")
+
+    fourcc = "MJPG" if platform == "android" else "mp4v"
+    return OpenCVFrameSink(raw_path or path, frame_rate, width, height, fourcc=fourcc)
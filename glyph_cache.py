@@ -0,0 +1,197 @@
+"""
+Glyph cache for whiteboard-it.
+
+SVG path handwriting needs the outline of every character of a text layer.
+Parsing a TTF with fontTools and replaying each glyph through a RecordingPen
+costs more than laying the text out, and the same fonts come back in every
+text layer of every slide. GlyphCache keeps, for the whole process:
+
+- resolved font path -> parsed TTFont
+- (font, character) -> glyph contours at unit scale (font units), so the
+  layout only applies scale and offset
+
+Contours can also be stored on disk, one file per font keyed by a hash of the
+font file, so later renders (batch jobs, worker processes) never parse the
+TTF again. Entries are JSON (no code runs when a shared directory is read).
+Enable it with --glyph-cache-dir or the WHITEBOARD_GLYPH_CACHE_DIR
+environment variable (inherited by worker processes).
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from fontTools.ttLib import TTFont
+from fontTools.pens.recordingPen import RecordingPen
+
+from disk_cache import atomic_write, cache_dir_from_env, set_cache_dir_env
+
+
+GLYPH_CACHE_DIR_ENV = "WHITEBOARD_GLYPH_CACHE_DIR"
+
+# Characters laid out as spaces (no outline)
+SPACE_CHARS = ('\n', ' ', '\t')
+
+Contour = Tuple[Tuple[float, float], ...]
+
+
+def flatten_glyph_commands(commands) -> List[Contour]:
+    """Split RecordingPen commands into point sequences (font units).
+
+    Follows the segmentation used for drawing: moveTo starts a segment,
+    lineTo and the explicit points of qCurveTo extend it, closePath ends it
+    when it has more than one point.
+    """
+    contours = []
+    current = []
+    for command_type, coords in commands:
+        if command_type == 'moveTo':
+            if current:
+                contours.append(tuple(current))
+                current = []
+            current.append(tuple(coords[0]))
+        elif command_type == 'lineTo':
+            current.append(tuple(coords[0]))
+        elif command_type == 'qCurveTo':
+            for point in coords:
+                if isinstance(point, tuple) and len(point) == 2:
+                    current.append(point)
+        elif command_type == 'closePath':
+            if current and len(current) > 1:
+                contours.append(tuple(current))
+                current = []
+    if current:
+        contours.append(tuple(current))
+    return contours
+
+
+class GlyphCache:
+    """Process-wide cache of parsed fonts and glyph contours."""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._fonts = {}          # font path -> TTFont (None if unusable)
+        self._contours = {}       # font path -> {char: contours or None}
+        self._font_hashes = {}    # font path -> hash of the file
+        self.hits = 0
+        self.misses = 0
+        self.fonts_parsed = 0
+        self.disk_loads = 0
+
+    @staticmethod
+    def _key(font_path: str) -> str:
+        return os.path.realpath(font_path)
+
+    def font_hash(self, font_path: str) -> str:
+        """Hash of the font file contents (identifies the on-disk cache entry)."""
+        key = self._key(font_path)
+        if key not in self._font_hashes:
+            with open(key, 'rb') as f:
+                self._font_hashes[key] = hashlib.sha1(f.read()).hexdigest()
+        return self._font_hashes[key]
+
+    def _disk_path(self, font_path: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"glyphs_{self.font_hash(font_path)}.json"
+
+    def font(self, font_path: str) -> Optional[TTFont]:
+        """Parsed TTFont for font_path (parsed once per process)."""
+        key = self._key(font_path)
+        if key not in self._fonts:
+            try:
+                self._fonts[key] = TTFont(key)
+                self.fonts_parsed += 1
+            except Exception as e:
+                print(f"  ⚠️ Could not load font {font_path}: {e}")
+                self._fonts[key] = None
+        return self._fonts[key]
+
+    def _font_contours(self, font_path: str) -> Dict[str, Optional[List[Contour]]]:
+        key = self._key(font_path)
+        if key not in self._contours:
+            contours = {}
+            disk_path = self._disk_path(font_path)
+            if disk_path is not None and disk_path.exists():
+                try:
+                    with open(disk_path, 'r', encoding='utf-8') as f:
+                        contours = {
+                            char: None if entry is None else [tuple(tuple(point) for point in contour)
+                                                              for contour in entry]
+                            for char, entry in json.load(f).items()
+                        }
+                    self.disk_loads += 1
+                except Exception as e:
+                    print(f"  ⚠️ Ignoring unreadable glyph cache {disk_path}: {e}")
+                    contours = {}
+            self._contours[key] = contours
+        return self._contours[key]
+
+    def _save(self, font_path: str):
+        disk_path = self._disk_path(font_path)
+        if disk_path is None:
+            return
+        try:
+            atomic_write(disk_path, lambda f: json.dump(self._font_contours(font_path), f),
+                         mode='w', encoding='utf-8')
+        except Exception as e:
+            print(f"  ⚠️ Failed to save glyph cache: {e}")
+
+    def text_contours(self, font_path: str, text: str) -> Optional[Dict[str, Optional[List[Contour]]]]:
+        """Contours (font units) of every distinct non-space character of text.
+
+        Characters missing from the font map to None. Returns None when the
+        font has no TrueType outlines (glyf table) or character map.
+        """
+        contours = self._font_contours(font_path)
+        missing = [char for char in dict.fromkeys(text) if char not in SPACE_CHARS and char not in contours]
+        self.hits += sum(1 for char in text if char not in SPACE_CHARS) - len(missing)
+        if not missing:
+            return contours
+
+        font = self.font(font_path)
+        if font is None:
+            return None
+        glyf_table = font['glyf'] if 'glyf' in font else None
+        cmap = font.getBestCmap()
+        if not glyf_table or not cmap:
+            return None
+
+        for char in missing:
+            self.misses += 1
+            glyph_name = cmap.get(ord(char))
+            if glyph_name is None:
+                contours[char] = None
+                continue
+            pen = RecordingPen()
+            glyf_table[glyph_name].draw(pen, glyf_table)
+            contours[char] = flatten_glyph_commands(pen.value)
+        self._save(font_path)
+        return contours
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters (glyph hits/misses, fonts parsed, disk entries loaded)."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'fonts_parsed': self.fonts_parsed,
+            'disk_loads': self.disk_loads,
+        }
+
+
+_glyph_cache = None
+
+
+def get_glyph_cache() -> GlyphCache:
+    """Process-wide GlyphCache (on-disk directory from WHITEBOARD_GLYPH_CACHE_DIR)."""
+    global _glyph_cache
+    if _glyph_cache is None:
+        _glyph_cache = GlyphCache(cache_dir_from_env(GLYPH_CACHE_DIR_ENV))
+    return _glyph_cache
+
+
+def set_glyph_cache_dir(cache_dir: Optional[str]):
+    """Enable (or disable with None) the on-disk glyph cache for this process and its workers."""
+    get_glyph_cache().cache_dir = set_cache_dir_env(GLYPH_CACHE_DIR_ENV, cache_dir)
@@ -0,0 +1,149 @@
+"""
+Layer raster cache for whiteboard-it.
+
+Text and shape layers are rendered from their configuration alone, yet the
+same layer is rendered by compose_layers and again by the layered drawing
+animation, and template-driven decks repeat the same layers across many
+videos. LayerRasterCache keeps rendered layers keyed by a hash of:
+
+- the layer kind ("text" or "shape")
+- the canonical JSON of its text_config / shape_config
+- the target size
+- anything else the raster depends on (e.g. the resolved font files)
+
+Entries live in an in-memory LRU bounded in megabytes and, optionally, as
+.npy files in a directory (--layer-cache-dir or the WHITEBOARD_LAYER_CACHE_DIR
+environment variable, inherited by worker processes) so later renders reuse
+them. Callers always get their own copy of the raster.
+"""
+
+import json
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from disk_cache import atomic_write, cache_dir_from_env, set_cache_dir_env
+
+
+LAYER_CACHE_DIR_ENV = "WHITEBOARD_LAYER_CACHE_DIR"
+DEFAULT_LAYER_CACHE_MB = 256
+
+# Bump when the text/shape renderers change their output
+LAYER_CACHE_VERSION = 1
+
+
+def layer_cache_key(kind: str, config: Dict[str, Any], width: int, height: int, extra: Any = None) -> str:
+    """Content hash of a layer: kind, canonical JSON of its config, size and extra inputs."""
+    payload = json.dumps(
+        {'version': LAYER_CACHE_VERSION, 'kind': kind, 'config': config,
+         'size': [width, height], 'extra': extra},
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    )
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class LayerRasterCache:
+    """In-memory LRU (plus optional .npy directory) of rendered layer images."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_memory_mb: float = DEFAULT_LAYER_CACHE_MB):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_bytes = int(max_memory_mb * 1024 * 1024)
+        self._entries = OrderedDict()  # key -> read-only image
+        self._bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"layer_{key}.npy"
+
+    def _remember(self, key: str, image: np.ndarray):
+        image = np.ascontiguousarray(image)
+        image.flags.writeable = False
+        if image.nbytes > self.max_bytes:
+            return
+        self._entries[key] = image
+        self._bytes += image.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    def _load(self, key: str) -> Optional[np.ndarray]:
+        disk_path = self._disk_path(key)
+        if disk_path is None or not disk_path.exists():
+            return None
+        try:
+            return np.load(disk_path, allow_pickle=False)
+        except Exception as e:
+            print(f"  ⚠️ Ignoring unreadable layer cache entry {disk_path}: {e}")
+            return None
+
+    def _save(self, key: str, image: np.ndarray):
+        disk_path = self._disk_path(key)
+        if disk_path is None:
+            return
+        try:
+            atomic_write(disk_path, lambda f: np.save(f, image, allow_pickle=False))
+        except Exception as e:
+            print(f"  ⚠️ Failed to save layer cache entry: {e}")
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Copy of the cached raster for key (memory, then disk), or None."""
+        image = self._entries.get(key)
+        if image is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image.copy()
+        image = self._load(key)
+        if image is not None:
+            self.disk_hits += 1
+            self._remember(key, image)
+            return image.copy()
+        return None
+
+    def put(self, key: str, image: np.ndarray):
+        """Store a rendered raster (in memory and in the cache directory if set)."""
+        self._save(key, image)
+        self._remember(key, image.copy())
+
+    def render(self, kind: str, config: Dict[str, Any], width: int, height: int,
+               render_fn: Callable[[Dict[str, Any], int, int], np.ndarray], extra: Any = None) -> np.ndarray:
+        """Raster of a layer, rendered with render_fn(config, width, height) on a miss."""
+        key = layer_cache_key(kind, config, width, height, extra)
+        image = self.get(key)
+        if image is None:
+            self.misses += 1
+            image = render_fn(config, width, height)
+            self.put(key, image)
+        return image
+
+    def stats(self) -> Dict[str, float]:
+        """Cache counters (memory hits, disk hits, misses, entries, memory used)."""
+        return {
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'memory_mb': round(self._bytes / (1024 * 1024), 1),
+        }
+
+
+_layer_cache = None
+
+
+def get_layer_cache() -> LayerRasterCache:
+    """Process-wide LayerRasterCache (cache directory from WHITEBOARD_LAYER_CACHE_DIR)."""
+    global _layer_cache
+    if _layer_cache is None:
+        _layer_cache = LayerRasterCache(cache_dir_from_env(LAYER_CACHE_DIR_ENV))
+    return _layer_cache
+
+
+def set_layer_cache_dir(cache_dir: Optional[str]):
+    """Enable (or disable with None) the on-disk layer cache for this process and its workers."""
+    get_layer_cache().cache_dir = set_cache_dir_env(LAYER_CACHE_DIR_ENV, cache_dir)
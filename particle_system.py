@@ -9,6 +9,9 @@ This module provides comprehensive particle effects for whiteboard animations:
 - Magic sparkles attached to objects/text
 - Custom configurable particle systems
 
+Presets use ArrayParticleEmitter, which stores particles as NumPy columns
+and draws them in batches; ParticleEmitter keeps one Particle object each.
+
 Dependencies:
 - numpy: For numerical operations
 - cv2 (OpenCV): For rendering
@@ -31,7 +34,8 @@ class Particle:
         color: Tuple[int, int, int],
         size: float,
         lifetime: float,
-        shape: str = 'circle'
+        shape: str = 'circle',
+        angular_velocity: Optional[float] = None
     ):
         """
         Initialize a particle.
@@ -43,6 +47,7 @@ class Particle:
             size: Particle size in pixels
             lifetime: Lifetime in seconds
             shape: 'circle', 'square', 'star', 'triangle'
+            angular_velocity: Rotation speed in degrees per second (random if None)
         """
         self.x, self.y = position
         self.vx, self.vy = velocity
@@ -52,7 +57,9 @@ class Particle:
         self.age = 0.0
         self.shape = shape
         self.rotation = 0.0
-        self.angular_velocity = random.uniform(-10, 10)  # degrees per frame
+        if angular_velocity is None:
+            angular_velocity = random.uniform(-10, 10)
+        self.angular_velocity = angular_velocity  # degrees per second
         self.gravity = 0.0
         self.fade = True
         
@@ -100,7 +107,8 @@ class ParticleEmitter:
         colors: List[Tuple[int, int, int]] = None,
         sizes: Tuple[float, float] = (3.0, 8.0),
         shapes: List[str] = None,
-        gravity: float = 0.0
+        gravity: float = 0.0,
+        rng: Optional[random.Random] = None
     ):
         """
         Initialize particle emitter.
@@ -116,6 +124,7 @@ class ParticleEmitter:
             sizes: (min_size, max_size) range
             shapes: List of particle shapes
             gravity: Gravity force (pixels per second squared)
+            rng: Random generator for new particles (unseeded generator if None)
         """
         self.x, self.y = position
         self.emission_rate = emission_rate
@@ -131,6 +140,7 @@ class ParticleEmitter:
         self.time_since_emission = 0.0
         self.enabled = True
         self.burst_mode = False
+        self.rng = rng or random.Random()
         
     def set_position(self, position: Tuple[float, float]):
         """Update emitter position."""
@@ -144,23 +154,23 @@ class ParticleEmitter:
     def _create_particle(self):
         """Create a single particle."""
         # Random angle within spread
-        angle = self.direction + random.uniform(-self.spread / 2, self.spread / 2)
+        angle = self.direction + self.rng.uniform(-self.spread / 2, self.spread / 2)
         
         # Random speed
-        speed = random.uniform(self.speed_min, self.speed_max)
+        speed = self.rng.uniform(self.speed_min, self.speed_max)
         
         # Calculate velocity
         vx = math.cos(angle) * speed
         vy = -math.sin(angle) * speed  # Negative because y increases downward
         
         # Random color from palette
-        color = random.choice(self.colors)
+        color = self.rng.choice(self.colors)
         
         # Random size
-        size = random.uniform(self.size_min, self.size_max)
+        size = self.rng.uniform(self.size_min, self.size_max)
         
         # Random shape
-        shape = random.choice(self.shapes)
+        shape = self.rng.choice(self.shapes)
         
         # Create particle
         particle = Particle(
@@ -169,7 +179,8 @@ class ParticleEmitter:
             color=color,
             size=size,
             lifetime=self.particle_lifetime,
-            shape=shape
+            shape=shape,
+            angular_velocity=self.rng.uniform(-10, 10)
         )
         particle.gravity = self.gravity
         
@@ -355,22 +366,315 @@ class ParticleEmitter:
         return np.array(points, dtype=np.int32)
 
 
+# Shape codes used by ArrayParticleEmitter
+SHAPE_CODES = {'circle': 0, 'square': 1, 'star': 2, 'triangle': 3}
+SHAPE_NAMES = {code: name for name, code in SHAPE_CODES.items()}
+
+
+def _unit_shape_outlines() -> Dict[int, np.ndarray]:
+    """Outline of each shape for size 1 and rotation 0, as (k, 2) float arrays."""
+    # Circles are drawn as 16-sided polygons so they can be batched with polylines
+    theta = np.arange(16) * (2 * np.pi / 16)
+    circle = np.stack([np.cos(theta), np.sin(theta)], axis=1)
+    square = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float64)
+    theta = np.arange(10) * (np.pi / 5)
+    radius = np.where(np.arange(10) % 2 == 0, 1.0, 0.4)
+    star = np.stack([radius * np.cos(theta), radius * np.sin(theta)], axis=1)
+    triangle = np.array([(0, -1), (-0.866, 0.5), (0.866, 0.5)], dtype=np.float64)
+    return {
+        SHAPE_CODES['circle']: circle,
+        SHAPE_CODES['square']: square,
+        SHAPE_CODES['star']: star,
+        SHAPE_CODES['triangle']: triangle,
+    }
+
+
+class ArrayParticleEmitter:
+    """
+    Particle emitter storing its particles as NumPy columns (structure of arrays).
+    
+    Drop-in replacement for ParticleEmitter: same constructor, update() and
+    render(). All particles are updated with vectorized math, dead particles
+    are compacted with a boolean mask, and rendering draws every particle of
+    a shape (per thickness and alpha level) with a single cv2.polylines call
+    into an alpha mask that is blended once over the particles' bounding box.
+    """
+    
+    # Alpha is quantized to this many levels so fading particles batch together
+    ALPHA_LEVELS = 32
+    
+    _UNIT_OUTLINES = _unit_shape_outlines()
+    
+    def __init__(
+        self,
+        position: Tuple[float, float],
+        emission_rate: float = 10.0,
+        particle_lifetime: float = 2.0,
+        direction: float = 90.0,
+        spread: float = 45.0,
+        speed: Tuple[float, float] = (50.0, 100.0),
+        colors: List[Tuple[int, int, int]] = None,
+        sizes: Tuple[float, float] = (3.0, 8.0),
+        shapes: List[str] = None,
+        gravity: float = 0.0,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialize particle emitter.
+        
+        Args:
+            position: (x, y) emitter position
+            emission_rate: Particles per second
+            particle_lifetime: How long each particle lives (seconds)
+            direction: Main emission direction in degrees (0=right, 90=up)
+            spread: Spread angle in degrees
+            speed: (min_speed, max_speed) range in pixels per second
+            colors: List of possible particle colors (BGR)
+            sizes: (min_size, max_size) range
+            shapes: List of particle shapes
+            gravity: Gravity force (pixels per second squared)
+            rng: Random generator seeding the emitter (unseeded generator if None)
+        """
+        self.x, self.y = position
+        self.emission_rate = emission_rate
+        self.particle_lifetime = particle_lifetime
+        self.direction = math.radians(direction)
+        self.spread = math.radians(spread)
+        self.speed_min, self.speed_max = speed
+        self.colors = colors or [(255, 255, 255)]
+        self.size_min, self.size_max = sizes
+        self.shapes = shapes or ['circle']
+        self.gravity = gravity
+        self.time_since_emission = 0.0
+        self.enabled = True
+        self.burst_mode = False
+        self.rng = rng or random.Random()
+        self.np_rng = np.random.default_rng(self.rng.getrandbits(63))
+        
+        self._palette = np.array(self.colors, dtype=np.uint8).reshape(-1, 3)
+        self._shape_palette = np.array([SHAPE_CODES.get(s, -1) for s in self.shapes], dtype=np.int8)
+        
+        # Particle columns
+        self.pos = np.empty((0, 2), dtype=np.float64)
+        self.vel = np.empty((0, 2), dtype=np.float64)
+        self.age = np.empty(0, dtype=np.float64)
+        self.lifetime = np.empty(0, dtype=np.float64)
+        self.color = np.empty((0, 3), dtype=np.uint8)
+        self.size = np.empty(0, dtype=np.float64)
+        self.rotation = np.empty(0, dtype=np.float64)
+        self.angular_velocity = np.empty(0, dtype=np.float64)
+        self.shape = np.empty(0, dtype=np.int8)
+        
+        self._alpha_mask = None
+    
+    @property
+    def particle_count(self) -> int:
+        """Number of live particles."""
+        return len(self.age)
+    
+    @property
+    def particles(self) -> List[Particle]:
+        """Snapshot of the live particles as Particle objects (for inspection)."""
+        snapshot = []
+        for i in range(self.particle_count):
+            particle = Particle(
+                position=tuple(self.pos[i]),
+                velocity=tuple(self.vel[i]),
+                color=tuple(int(c) for c in self.color[i]),
+                size=float(self.size[i]),
+                lifetime=float(self.lifetime[i]),
+                shape=SHAPE_NAMES.get(int(self.shape[i]), 'unknown'),
+                angular_velocity=float(self.angular_velocity[i])
+            )
+            particle.age = float(self.age[i])
+            particle.rotation = float(self.rotation[i])
+            particle.gravity = self.gravity
+            snapshot.append(particle)
+        return snapshot
+    
+    def set_position(self, position: Tuple[float, float]):
+        """Update emitter position."""
+        self.x, self.y = position
+    
+    def emit_burst(self, count: int):
+        """Emit a burst of particles instantly."""
+        self._create_particles(count)
+    
+    def _create_particles(self, count: int):
+        """Append count new particles to the columns."""
+        if count <= 0:
+            return
+        rng = self.np_rng
+        
+        # Random angle within spread and random speed
+        angle = self.direction + rng.uniform(-self.spread / 2, self.spread / 2, count)
+        speed = rng.uniform(self.speed_min, self.speed_max, count)
+        # Negative vy because y increases downward
+        vel = np.stack([np.cos(angle) * speed, -np.sin(angle) * speed], axis=1)
+        
+        self.pos = np.concatenate([self.pos, np.tile([self.x, self.y], (count, 1)).astype(np.float64)])
+        self.vel = np.concatenate([self.vel, vel])
+        self.age = np.concatenate([self.age, np.zeros(count)])
+        self.lifetime = np.concatenate([self.lifetime, np.full(count, float(self.particle_lifetime))])
+        self.color = np.concatenate([self.color, self._palette[rng.integers(len(self._palette), size=count)]])
+        self.size = np.concatenate([self.size, rng.uniform(self.size_min, self.size_max, count)])
+        self.rotation = np.concatenate([self.rotation, np.zeros(count)])
+        self.angular_velocity = np.concatenate([self.angular_velocity, rng.uniform(-10, 10, count)])
+        self.shape = np.concatenate([self.shape, self._shape_palette[rng.integers(len(self._shape_palette), size=count)]])
+    
+    def _compact(self, keep: np.ndarray):
+        """Keep only the particles selected by a boolean mask."""
+        self.pos = self.pos[keep]
+        self.vel = self.vel[keep]
+        self.age = self.age[keep]
+        self.lifetime = self.lifetime[keep]
+        self.color = self.color[keep]
+        self.size = self.size[keep]
+        self.rotation = self.rotation[keep]
+        self.angular_velocity = self.angular_velocity[keep]
+        self.shape = self.shape[keep]
+    
+    def update(self, dt: float):
+        """
+        Update all particles and emit new ones.
+        
+        Args:
+            dt: Time delta in seconds
+        """
+        if self.particle_count:
+            self.age += dt
+            self.pos += self.vel * dt
+            self.vel[:, 1] += self.gravity * dt
+            self.rotation += self.angular_velocity * dt
+            
+            # Remove dead particles
+            alive = self.age < self.lifetime
+            if not alive.all():
+                self._compact(alive)
+        
+        # Emit new particles if enabled and not in burst mode
+        if self.enabled and not self.burst_mode and self.emission_rate > 0:
+            self.time_since_emission += dt
+            particles_to_emit = int(self.time_since_emission * self.emission_rate)
+            self._create_particles(particles_to_emit)
+            self.time_since_emission -= particles_to_emit / self.emission_rate
+    
+    def get_alpha(self) -> np.ndarray:
+        """Alpha of every particle (fade out in the last 30% of lifetime)."""
+        fade_start = self.lifetime * 0.7
+        fade_progress = (self.age - fade_start) / (self.lifetime - fade_start)
+        return np.clip(1.0 - fade_progress, 0.0, 1.0)
+    
+    def _outlines(self, index: np.ndarray, shape_code: int, cx: np.ndarray, cy: np.ndarray) -> np.ndarray:
+        """Integer outline points (m, k, 2) for the particles in index."""
+        unit = self._UNIT_OUTLINES[shape_code]
+        size = self.size[index]
+        if shape_code == SHAPE_CODES['circle']:
+            radius = np.maximum(1, size.astype(np.int64)).astype(np.float64)
+            px = radius[:, None] * unit[None, :, 0]
+            py = radius[:, None] * unit[None, :, 1]
+        else:
+            scale = size.astype(np.int64).astype(np.float64)
+            angle = np.radians(self.rotation[index])[:, None]
+            cos_a, sin_a = np.cos(angle), np.sin(angle)
+            if shape_code == SHAPE_CODES['star']:
+                # Outer radius int(size), inner radius int(size * 0.4)
+                inner = (size * 0.4).astype(np.int64).astype(np.float64)
+                radius = np.where(np.arange(len(unit)) % 2 == 0, scale[:, None], inner[:, None])
+                theta = np.arange(len(unit)) * (np.pi / 5) + angle
+                px = radius * np.cos(theta)
+                py = radius * np.sin(theta)
+                return np.stack([
+                    (cx[:, None] + px).astype(np.int32),
+                    (cy[:, None] + py).astype(np.int32)
+                ], axis=2)
+            ux = scale[:, None] * unit[None, :, 0]
+            uy = scale[:, None] * unit[None, :, 1]
+            px = ux * cos_a - uy * sin_a
+            py = ux * sin_a + uy * cos_a
+        return np.stack([
+            (cx[:, None] + px).astype(np.int32),
+            (cy[:, None] + py).astype(np.int32)
+        ], axis=2)
+    
+    def render(self, frame: np.ndarray):
+        """
+        Render all particles onto a frame.
+        
+        Args:
+            frame: OpenCV image (numpy array)
+        """
+        if self.particle_count == 0:
+            return
+        h, w = frame.shape[:2]
+        
+        # Visible particles: alive, not fully faded and centered inside the frame
+        alpha = self.get_alpha()
+        cx = self.pos[:, 0].astype(np.int64)
+        cy = self.pos[:, 1].astype(np.int64)
+        visible = (alpha > 0) & (cx >= 0) & (cx < w) & (cy >= 0) & (cy < h) & (self.shape >= 0)
+        index = np.flatnonzero(visible)
+        if len(index) == 0:
+            return
+        
+        if self._alpha_mask is None or self._alpha_mask.shape != (h, w):
+            self._alpha_mask = np.zeros((h, w), dtype=np.uint8)
+        mask = self._alpha_mask
+        
+        # Doodle style: black outline only, no fill.
+        # Group by shape, thickness and alpha level; draw weaker levels first so
+        # overlapping outlines keep the strongest alpha.
+        levels = np.rint(alpha[index] * (self.ALPHA_LEVELS - 1)).astype(np.int64)
+        thickness = np.maximum(1, (self.size[index] / 4).astype(np.int64))
+        shapes = self.shape[index].astype(np.int64)
+        # Rows sort by level first, so weaker levels are drawn first
+        groups, group_of = np.unique(np.stack([levels, thickness, shapes], axis=1), axis=0, return_inverse=True)
+        group_of = group_of.reshape(-1)
+        order = np.argsort(group_of, kind='stable')
+        splits = np.flatnonzero(np.diff(group_of[order])) + 1
+        
+        for (level, group_thickness, shape_code), group in zip(groups.tolist(), np.split(order, splits)):
+            value = int(round(level * 255 / (self.ALPHA_LEVELS - 1)))
+            group_index = index[group]
+            outlines = self._outlines(group_index, shape_code, cx[group_index], cy[group_index])
+            cv2.polylines(mask, outlines, True, value, group_thickness)
+        
+        # Blend black outlines over the particles' bounding box only (outlines
+        # reach up to size plus their thickness from the center)
+        margin = int(np.max(self.size[index])) + int(thickness.max()) + 1
+        x0 = max(0, int(cx[index].min()) - margin)
+        x1 = min(w, int(cx[index].max()) + margin + 1)
+        y0 = max(0, int(cy[index].min()) - margin)
+        y1 = min(h, int(cy[index].max()) + margin + 1)
+        roi = frame[y0:y1, x0:x1]
+        roi_mask = mask[y0:y1, x0:x1]
+        inv = (255 - roi_mask).astype(np.uint16)
+        if roi.ndim == 3:
+            inv = inv[:, :, None]
+        blended = roi * inv
+        blended += 127
+        roi[:] = blended // 255
+        roi_mask[:] = 0
+
+
 class ParticleSystem:
     """Main particle system that manages multiple emitters and effects."""
     
-    def __init__(self, frame_rate: int = 30):
+    def __init__(self, frame_rate: int = 30, seed: Optional[int] = None):
         """
         Initialize the particle system.
         
         Args:
             frame_rate: Video frame rate (FPS)
+            seed: Seed of the system's random generator (None for a random seed)
         """
         self.frame_rate = frame_rate
         self.dt = 1.0 / frame_rate
-        self.emitters: List[ParticleEmitter] = []
+        self.emitters: List[Any] = []
+        self.rng = random.Random(seed)
         
-    def add_emitter(self, emitter: ParticleEmitter):
-        """Add an emitter to the system."""
+    def add_emitter(self, emitter: Any):
+        """Add an emitter (ParticleEmitter or ArrayParticleEmitter) to the system."""
         self.emitters.append(emitter)
         
     def update(self):
@@ -391,7 +695,8 @@ class ParticleSystem:
     def create_confetti_effect(
         position: Tuple[float, float],
         duration: float = 3.0,
-        burst_count: int = 100
+        burst_count: int = 100,
+        seed: Optional[int] = None
     ) -> 'ParticleSystem':
         """
         Create a confetti celebration effect.
@@ -400,11 +705,12 @@ class ParticleSystem:
             position: (x, y) position to emit from
             duration: How long the effect lasts
             burst_count: Number of confetti pieces
+            seed: Random seed (None for a random seed)
             
         Returns:
             ParticleSystem configured for confetti
         """
-        system = ParticleSystem()
+        system = ParticleSystem(seed=seed)
         
         # Doodle style: black and white only
         colors = [
@@ -413,7 +719,7 @@ class ParticleSystem:
             (100, 100, 100) # Gray
         ]
         
-        emitter = ParticleEmitter(
+        emitter = ArrayParticleEmitter(
             position=position,
             emission_rate=0,  # Burst mode
             particle_lifetime=duration,
@@ -423,7 +729,8 @@ class ParticleSystem:
             colors=colors,
             sizes=(4, 10),
             shapes=['square', 'circle', 'triangle'],
-            gravity=200  # Fall down
+            gravity=200,  # Fall down
+            rng=system.rng
         )
         emitter.burst_mode = True
         emitter.emit_burst(burst_count)
@@ -435,7 +742,8 @@ class ParticleSystem:
     def create_sparkle_effect(
         position: Tuple[float, float],
         duration: float = 2.0,
-        emission_rate: float = 30.0
+        emission_rate: float = 30.0,
+        seed: Optional[int] = None
     ) -> 'ParticleSystem':
         """
         Create a twinkling sparkle effect.
@@ -444,11 +752,12 @@ class ParticleSystem:
             position: (x, y) position to emit from
             duration: How long the effect lasts
             emission_rate: Sparkles per second
+            seed: Random seed (None for a random seed)
             
         Returns:
             ParticleSystem configured for sparkles
         """
-        system = ParticleSystem()
+        system = ParticleSystem(seed=seed)
         
         # Doodle style: black and white only
         colors = [
@@ -456,7 +765,7 @@ class ParticleSystem:
             (50, 50, 50),   # Dark gray
         ]
         
-        emitter = ParticleEmitter(
+        emitter = ArrayParticleEmitter(
             position=position,
             emission_rate=emission_rate,
             particle_lifetime=1.0,
@@ -466,7 +775,8 @@ class ParticleSystem:
             colors=colors,
             sizes=(2, 5),
             shapes=['star', 'circle'],
-            gravity=0  # No gravity for sparkles
+            gravity=0,  # No gravity for sparkles
+            rng=system.rng
         )
         
         system.add_emitter(emitter)
@@ -476,7 +786,8 @@ class ParticleSystem:
     def create_smoke_trail(
         start_position: Tuple[float, float],
         duration: float = 2.0,
-        emission_rate: float = 20.0
+        emission_rate: float = 20.0,
+        seed: Optional[int] = None
     ) -> 'ParticleSystem':
         """
         Create a smoke/dust trail effect.
@@ -485,11 +796,12 @@ class ParticleSystem:
             start_position: (x, y) starting position
             duration: How long the effect lasts
             emission_rate: Smoke particles per second
+            seed: Random seed (None for a random seed)
             
         Returns:
             ParticleSystem configured for smoke
         """
-        system = ParticleSystem()
+        system = ParticleSystem(seed=seed)
         
         # Doodle style: black and white only
         colors = [
@@ -498,7 +810,7 @@ class ParticleSystem:
             (60, 60, 60),     # Darker gray
         ]
         
-        emitter = ParticleEmitter(
+        emitter = ArrayParticleEmitter(
             position=start_position,
             emission_rate=emission_rate,
             particle_lifetime=1.5,
@@ -508,7 +820,8 @@ class ParticleSystem:
             colors=colors,
             sizes=(8, 16),
             shapes=['circle'],
-            gravity=-20  # Slight upward drift
+            gravity=-20,  # Slight upward drift
+            rng=system.rng
         )
         
         system.add_emitter(emitter)
@@ -517,7 +830,8 @@ class ParticleSystem:
     @staticmethod
     def create_explosion_effect(
         position: Tuple[float, float],
-        particle_count: int = 50
+        particle_count: int = 50,
+        seed: Optional[int] = None
     ) -> 'ParticleSystem':
         """
         Create an explosion effect.
@@ -525,11 +839,12 @@ class ParticleSystem:
         Args:
             position: (x, y) explosion center
             particle_count: Number of explosion particles
+            seed: Random seed (None for a random seed)
             
         Returns:
             ParticleSystem configured for explosion
         """
-        system = ParticleSystem()
+        system = ParticleSystem(seed=seed)
         
         # Doodle style: black and white only
         colors = [
@@ -538,7 +853,7 @@ class ParticleSystem:
             (60, 60, 60),   # Dark gray
         ]
         
-        emitter = ParticleEmitter(
+        emitter = ArrayParticleEmitter(
             position=position,
             emission_rate=0,  # Burst mode
             particle_lifetime=1.5,
@@ -548,7 +863,8 @@ class ParticleSystem:
             colors=colors,
             sizes=(3, 12),
             shapes=['circle', 'star'],
-            gravity=100  # Particles fall
+            gravity=100,  # Particles fall
+            rng=system.rng
         )
         emitter.burst_mode = True
         emitter.emit_burst(particle_count)
@@ -560,7 +876,8 @@ class ParticleSystem:
     def create_magic_sparkles(
         position: Tuple[float, float],
         duration: float = 3.0,
-        emission_rate: float = 15.0
+        emission_rate: float = 15.0,
+        seed: Optional[int] = None
     ) -> 'ParticleSystem':
         """
         Create magic sparkles effect (for text/objects).
@@ -569,11 +886,12 @@ class ParticleSystem:
             position: (x, y) position to emit from
             duration: How long the effect lasts
             emission_rate: Magic sparkles per second
+            seed: Random seed (None for a random seed)
             
         Returns:
             ParticleSystem configured for magic sparkles
         """
-        system = ParticleSystem()
+        system = ParticleSystem(seed=seed)
         
         # Doodle style: black and white only
         colors = [
@@ -581,7 +899,7 @@ class ParticleSystem:
             (50, 50, 50),   # Dark gray
         ]
         
-        emitter = ParticleEmitter(
+        emitter = ArrayParticleEmitter(
             position=position,
             emission_rate=emission_rate,
             particle_lifetime=2.0,
@@ -591,7 +909,8 @@ class ParticleSystem:
             colors=colors,
             sizes=(3, 8),
             shapes=['star'],
-            gravity=-30  # Float upward
+            gravity=-30,  # Float upward
+            rng=system.rng
         )
         
         system.add_emitter(emitter)
@@ -609,7 +928,8 @@ class ParticleSystem:
             ParticleSystem configured from config
         """
         system = ParticleSystem(
-            frame_rate=config.get('frame_rate', 30)
+            frame_rate=config.get('frame_rate', 30),
+            seed=config.get('seed')
         )
         
         emitters_config = config.get('emitters', [])
@@ -624,7 +944,7 @@ class ParticleSystem:
                 else:
                     colors.append(color)
             
-            emitter = ParticleEmitter(
+            emitter = ArrayParticleEmitter(
                 position=position,
                 emission_rate=emitter_config.get('emission_rate', 10.0),
                 particle_lifetime=emitter_config.get('particle_lifetime', 2.0),
@@ -634,7 +954,8 @@ class ParticleSystem:
                 colors=colors,
                 sizes=tuple(emitter_config.get('sizes', [3, 8])),
                 shapes=emitter_config.get('shapes', ['circle']),
-                gravity=emitter_config.get('gravity', 0.0)
+                gravity=emitter_config.get('gravity', 0.0),
+                rng=system.rng
             )
             
             # Handle burst mode
@@ -647,63 +968,167 @@ class ParticleSystem:
         return system
 
 
-def apply_particle_effect(
-    frame: np.ndarray,
+# Seed used for particle effects that don't specify one, so renders are reproducible
+DEFAULT_PARTICLE_SEED = 0
+
+
+def create_particle_system_from_config(
     particle_config: Dict[str, Any],
-    frame_index: int,
-    total_frames: int,
-    frame_rate: int = 30
-) -> np.ndarray:
+    frame_shape: Tuple[int, ...],
+    seed: Optional[int] = DEFAULT_PARTICLE_SEED
+) -> Optional[ParticleSystem]:
     """
-    Apply particle effects to a frame based on configuration.
+    Create the particle system described by a layer's particle_effect config.
     
     Args:
-        frame: Input frame (numpy array)
         particle_config: Particle effect configuration
-        frame_index: Current frame index
-        total_frames: Total number of frames for this effect
-        frame_rate: Video frame rate
+        frame_shape: Shape of the frames the effect is drawn on (for the default position)
+        seed: Random seed, overridden by particle_config['seed'] when present
         
     Returns:
-        Frame with particle effects applied
+        ParticleSystem, or None for an unknown effect type
     """
     effect_type = particle_config.get('type', 'confetti')
-    position = particle_config.get('position', [frame.shape[1] // 2, frame.shape[0] // 2])
+    position = particle_config.get('position', [frame_shape[1] // 2, frame_shape[0] // 2])
     position = tuple(position)
+    seed = particle_config.get('seed', seed)
     
     # Create particle system based on effect type
     if effect_type == 'confetti':
         duration = particle_config.get('duration', 3.0)
         burst_count = particle_config.get('burst_count', 100)
-        system = ParticleSystem.create_confetti_effect(position, duration, burst_count)
+        return ParticleSystem.create_confetti_effect(position, duration, burst_count, seed=seed)
     elif effect_type == 'sparkle':
         duration = particle_config.get('duration', 2.0)
         emission_rate = particle_config.get('emission_rate', 30.0)
-        system = ParticleSystem.create_sparkle_effect(position, duration, emission_rate)
+        return ParticleSystem.create_sparkle_effect(position, duration, emission_rate, seed=seed)
     elif effect_type == 'smoke':
         duration = particle_config.get('duration', 2.0)
         emission_rate = particle_config.get('emission_rate', 20.0)
-        system = ParticleSystem.create_smoke_trail(position, duration, emission_rate)
+        return ParticleSystem.create_smoke_trail(position, duration, emission_rate, seed=seed)
     elif effect_type == 'explosion':
         particle_count = particle_config.get('particle_count', 50)
-        system = ParticleSystem.create_explosion_effect(position, particle_count)
+        return ParticleSystem.create_explosion_effect(position, particle_count, seed=seed)
     elif effect_type == 'magic':
         duration = particle_config.get('duration', 3.0)
         emission_rate = particle_config.get('emission_rate', 15.0)
-        system = ParticleSystem.create_magic_sparkles(position, duration, emission_rate)
+        return ParticleSystem.create_magic_sparkles(position, duration, emission_rate, seed=seed)
     elif effect_type == 'custom':
-        system = ParticleSystem.create_custom_particle_system(particle_config)
-    else:
-        # Unknown effect type, return frame unchanged
-        return frame
+        return ParticleSystem.create_custom_particle_system(dict(particle_config, seed=seed))
+    
+    # Unknown effect type
+    return None
+
+
+class ParticleEffectRunner:
+    """
+    Stateful runner that renders a particle effect frame by frame.
+    
+    The particle system is created once with a fixed seed and advanced one
+    step per rendered frame, so an effect of N frames costs N updates and
+    always produces the same frames. seek() rebuilds the state at any frame
+    index (e.g. when resuming a render from a checkpoint).
+    """
+    
+    def __init__(
+        self,
+        particle_config: Dict[str, Any],
+        frame_shape: Tuple[int, ...],
+        frame_rate: int = 30,
+        seed: Optional[int] = DEFAULT_PARTICLE_SEED
+    ):
+        """
+        Initialize the runner.
+        
+        Args:
+            particle_config: Particle effect configuration
+            frame_shape: Shape of the frames the effect is drawn on
+            frame_rate: Video frame rate
+            seed: Random seed, overridden by particle_config['seed'] when present
+        """
+        self.particle_config = particle_config
+        self.frame_shape = frame_shape
+        self.frame_rate = frame_rate
+        self.seed = seed
+        self.system: Optional[ParticleSystem] = None
+        self.frame_index = 0
+        self._reset()
     
-    # Simulate up to current frame
-    system.frame_rate = frame_rate
-    for _ in range(frame_index + 1):
-        system.update()
+    def _reset(self):
+        """Recreate the particle system in its initial state."""
+        self.system = create_particle_system_from_config(
+            self.particle_config, self.frame_shape, self.seed
+        )
+        if self.system is not None:
+            self.system.frame_rate = self.frame_rate
+        self.frame_index = 0
     
-    # Render particles on frame copy
-    result = frame.copy()
-    system.render(result)
+    def seek(self, frame_index: int):
+        """
+        Move the simulation so that the next rendered frame is frame_index.
+        
+        Seeking forward only steps the simulation; seeking backward replays it
+        from the start with the same seed.
+        """
+        if frame_index < self.frame_index:
+            self._reset()
+        if self.system is not None:
+            while self.frame_index < frame_index:
+                self.system.update()
+                self.frame_index += 1
+        else:
+            self.frame_index = frame_index
     
-    return result
+    def render_next(self, frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Advance the simulation by one frame and render it.
+        
+        Args:
+            frame: Background frame (not modified)
+            out: Optional buffer (same shape as frame) to render into instead
+                of allocating a copy
+            
+        Returns:
+            Copy of frame with the particles drawn on it (out when given)
+        """
+        if out is None:
+            result = frame.copy()
+        else:
+            result = out
+            np.copyto(result, frame)
+        if self.system is not None:
+            self.system.update()
+            self.system.render(result)
+        self.frame_index += 1
+        return result
+
+
+def apply_particle_effect(
+    frame: np.ndarray,
+    particle_config: Dict[str, Any],
+    frame_index: int,
+    total_frames: int,
+    frame_rate: int = 30
+) -> np.ndarray:
+    """
+    Apply particle effects to a frame based on configuration.
+    
+    The simulation is replayed from the start for the requested frame; use a
+    ParticleEffectRunner to render consecutive frames.
+    
+    Args:
+        frame: Input frame (numpy array)
+        particle_config: Particle effect configuration
+        frame_index: Current frame index
+        total_frames: Total number of frames for this effect
+        frame_rate: Video frame rate
+        
+    Returns:
+        Frame with particle effects applied
+    """
+    runner = ParticleEffectRunner(particle_config, frame.shape, frame_rate)
+    if runner.system is None:
+        # Unknown effect type, return frame unchanged
+        return frame
+    runner.seek(frame_index)
+    return runner.render_next(frame)
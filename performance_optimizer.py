@@ -11,17 +11,24 @@ This module provides:
 - Batch processing
 """
 
+import argparse
 import os
 import json
 import time
 import pickle
 import hashlib
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple, Any
 import threading
 
 
+# Default root directory for batch renders (one sub-directory per config)
+DEFAULT_BATCH_OUTPUT_DIR = "./batch_output"
+
+
 class RenderCheckpoint:
     """Manages checkpoints for resumable rendering."""
     
@@ -317,36 +324,186 @@ def create_batch_config(config_files: List[str]) -> List[Dict]:
     return batch_configs
 
 
+def plan_batch_jobs(
+    config_files: List[str],
+    output_dir: str = DEFAULT_BATCH_OUTPUT_DIR,
+    render_args: Optional[argparse.Namespace] = None
+) -> List[Dict]:
+    """Build one render job per config file, each with its own output directory and log.
+    
+    Without render_args a job renders with the CLI defaults (argv); otherwise
+    it gets a copy of render_args pointing at its config and output directory.
+    """
+    jobs = []
+    used_names = set()
+    
+    for index, config_file in enumerate(config_files):
+        # Name the job directory after the config, disambiguating duplicates
+        name = Path(config_file).stem or f"job_{index}"
+        if name in used_names:
+            name = f"{name}_{index}"
+        used_names.add(name)
+        
+        job_dir = os.path.join(output_dir, name)
+        jobs.append({
+            'index': index,
+            'config_file': config_file,
+            'output_dir': job_dir,
+            'log_file': os.path.join(job_dir, "render.log"),
+            'argv': ['--config', config_file, '--output-dir', job_dir],
+            'args': None if render_args is None else argparse.Namespace(
+                **dict(vars(render_args), config=config_file, output_dir=job_dir)
+            ),
+        })
+    
+    return jobs
+
+
+def render_batch_job(job: Dict) -> Dict:
+    """
+    Render one batch job through the regular CLI (`--config`) code path.
+    
+    Runs in a worker process. All output goes to the job's log file and any
+    exception is reported in the result instead of being raised.
+    """
+    os.makedirs(job['output_dir'], exist_ok=True)
+    result = {
+        'config_file': job['config_file'],
+        'status': 'failed',
+        'error': None,
+        'output_dir': job['output_dir'],
+        'log_file': job['log_file'],
+        'outputs': [],
+        'duration': 0.0,
+    }
+    
+    start_time = time.time()
+    with open(job['log_file'], 'w', encoding='utf-8') as log:
+        with redirect_stdout(log), redirect_stderr(log):
+            try:
+                import whiteboard_animator
+                whiteboard_animator.main(job['argv'], args=job['args'])
+            except SystemExit as e:
+                if e.code not in (None, 0):
+                    result['error'] = f"exited with status {e.code}"
+            except BaseException as e:
+                result['error'] = f"{type(e).__name__}: {e}"
+                traceback.print_exc()
+    result['duration'] = time.time() - start_time
+    
+    result['outputs'] = sorted(
+        os.path.join(job['output_dir'], name)
+        for name in os.listdir(job['output_dir'])
+        if name.endswith('.mp4')
+    )
+    if result['error'] is None:
+        if result['outputs']:
+            result['status'] = 'completed'
+        else:
+            result['error'] = f"no video produced (see {job['log_file']})"
+    
+    return result
+
+
+def print_batch_summary(results: List[Dict], total_time: float):
+    """Print a per-job results table with timings."""
+    completed = sum(1 for r in results if r['status'] == 'completed')
+    
+    print("\n" + "=" * 70)
+    print(f"📦 Batch summary: {completed}/{len(results)} completed in {total_time:.1f}s")
+    print("=" * 70)
+    for result in results:
+        icon = "✅" if result['status'] == 'completed' else "❌"
+        print(f"{icon} {result['config_file']:<40} {result['duration']:>8.1f}s  {result['status']}")
+        if result['status'] == 'completed':
+            for output in result['outputs']:
+                print(f"     🎥 {output}")
+        else:
+            print(f"     {result['error']}")
+            if result.get('log_file'):
+                print(f"     📄 {result['log_file']}")
+    print("=" * 70)
+
+
 def process_batch(
     config_files: List[str],
     parallel: bool = False,
-    max_workers: int = 2
+    max_workers: int = 2,
+    output_dir: str = DEFAULT_BATCH_OUTPUT_DIR,
+    render_args: Optional[argparse.Namespace] = None
 ) -> List[Dict]:
-    """Process multiple configurations in batch mode."""
-    batch_configs = create_batch_config(config_files)
-    results = []
+    """
+    Render multiple configurations in batch mode.
     
-    print(f"📦 Processing {len(batch_configs)} configurations in batch mode...")
+    Each config is rendered like `whiteboard_animator.py --config <file>` in a
+    separate worker process, with its own output directory and render.log.
+    A failing or crashing job does not stop the others.
     
-    if parallel:
-        print(f"⚡ Using {max_workers} parallel workers")
-        # Parallel processing would be implemented here
-        # For now, we'll process sequentially
-        for config in batch_configs:
-            result = {
-                'config_file': config.get('_source_file'),
-                'status': 'pending',
-                'error': None
-            }
-            results.append(result)
-    else:
-        for config in batch_configs:
-            result = {
-                'config_file': config.get('_source_file'),
-                'status': 'pending',
-                'error': None
+    Args:
+        config_files: Paths of the JSON configurations to render
+        parallel: Render up to max_workers configs at the same time
+        max_workers: Number of worker processes when parallel is True
+        output_dir: Root directory for the per-job output directories
+        render_args: Parsed CLI arguments shared by every render (see
+            whiteboard_animator.get_batch_render_args); CLI defaults if None
+    
+    Returns:
+        One result dict per config (in input order) with status
+        ('completed' or 'failed'), error, output_dir, log_file, outputs
+        and duration in seconds. The same data is written to
+        <output_dir>/batch_summary.json.
+    """
+    # Configs that can't be loaded are reported as failed without rendering
+    loaded = {config.get('_source_file') for config in create_batch_config(config_files)}
+    jobs = plan_batch_jobs(config_files, output_dir, render_args)
+    results: List[Optional[Dict]] = [None] * len(jobs)
+    for job in jobs:
+        if job['config_file'] not in loaded:
+            results[job['index']] = {
+                'config_file': job['config_file'],
+                'status': 'failed',
+                'error': "could not load configuration",
+                'output_dir': job['output_dir'],
+                'log_file': None,
+                'outputs': [],
+                'duration': 0.0,
             }
-            results.append(result)
+    pending = [job for job in jobs if results[job['index']] is None]
+    
+    workers = max(1, max_workers) if parallel else 1
+    print(f"📦 Processing {len(jobs)} configurations in batch mode...")
+    if parallel:
+        print(f"⚡ Using {workers} parallel workers")
+    
+    start_time = time.time()
+    os.makedirs(output_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(render_batch_job, job): job for job in pending}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker process itself died (crash, out of memory...)
+                result = {
+                    'config_file': job['config_file'],
+                    'status': 'failed',
+                    'error': f"worker crashed: {type(e).__name__}: {e}",
+                    'output_dir': job['output_dir'],
+                    'log_file': job['log_file'],
+                    'outputs': [],
+                    'duration': 0.0,
+                }
+            results[job['index']] = result
+            icon = "✅" if result['status'] == 'completed' else "❌"
+            print(f"  {icon} {job['config_file']} ({result['duration']:.1f}s)")
+    total_time = time.time() - start_time
+    
+    print_batch_summary(results, total_time)
+    
+    summary_path = os.path.join(output_dir, "batch_summary.json")
+    with open(summary_path, 'w') as f:
+        json.dump({'total_time': total_time, 'jobs': results}, f, indent=2)
     
     return results
 
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Test NumPy synthesis of typewriter and drawing sounds (no FFmpeg needed)."""
+
+import sys
+
+import numpy as np
+
+from audio_manager import (
+    PYDUB_AVAILABLE, AudioManager, click_template, ms_to_samples, noise_loop,
+    synthesize_drawing, synthesize_typewriter
+)
+
+SAMPLE_RATE = 44100
+
+
+def test_templates_cached():
+    """Click and noise templates are generated once per sample rate and are read-only."""
+    print("Testing template cache...")
+    click = click_template(SAMPLE_RATE)
+    assert click is click_template(SAMPLE_RATE)
+    assert noise_loop(SAMPLE_RATE) is noise_loop(SAMPLE_RATE)
+    assert click_template(22050) is not click
+    assert not click.flags.writeable and not noise_loop(SAMPLE_RATE).flags.writeable
+    assert len(click) == ms_to_samples(50, SAMPLE_RATE)
+    # -20 dB burst with a 5 ms attack and a 20 ms decay
+    assert np.abs(click).max() <= 32767 * 0.1
+    assert abs(click[0]) == 0 and np.abs(click[-10:]).max() < 32767 * 0.1 * 0.02
+    print(f"  ✓ {len(click)}-sample click, {len(noise_loop(SAMPLE_RATE))}-sample noise loop")
+
+
+def test_typewriter_layout():
+    """Each character is char_interval of silence followed by one click (same layout as before)."""
+    print("Testing typewriter track...")
+    samples = synthesize_typewriter(12, 0.1, 0.3, SAMPLE_RATE)
+    silence, click = ms_to_samples(100, SAMPLE_RATE), ms_to_samples(50, SAMPLE_RATE)
+    period = silence + click
+    assert samples.dtype == np.int16 and len(samples) == 12 * period
+    track = samples.reshape(12, period)
+    assert not track[:, :silence].any()
+    expected = np.rint(click_template(SAMPLE_RATE) * 10 ** (20 * (0.3 - 1) / 20))
+    assert (np.abs(track[:, silence:] - expected) <= 1).all()
+    assert np.array_equal(samples, synthesize_typewriter(12, 0.1, 0.3, SAMPLE_RATE))
+    assert len(synthesize_typewriter(0, 0.1, 0.3, SAMPLE_RATE)) == 0
+    print(f"  ✓ 12 clicks every {period} samples")
+
+
+def test_drawing_sound():
+    """The noise loop is repeated for the whole duration and faded in and out."""
+    print("Testing drawing sound...")
+    samples = synthesize_drawing(5.0, 1.0, SAMPLE_RATE)
+    loop = np.rint(noise_loop(SAMPLE_RATE))
+    fade_in, fade_out = ms_to_samples(100, SAMPLE_RATE), ms_to_samples(200, SAMPLE_RATE)
+    assert len(samples) == 5 * SAMPLE_RATE
+    middle = np.arange(fade_in, len(samples) - fade_out)
+    assert np.array_equal(samples[middle], loop[middle % len(loop)])
+    assert samples[0] == 0 and np.abs(samples[-100:]).max() < np.abs(loop).max() * 0.01
+    assert np.abs(samples).max() <= 32767 * 10 ** (-25 / 20) + 1
+    # Shorter than the fades
+    assert len(synthesize_drawing(0.05, 0.2, SAMPLE_RATE)) == ms_to_samples(50, SAMPLE_RATE)
+    print(f"  ✓ {len(samples)} samples from a {len(loop)}-sample loop")
+
+
+def test_audio_manager_api():
+    """AudioManager keeps its API and track durations."""
+    print("Testing AudioManager generators...")
+    if not PYDUB_AVAILABLE:
+        print("  ⚠️ pydub not installed, skipping")
+        return
+    manager = AudioManager(frame_rate=30)
+    assert manager.generate_typewriter_sound(1.0, 400, char_interval=0.08, volume=0.3)
+    assert manager.generate_drawing_sound(2.0, 12.5, volume=0.2)
+    typewriter, drawing = manager.audio_tracks
+    assert typewriter['type'] == 'typewriter' and typewriter['start'] == 1000
+    assert len(typewriter['audio']) == 400 * (80 + 50)
+    assert typewriter['audio'].frame_rate == 44100 and typewriter['audio'].channels == 1
+    assert drawing['type'] == 'drawing' and drawing['start'] == 2000
+    assert len(drawing['audio']) == 12500
+    assert len(manager.mix_audio()) == 1000 + 400 * 130
+    print("  ✓ Track lengths and start times as configured")
+
+
+if __name__ == "__main__":
+    test_templates_cached()
+    test_typewriter_layout()
+    test_drawing_sound()
+    test_audio_manager_api()
+    print("\n✅ All audio synthesis tests passed!")
+    sys.exit(0)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Test the lazy camera sequence and post-animation effect generators."""
+
+import sys
+import types
+
+import cv2
+import numpy as np
+
+from frame_pool import FrameBufferPool
+from frame_sink import static_runs
+from whiteboard_animator import (
+    CameraPyramid, apply_camera_transform, apply_post_animation_effect,
+    generate_camera_sequence_frames, write_camera_frames
+)
+
+CAMERAS = [
+    {'zoom': 1.0, 'duration': 0.5},
+    {'zoom': 2.0, 'position': {'x': 0.3, 'y': 0.4}, 'duration': 1.0,
+     'transition_duration': 0.5, 'easing': 'ease_in_out'},
+    {'zoom': 1.5, 'position': {'x': 0.7, 'y': 0.6}, 'duration': 0.5,
+     'transition_duration': 0.3},
+]
+
+
+def make_base(height=90, width=160):
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def expected_hold_frames(base, cameras, frame_rate, width, height):
+    """Hold frames rendered independently from a fresh pyramid (None for transitions)."""
+    expected = []
+    prev = None
+    for camera in cameras:
+        hold_frames = int(frame_rate * camera.get('duration', 2.0))
+        config = {'zoom': camera.get('zoom', 1.0),
+                  'position': camera.get('position', {'x': 0.5, 'y': 0.5}), 'size': None}
+        transition_frames = 0
+        if prev and camera.get('transition_duration', 0) > 0:
+            transition_frames = int(frame_rate * camera['transition_duration'])
+        expected.extend([None] * transition_frames)
+        expected.extend([CameraPyramid(base.copy()).render(config, width, height).copy()] * hold_frames)
+        prev = camera
+    return expected
+
+
+def test_camera_generator_is_lazy_and_exact():
+    """Frames are produced on demand, holds are static runs, pixels match."""
+    print("Testing generate_camera_sequence_frames...")
+    base = make_base()
+    original = base.copy()
+    generator = generate_camera_sequence_frames(base, CAMERAS, 30, 160, 90)
+    assert isinstance(generator, types.GeneratorType)
+
+    seen = []
+    for frame, run_length in static_runs(generator):
+        # The run frame is still intact while the next one is being produced
+        seen.append((frame.copy(), run_length))
+    assert np.array_equal(base, original), "Base frame was modified"
+
+    expected = expected_hold_frames(base, CAMERAS, 30, 160, 90)
+    assert sum(n for _, n in seen) == len(expected) == 15 + 15 + 30 + 9 + 15
+    assert [n for _, n in seen if n > 1] == [15, 30, 15], "Holds are not static runs"
+
+    flat = [frame for frame, n in seen for _ in range(n)]
+    for index, (frame, reference) in enumerate(zip(flat, expected)):
+        if reference is not None:
+            assert np.array_equal(frame, reference), f"Hold frame {index} differs"
+    print(f"  ✓ {len(flat)} frames in {len(seen)} runs, base untouched")
+
+
+def test_post_effect_generator():
+    """Zoom effect frames are lazy and match per-frame transforms."""
+    print("Testing apply_post_animation_effect...")
+    base = make_base()
+    config = {'type': 'zoom_in', 'duration': 0.5, 'start_zoom': 1.0, 'end_zoom': 1.5}
+    frames = apply_post_animation_effect([base], config, 30, 160, 90)
+    assert next(frames) is base
+
+    count = 0
+    for i, frame in enumerate(frames):
+        zoom = 1.0 + 0.5 * i / 14
+        expected = CameraPyramid(base).render({'zoom': zoom, 'position': {'x': 0.5, 'y': 0.5}}, 160, 90)
+        assert np.array_equal(frame, expected), f"Effect frame {i} differs"
+        count += 1
+    assert count == 15
+
+    assert len(list(apply_post_animation_effect([base], {'type': 'none'}, 30, 160, 90))) == 1
+    print(f"  ✓ {count} effect frames generated on demand")
+
+
+def test_pyramid_matches_resize_when_aligned():
+    """Aligned viewports use crop + resize; the warpAffine path samples the same geometry."""
+    print("Testing CameraPyramid accuracy...")
+    rng = np.random.default_rng(1)
+    base = cv2.GaussianBlur(rng.integers(0, 256, (360, 640, 3), dtype=np.uint8), (5, 5), 0)
+    pyramid = CameraPyramid(base)
+    for zoom, x, y in [(1.0, 0.5, 0.5), (2.0, 0.5, 0.5), (2.0, 0.25, 0.75), (4.0, 0.5, 0.5)]:
+        config = {'zoom': zoom, 'position': {'x': x, 'y': y}}
+        expected = apply_camera_transform(base, config, 640, 360)
+        assert np.array_equal(pyramid.render(config, 640, 360), expected)
+        # A negligible sub-pixel offset goes through warpAffine: same geometry
+        nudged = {'zoom': zoom, 'position': {'x': x + 1e-9, 'y': y}}
+        diff = np.abs(pyramid.render(nudged, 640, 360).astype(int) - expected)
+        assert diff.mean() < 0.5 and diff.max() <= 16, f"zoom {zoom}: {diff.mean():.2f}/{diff.max()}"
+
+    # Zoom 1 is a view of the frame, no resampling
+    assert np.shares_memory(pyramid.render({'zoom': 1.0}, 640, 360), base)
+
+    # Quarter-pixel pans move the image instead of snapping to whole pixels
+    frames = [pyramid.render({'zoom': 2.0, 'position': {'x': 0.5 + dx / 640, 'y': 0.5}}, 640, 360)
+              for dx in (0, 0.25, 0.5)]
+    assert not np.array_equal(frames[0], frames[1]) and not np.array_equal(frames[1], frames[2])
+
+    # Lanczos samples the same geometry
+    lanczos = pyramid.render({'zoom': 2.0}, 640, 360, interpolation='lanczos')
+    assert np.abs(lanczos.astype(int) - pyramid.render({'zoom': 2.0}, 640, 360)).mean() < 2
+    print("  ✓ Matches resize when aligned, sub-pixel pans, Lanczos option")
+
+
+def test_pyramid_downscale_levels():
+    """Large sources are sampled from a reduced level (no aliasing)."""
+    print("Testing CameraPyramid levels...")
+    base = np.zeros((720, 1280, 3), dtype=np.uint8)
+    base[:, ::2] = 255  # One-pixel stripes alias badly when point-sampled
+    pyramid = CameraPyramid(base)
+    result = pyramid.render({'zoom': 1.0}, 320, 180)
+    assert len(pyramid.levels) == 3, f"Expected levels up to 1/4, got {len(pyramid.levels)}"
+    reference = cv2.resize(base, (320, 180), interpolation=cv2.INTER_AREA)
+    assert np.abs(result.astype(int) - reference).mean() < 3, "Downscaled view aliased"
+    print(f"  ✓ {len(pyramid.levels)} levels built on demand, stripes averaged")
+
+
+def test_write_camera_frames_watermark_copy():
+    """Watermarking a generated frame never touches the generator's source."""
+    print("Testing write_camera_frames...")
+
+    class Mark:
+        def apply(self, frame):
+            frame[:5, :5] = 0
+            return frame
+
+    written = []
+    writer = types.SimpleNamespace(write=lambda frame: written.append(frame.copy()))
+    variables = types.SimpleNamespace(
+        watermark=Mark(), buffer_pool=FrameBufferPool(), video_object=writer, frames_written=0
+    )
+    base = np.full((20, 30, 3), 255, dtype=np.uint8)
+    write_camera_frames(variables, base, 3)
+    assert (base == 255).all(), "Watermark applied to the source frame"
+    assert variables.frames_written == 3 and len(written) == 3
+    assert (written[0][:5, :5] == 0).all()
+    assert variables.buffer_pool.checked_out == 0
+    print("  ✓ Watermark applied on a pooled copy")
+
+
+if __name__ == "__main__":
+    test_camera_generator_is_lazy_and_exact()
+    test_post_effect_generator()
+    test_pyramid_matches_resize_when_aligned()
+    test_pyramid_downscale_levels()
+    test_write_camera_frames_watermark_copy()
+    print("\n✅ All camera sequence tests passed!")
+    sys.exit(0)
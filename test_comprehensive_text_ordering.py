@@ -6,7 +6,7 @@ import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 import cv2
 
-from whiteboard_animator import render_text_to_image
+from whiteboard_animator import render_text_to_image, text_column_segments
 
 def analyze_text_segments(text_config, expected_lines):
     """Analyze how text segments are ordered."""
@@ -125,6 +125,13 @@ def analyze_text_segments(text_config, expected_lines):
     
     print(f"✓ Segments properly ordered line-by-line, left-to-right")
     
+    # The vectorized extraction used by draw_text_handwriting gives the same order
+    expected_order = [(int(x), int(y1), int(y2)) for x, y1, y2 in sorted_segments]
+    if text_column_segments(255 - thresh) != expected_order:
+        print(f"✗ text_column_segments order differs from the reference")
+        return False
+    print(f"✓ text_column_segments matches the reference order ({len(expected_order)} segments)")
+    
     # Show segment counts per line
     for line_idx in range(detected_lines):
         count = sum(1 for ln in line_numbers if ln == line_idx)
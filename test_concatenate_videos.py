@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Test concatenate_videos (streaming concatenation with transitions and pauses)."""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from frame_sink import PYAV_AVAILABLE, PyAVFrameSink
+from whiteboard_animator import concatenate_videos, concatenate_videos_stream_copy
+
+
+def make_clip(path, num_frames, width, height, color, fps=30):
+    """Write a solid-color H.264 clip."""
+    sink = PyAVFrameSink(path, fps, width, height)
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[:] = color
+    for _ in range(num_frames):
+        sink.write(frame)
+    sink.release()
+
+
+def read_output(path):
+    """Return (frame count, mean BGR color of each frame, pts list, size)."""
+    import av
+    with av.open(path) as container:
+        stream = container.streams.video[0]
+        colors, pts = [], []
+        for frame in container.decode(stream):
+            colors.append(frame.to_ndarray(format='bgr24').mean(axis=(0, 1)))
+            pts.append(frame.pts)
+        size = (stream.codec_context.width, stream.codec_context.height)
+    return len(colors), colors, pts, size
+
+
+def test_concatenate_plain():
+    """Clips without transitions are appended frame for frame."""
+    print("Testing plain concatenation...")
+    with tempfile.TemporaryDirectory() as tmp:
+        clips = [os.path.join(tmp, f"clip{i}.mp4") for i in range(3)]
+        make_clip(clips[0], 10, 64, 48, (255, 0, 0))
+        make_clip(clips[1], 15, 64, 48, (0, 255, 0))
+        make_clip(clips[2], 5, 64, 48, (0, 0, 255))
+        output = os.path.join(tmp, "out.mp4")
+
+        assert concatenate_videos(clips, output)
+        count, colors, pts, size = read_output(output)
+        assert count == 30, f"Expected 30 frames, got {count}"
+        assert size == (64, 48)
+        assert pts == sorted(pts) and len(set(pts)) == len(pts), "pts must increase"
+        assert colors[9][0] > 200 and colors[10][1] > 200 and colors[25][2] > 200
+    print("  ✓ 30 frames in order with increasing pts")
+
+
+def test_concatenate_with_transition_pause_and_resize():
+    """Pauses and transitions are inserted and mismatched clips are resized."""
+    print("Testing transitions, pauses and resizing...")
+    with tempfile.TemporaryDirectory() as tmp:
+        clips = [os.path.join(tmp, f"clip{i}.mp4") for i in range(2)]
+        make_clip(clips[0], 10, 64, 48, (255, 255, 255))
+        make_clip(clips[1], 10, 32, 24, (0, 0, 0))
+        output = os.path.join(tmp, "out.mp4")
+
+        per_slide = [{'type': 'fade', 'duration': 0.2, 'pause_before': 0.1}]
+        assert concatenate_videos(clips, output, per_slide_transitions=per_slide)
+        count, colors, pts, size = read_output(output)
+        # 10 + 3 pause + 6 fade + 10
+        assert count == 29, f"Expected 29 frames, got {count}"
+        assert size == (64, 48)
+        assert colors[12].mean() > 240, "Pause frames should repeat the last frame"
+        fade = [c.mean() for c in colors[13:19]]
+        assert all(a > b for a, b in zip(fade, fade[1:])), "Fade should darken progressively"
+        assert colors[-1].mean() < 15
+    print("  ✓ Pause, fade and resized clip encoded")
+
+
+def test_stream_copy_with_transition():
+    """Matching clips are stream-copied; only the transition segment is encoded."""
+    print("Testing stream copy with an encoded transition segment...")
+    with tempfile.TemporaryDirectory() as tmp:
+        clips = [os.path.join(tmp, f"clip{i}.mp4") for i in range(2)]
+        make_clip(clips[0], 12, 64, 48, (255, 255, 255))
+        make_clip(clips[1], 12, 64, 48, (0, 0, 0))
+        output = os.path.join(tmp, "out.mp4")
+
+        assert concatenate_videos_stream_copy(clips, output, transition_type='fade', transition_duration=0.2)
+        count, colors, pts, size = read_output(output)
+        # 12 + 6 fade + 12
+        assert count == 30, f"Expected 30 frames, got {count}"
+        assert pts == sorted(pts) and len(set(pts)) == len(pts), "pts must increase"
+        assert colors[11].mean() > 240 and colors[18].mean() < 15
+        fade = [c.mean() for c in colors[12:18]]
+        assert all(a > b for a, b in zip(fade, fade[1:])), "Fade should darken progressively"
+
+        # Mismatched resolution: stream copy is refused
+        make_clip(clips[1], 12, 32, 24, (0, 0, 0))
+        assert not concatenate_videos_stream_copy(clips, output)
+    print("  ✓ Clips copied, fade segment encoded, mismatched clips rejected")
+
+
+if __name__ == "__main__":
+    if not PYAV_AVAILABLE:
+        print("⚠️ PyAV not installed, skipping concatenation tests")
+        sys.exit(0)
+    test_concatenate_plain()
+    test_concatenate_with_transition_pause_and_resize()
+    test_stream_copy_with_transition()
+    print("\n✅ All concatenation tests passed!")
+    sys.exit(0)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test the shared on-disk cache helpers (atomic writes, cache directory from the environment)."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+from disk_cache import atomic_write, cache_dir_from_env, set_cache_dir_env
+
+
+def test_atomic_write():
+    """Entries appear complete; a failed write leaves the previous entry and no temporary file."""
+    print("Testing atomic cache writes...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "nested" / "entry.json"
+        atomic_write(path, lambda f: f.write("first"), mode='w', encoding='utf-8')
+        assert path.read_text(encoding='utf-8') == "first"
+
+        def fail(f):
+            f.write("partial")
+            raise RuntimeError("disk full")
+
+        try:
+            atomic_write(path, fail, mode='w', encoding='utf-8')
+            assert False, "The error should propagate"
+        except RuntimeError:
+            pass
+        assert path.read_text(encoding='utf-8') == "first"
+        assert os.listdir(path.parent) == ["entry.json"]
+    print("  ✓ Failed writes leave the previous entry in place")
+
+
+def test_cache_dir_env():
+    """The cache directory round-trips through the environment variable."""
+    print("Testing cache directory environment variable...")
+    name = "WHITEBOARD_TEST_CACHE_DIR"
+    try:
+        assert set_cache_dir_env(name, "/tmp/whiteboard-cache") == Path("/tmp/whiteboard-cache")
+        assert os.environ[name] == "/tmp/whiteboard-cache"
+        assert cache_dir_from_env(name) == Path("/tmp/whiteboard-cache")
+        assert set_cache_dir_env(name, None) is None
+        assert name not in os.environ and cache_dir_from_env(name) is None
+    finally:
+        os.environ.pop(name, None)
+    print("  ✓ Set, read and cleared")
+
+
+if __name__ == "__main__":
+    test_atomic_write()
+    test_cache_dir_env()
+    print("\n✅ All disk cache tests passed!")
+    sys.exit(0)
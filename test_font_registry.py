@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Test the font registry used by text layers and SVG path handwriting."""
+
+import os
+import shutil
+import sys
+import tempfile
+
+from font_registry import FontRegistry, get_font_registry, normalize_style
+
+DEJAVU_DIR = "/usr/share/fonts/truetype/dejavu"
+
+
+def make_font_dir(tmp):
+    """Fonts under file names that do not match their family names."""
+    for source, target in [("DejaVuSans.ttf", "brand_r.ttf"), ("DejaVuSans-Bold.ttf", "brand_b.ttf"),
+                           ("DejaVuSansMono.ttf", "mono.ttf")]:
+        shutil.copy(os.path.join(DEJAVU_DIR, source), os.path.join(tmp, target))
+
+
+def test_resolution():
+    """Names resolve by file name, styled file name and family/style, once."""
+    print("Testing font resolution...")
+    if not os.path.isdir(DEJAVU_DIR):
+        print("  ⚠️ DejaVu fonts not found, skipping")
+        return
+    assert normalize_style("Bold Oblique") == 'bold_italic' and normalize_style("Book") == 'normal'
+    with tempfile.TemporaryDirectory() as tmp:
+        make_font_dir(tmp)
+        registry = FontRegistry([tmp])
+        assert registry.find_path("mono") == os.path.join(tmp, "mono.ttf")
+        assert registry.find_path("mono.ttf", "bold") == os.path.join(tmp, "mono.ttf")
+        assert registry.find_path("DejaVu Sans", "bold") == os.path.join(tmp, "brand_b.ttf")
+        assert registry.find_path("dejavu-sans") == os.path.join(tmp, "brand_r.ttf")
+        assert registry.find_path("DejaVuSans", "italic") == os.path.join(tmp, "brand_r.ttf")
+        assert registry.find_path("Missing") is None
+        assert registry.find_path("Missing") is None
+        assert registry.stats()['scans'] == 1 and registry.stats()['font_files'] == 3
+    print("  ✓ File names, styles and families resolved with one directory scan")
+
+
+def test_fonts_and_coverage():
+    """Loaded fonts are shared; fallbacks are chosen by unicode coverage."""
+    print("Testing font cache and coverage...")
+    if not os.path.isdir(DEJAVU_DIR):
+        print("  ⚠️ DejaVu fonts not found, skipping")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        make_font_dir(tmp)
+        registry = FontRegistry([tmp])
+        font = registry.get_font("mono", 24, fallbacks=["DejaVu Sans"], text="abc")
+        assert font.path == os.path.join(tmp, "mono.ttf")
+        assert registry.get_font("mono", 24, fallbacks=["DejaVu Sans"], text="xyz") is font
+        assert registry.get_font("mono", 32) is not font
+
+        # "Ǆ" is in DejaVu Sans but not in the monospace font
+        assert not registry.covers(os.path.join(tmp, "mono.ttf"), "Ǆ")
+        fallback = registry.get_font("mono", 24, fallbacks=["DejaVu Sans"], text="Ǆ x")
+        assert fallback.path == os.path.join(tmp, "brand_r.ttf")
+        # Nothing covers the text: the first installed font is used
+        assert registry.get_font("mono", 24, text="中") is font
+        assert FontRegistry([os.path.join(tmp, "empty")]).get_font("Missing", 24) is None
+
+        stats = registry.stats()
+        assert stats['font_loads'] == 3 and stats['font_hits'] == 2, stats
+    assert get_font_registry() is get_font_registry()
+    print(f"  ✓ {stats['font_loads']} fonts loaded, {stats['font_hits']} cache hits")
+
+
+if __name__ == "__main__":
+    test_resolution()
+    test_fonts_and_coverage()
+    print("\n✅ All font registry tests passed!")
+    sys.exit(0)
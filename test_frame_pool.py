@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Test FrameBufferPool and the pooled layer compositing helpers."""
+
+import sys
+
+import cv2
+import numpy as np
+
+from frame_pool import FrameBufferPool, white_frame_like
+from whiteboard_animator import (
+    apply_entrance_animation, apply_exit_animation, apply_path_animation,
+    blend_layer_into, content_bounds, content_mask
+)
+
+
+def test_pool_reuses_buffers():
+    """Released buffers are handed out again; foreign arrays are ignored."""
+    print("Testing FrameBufferPool reuse...")
+    pool = FrameBufferPool()
+    first = pool.white((4, 6, 3))
+    assert first.dtype == np.uint8 and (first == 255).all()
+    pool.release(first)
+
+    second = pool.acquire((4, 6, 3))
+    assert second is first, "Released buffer was not reused"
+    other = pool.acquire((4, 6), bool)
+    assert other is not first and pool.checked_out == 2
+
+    # Releasing unknown arrays, None or the same buffer twice is harmless
+    pool.release(np.zeros((4, 6, 3), dtype=np.uint8), None)
+    pool.release(second, other)
+    pool.release(second)
+    stats = pool.stats()
+    assert stats['allocations'] == 2 and stats['reuses'] == 1
+    assert stats['checked_out'] == 0 and stats['pooled'] == 2
+    assert (white_frame_like(np.zeros((2, 2, 3), np.uint8)) == 255).all()
+    print("  ✓ Buffers reused, counters consistent")
+
+
+def reference_blend(dst, layer, mask, opacity):
+    """The float blend the layered renderer used before pooling."""
+    mask_3d = np.stack([mask.astype(np.float32)] * 3, axis=2)
+    if opacity < 1.0:
+        blended = cv2.addWeighted(dst * mask_3d, 1 - opacity, layer * mask_3d, opacity, 0)
+        return (mask_3d * blended + (1 - mask_3d) * dst).astype(np.uint8)
+    return np.where(mask_3d > 0, layer, dst).astype(np.uint8)
+
+
+def test_blend_matches_reference():
+    """In-place blend matches the float blend (±1 from rounding)."""
+    print("Testing blend_layer_into...")
+    rng = np.random.default_rng(0)
+    dst = rng.integers(0, 256, (40, 60, 3), dtype=np.uint8)
+    layer = np.full_like(dst, 255)
+    layer[10:30, 20:50] = rng.integers(0, 200, (20, 30, 3))
+    pool = FrameBufferPool()
+    mask = content_mask(layer, pool)
+    assert np.array_equal(mask, np.any(layer < 250, axis=2))
+
+    for opacity in (1.0, 0.5, 0.3):
+        expected = reference_blend(dst, layer, mask, opacity)
+        result = blend_layer_into(dst.copy(), layer, mask, opacity, pool)
+        assert np.abs(result.astype(int) - expected).max() <= 1, f"opacity {opacity} differs"
+        assert np.array_equal(result[~mask], dst[~mask]), "Pixels outside the mask changed"
+    pool.release(mask)
+    assert pool.checked_out == 0
+    print("  ✓ Matches reference, only masked pixels change")
+
+
+def test_roi_blend_matches_full_frame():
+    """Blending only the content bounding box gives the full-frame result."""
+    print("Testing content bounding box compositing...")
+    rng = np.random.default_rng(1)
+    dst = rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+    layer = np.full_like(dst, 255)
+    cv2.putText(layer, "label", (40, 50), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (20, 40, 60), 2)
+    mask = content_mask(layer)
+    y1, y2, x1, x2 = content_bounds(mask)
+    assert mask[y1:y2, x1:x2].sum() == mask.sum()
+    assert (y2 - y1) * (x2 - x1) < mask.size // 4, "Bounding box not tight"
+    assert content_bounds(np.zeros((4, 4), bool)) is None
+
+    roi = (slice(y1, y2), slice(x1, x2))
+    for opacity in (1.0, 0.4):
+        full = blend_layer_into(dst.copy(), layer, mask, opacity)
+        cropped = dst.copy()
+        blend_layer_into(cropped[roi], layer[roi], mask[roi], opacity)
+        assert np.array_equal(full, cropped), f"ROI blend differs at opacity {opacity}"
+
+    # Path animation reports where it placed the layer; white everywhere else
+    path = {'type': 'linear', 'points': [[80, 45], [100, 60]]}
+    moved, bounds = apply_path_animation(layer, path, 3, 10, return_bounds=True)
+    py1, py2, px1, px2 = bounds
+    outside = np.ones(mask.shape, bool)
+    outside[py1:py2, px1:px2] = False
+    assert (moved[outside] == 255).all()
+    assert np.array_equal(moved, apply_path_animation(layer, path, 3, 10))
+    print(f"  ✓ {y2 - y1}x{x2 - x1} ROI instead of {mask.shape[0]}x{mask.shape[1]}")
+
+
+def test_animations_steady_state():
+    """Animation helpers allocate a bounded number of buffers over many frames."""
+    print("Testing pooled entrance/exit animations...")
+    frame = np.zeros((30, 40, 3), dtype=np.uint8)
+    pool = FrameBufferPool()
+    types = ['fade_in', 'slide_in_left', 'zoom_in', 'push_from_top']
+    exits = ['fade_out', 'slide_out_right', 'zoom_out']
+    for anim_type in types + exits:
+        config = {'type': anim_type, 'duration': 1.0}
+        for frame_idx in range(30):
+            if anim_type in exits:
+                result = apply_exit_animation(frame, config, frame_idx, 30, 30, pool=pool)
+                reference = apply_exit_animation(frame, config, frame_idx, 30, 30)
+            else:
+                result = apply_entrance_animation(frame, config, frame_idx, 30, 30, pool=pool)
+                reference = apply_entrance_animation(frame, config, frame_idx, 30, 30)
+            assert np.abs(result.astype(int) - reference).max() <= 1, f"{anim_type} differs"
+            pool.release(result)
+    stats = pool.stats()
+    assert stats['allocations'] == 1, stats
+    assert stats['checked_out'] == 0
+    print(f"  ✓ {stats['reuses']} reuses for {stats['allocations']} allocation")
+
+
+if __name__ == "__main__":
+    test_pool_reuses_buffers()
+    test_blend_matches_reference()
+    test_roi_blend_matches_full_frame()
+    test_animations_steady_state()
+    print("\n✅ All frame pool tests passed!")
+    sys.exit(0)
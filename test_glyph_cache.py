@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Test the glyph contour cache used by SVG path handwriting."""
+
+import os
+import sys
+import tempfile
+import threading
+
+from fontTools.pens.recordingPen import RecordingPen
+
+from font_registry import get_font_registry
+from glyph_cache import GlyphCache, flatten_glyph_commands
+from whiteboard_animator import convert_glyph_paths_to_points, extract_character_paths
+
+
+def find_font():
+    return get_font_registry().find_path('DejaVuSans')
+
+
+def reference_segments(commands, offset_x, offset_y, scale, font_size):
+    """Segments built straight from the pen commands (previous implementation)."""
+    segments = []
+    current = []
+    for command_type, coords in commands:
+        if command_type == 'moveTo':
+            if current:
+                segments.append(current)
+                current = []
+            x, y = coords[0]
+            current.append((int(offset_x + x * scale), int(offset_y + (font_size - y * scale))))
+        elif command_type == 'lineTo':
+            x, y = coords[0]
+            current.append((int(offset_x + x * scale), int(offset_y + (font_size - y * scale))))
+        elif command_type == 'qCurveTo':
+            for point in coords:
+                if isinstance(point, tuple) and len(point) == 2:
+                    x, y = point
+                    current.append((int(offset_x + x * scale), int(offset_y + (font_size - y * scale))))
+        elif command_type == 'closePath':
+            if current and len(current) > 1:
+                segments.append(current)
+                current = []
+    if current:
+        segments.append(current)
+    return segments
+
+
+def test_contours_match_pen_commands():
+    """Unit-scale contours scaled at layout give the same segments as the pen commands."""
+    print("Testing glyph flattening...")
+    cache = GlyphCache()
+    font_path = find_font()
+    if not font_path:
+        print("  ⚠️ DejaVuSans not found, skipping")
+        return
+    font = cache.font(font_path)
+    glyf_table = font['glyf']
+    cmap = font.getBestCmap()
+    for char in "aQ@&é8%":
+        pen = RecordingPen()
+        glyf_table[cmap[ord(char)]].draw(pen, glyf_table)
+        contours = flatten_glyph_commands(pen.value)
+        for font_size, offset in [(32, (20, 10)), (48, (101.5, 37))]:
+            scale = font_size / 1000.0
+            scaled = [[(int(offset[0] + x * scale), int(offset[1] + (font_size - y * scale))) for x, y in contour]
+                      for contour in contours]
+            assert scaled == reference_segments(pen.value, offset[0], offset[1], scale, font_size), char
+    print("  ✓ Same segments as the pen commands")
+
+
+def test_fonts_parsed_once():
+    """A font is parsed once per process; repeated text only hits the cache."""
+    print("Testing in-memory glyph cache...")
+    cache = GlyphCache()
+    font_path = find_font()
+    if not font_path:
+        print("  ⚠️ DejaVuSans not found, skipping")
+        return
+    first = cache.text_contours(font_path, "Hello World")
+    second = cache.text_contours(font_path, "Hello\nWorld")
+    assert first is second
+    assert first['l'] and first['W']
+    stats = cache.stats()
+    assert stats['fonts_parsed'] == 1 and stats['misses'] == 7, stats
+    assert stats['hits'] == 3 + 10, stats
+
+    # A character missing from the font maps to None and is skipped at layout
+    assert cache.text_contours(font_path, "中")["中"] is None
+    char_paths = extract_character_paths("a中 b", font_path, 32)
+    assert [c['char'] for c in char_paths] == ['a', ' ', 'b']
+    print(f"  ✓ {stats['misses']} glyphs flattened, {stats['hits']} cache hits, 1 font parse")
+
+
+def test_disk_cache():
+    """A second process-like cache reads contours from disk without parsing the font."""
+    print("Testing on-disk glyph cache...")
+    font_path = find_font()
+    if not font_path:
+        print("  ⚠️ DejaVuSans not found, skipping")
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = GlyphCache(tmp)
+        expected = dict(writer.text_contours(font_path, "Brand Font 2024"))
+        files = os.listdir(tmp)
+        assert len(files) == 1 and files[0] == f"glyphs_{writer.font_hash(font_path)}.json"
+
+        reader = GlyphCache(tmp)
+        contours = reader.text_contours(font_path, "Brand 2024")
+        assert reader.stats()['fonts_parsed'] == 0 and reader.stats()['disk_loads'] == 1
+        assert all(contours[c] == expected[c] for c in "Brand2024")
+
+        # Layout from disk-cached contours matches a fresh extraction
+        config = {'text': "Brand 2024", 'align': 'center'}
+        segments = convert_glyph_paths_to_points(
+            extract_character_paths("Brand 2024", font_path, 40), 40, config, 640, 360
+        )
+        assert segments[0], "No segments produced"
+
+    # Writers missing the same font at once each write their own temporary file
+    with tempfile.TemporaryDirectory() as tmp:
+        writers = [threading.Thread(target=GlyphCache(tmp).text_contours, args=(font_path, "Brand Font 2024"))
+                   for _ in range(8)]
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        assert os.listdir(tmp) == [f"glyphs_{GlyphCache().font_hash(font_path)}.json"]
+        reader = GlyphCache(tmp)
+        assert reader.text_contours(font_path, "Brand 2024")['B'] == expected['B']
+        assert reader.stats()['disk_loads'] == 1
+    print("  ✓ Contours reloaded from disk, font not parsed")
+
+
+if __name__ == "__main__":
+    test_contours_match_pen_commands()
+    test_fonts_parsed_once()
+    test_disk_cache()
+    print("\n✅ All glyph cache tests passed!")
+    sys.exit(0)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test that HandCompositor produces the same frames as draw_hand_on_img."""
+
+import sys
+import numpy as np
+
+from whiteboard_animator import HandCompositor, draw_hand_on_img
+
+
+def create_test_hand(height=40, width=30):
+    """Create a hand image with a binary mask (like data/images/hand-mask.png)."""
+    rng = np.random.default_rng(1)
+    hand_mask = np.zeros((height, width), dtype=np.uint8)
+    hand_mask[5:35, 3:27] = 255
+    hand = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    hand[hand_mask == 0] = [0, 0, 0]
+    hand_mask_inv = (255 - hand_mask) / 255
+    return hand, hand_mask_inv
+
+
+def test_compositor_matches_draw_hand():
+    """Compositing at successive positions matches a full redraw of each frame."""
+    print("Testing HandCompositor against draw_hand_on_img...")
+    rng = np.random.default_rng(0)
+    img_ht, img_wd = 120, 160
+    source = rng.integers(0, 256, (img_ht, img_wd, 3), dtype=np.uint8)
+    canvas = np.full((img_ht, img_wd, 3), 255, dtype=np.uint8)
+    hand, hand_mask_inv = create_test_hand()
+    hand_ht, hand_wd = hand.shape[:2]
+
+    compositor = HandCompositor(canvas, hand, hand_mask_inv)
+
+    # Reveal 10x10 tiles, emitting a frame every third tile; the last tiles
+    # push the hand past the bottom-right border so it gets cropped
+    tiles = [(r, c) for r in range(0, img_ht, 10) for c in range(0, img_wd, 10)]
+    for step, (y, x) in enumerate(tiles, start=1):
+        canvas[y:y + 10, x:x + 10] = source[y:y + 10, x:x + 10]
+        compositor.mark_dirty(y, y + 10, x, x + 10)
+        if step % 3 != 0:
+            continue
+
+        expected = draw_hand_on_img(
+            canvas.copy(), hand.copy(), x + 5, y + 5, hand_mask_inv.copy(),
+            hand_ht, hand_wd, img_ht, img_wd
+        )
+        frame = compositor.compose(x + 5, y + 5)
+        assert np.array_equal(frame, expected), f"Frame mismatch at tile ({y}, {x})"
+
+    print(f"  ✓ {len(tiles) // 3} composited frames identical")
+
+
+def test_compositor_without_overlay():
+    """Without an overlay the buffer simply tracks the canvas."""
+    print("Testing HandCompositor without overlay (static mode)...")
+    canvas = np.full((50, 50, 3), 255, dtype=np.uint8)
+    compositor = HandCompositor(canvas)
+
+    canvas[10:20, 10:20] = 0
+    compositor.mark_dirty(10, 20, 10, 20)
+    frame = compositor.compose()
+
+    assert np.array_equal(frame, canvas), "Static frame does not match canvas"
+    assert frame is not canvas, "Compositor must not hand out the canvas itself"
+    print("  ✓ Static frame matches canvas")
+
+
+if __name__ == "__main__":
+    test_compositor_matches_draw_hand()
+    test_compositor_without_overlay()
+    print("\n✅ All hand compositor tests passed!")
+    sys.exit(0)
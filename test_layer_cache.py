@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Test the rendered text/shape layer cache."""
+
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+
+from layer_cache import LayerRasterCache, get_layer_cache, layer_cache_key
+from whiteboard_animator import render_layer_raster, render_shape_to_image, render_text_to_image
+
+
+def test_keys_are_canonical():
+    """Key order does not matter; content, size and extra inputs do."""
+    print("Testing layer cache keys...")
+    a = {'text': "Hello", 'size': 32, 'text_effects': {'shadow': {'offset': [2, 2]}}}
+    b = {'text_effects': {'shadow': {'offset': [2, 2]}}, 'size': 32, 'text': "Hello"}
+    assert layer_cache_key('text', a, 640, 360) == layer_cache_key('text', b, 640, 360)
+    assert layer_cache_key('text', a, 640, 360) != layer_cache_key('text', a, 360, 640)
+    assert layer_cache_key('text', a, 640, 360) != layer_cache_key('shape', a, 640, 360)
+    assert layer_cache_key('text', a, 640, 360) != layer_cache_key('text', dict(a, size=33), 640, 360)
+    assert layer_cache_key('text', a, 640, 360, ['x.ttf']) != layer_cache_key('text', a, 640, 360, ['y.ttf'])
+    print("  ✓ Canonical JSON keys")
+
+
+def test_memory_cache():
+    """Repeated layers are rendered once; callers get independent copies."""
+    print("Testing in-memory layer cache...")
+    cache = LayerRasterCache(max_memory_mb=1)
+    calls = []
+
+    def render(config, width, height):
+        calls.append(config['shape'])
+        return np.full((height, width, 3), 255, dtype=np.uint8)
+
+    first = cache.render('shape', {'shape': 'circle'}, 320, 180, render)
+    first[:] = 0  # Callers may draw on their copy
+    second = cache.render('shape', {'shape': 'circle'}, 320, 180, render)
+    assert (second == 255).all() and calls == ['circle']
+
+    # 1 MB holds 6 entries of 320x180x3; the least recently used is evicted
+    for shape in ['a', 'b', 'c', 'd', 'e', 'f']:
+        cache.render('shape', {'shape': shape}, 320, 180, render)
+    cache.render('shape', {'shape': 'circle'}, 320, 180, render)
+    assert calls.count('circle') == 2
+    stats = cache.stats()
+    assert stats['hits'] == 1 and stats['misses'] == 8 and stats['entries'] == 6, stats
+    print(f"  ✓ {stats['hits']} hit, {stats['misses']} misses, {stats['memory_mb']} MB kept")
+
+
+def test_disk_cache():
+    """Entries written to the cache directory are reused by a new cache."""
+    print("Testing on-disk layer cache...")
+    with tempfile.TemporaryDirectory() as tmp:
+        config = {'shape': 'rectangle', 'width': 120, 'height': 60, 'fill_color': '#3366CC'}
+        writer = LayerRasterCache(tmp)
+        expected = writer.render('shape', config, 320, 180, render_shape_to_image)
+        assert len([f for f in os.listdir(tmp) if f.endswith('.npy')]) == 1
+
+        def fail(*args):
+            raise AssertionError("Layer rendered again")
+
+        reader = LayerRasterCache(tmp)
+        image = reader.render('shape', config, 320, 180, fail)
+        assert np.array_equal(image, expected)
+        assert reader.stats()['disk_hits'] == 1 and reader.stats()['misses'] == 0
+
+    # Workers rendering the same layer at once each write their own temporary file
+    with tempfile.TemporaryDirectory() as tmp:
+        writers = [threading.Thread(target=LayerRasterCache(tmp).render,
+                                    args=('shape', config, 320, 180, render_shape_to_image))
+                   for _ in range(8)]
+        for thread in writers:
+            thread.start()
+        for thread in writers:
+            thread.join()
+        assert os.listdir(tmp) == [f"layer_{layer_cache_key('shape', config, 320, 180)}.npy"]
+        assert np.array_equal(LayerRasterCache(tmp).render('shape', config, 320, 180, fail), expected)
+    print("  ✓ Layer reloaded from disk without rendering")
+
+
+def test_render_layer_raster():
+    """Cached text and shape layers match direct rendering."""
+    print("Testing render_layer_raster...")
+    text_config = {'text': "Cached\nlayer", 'size': 40, 'font': 'DejaVuSans', 'align': 'center'}
+    shape_config = {'shape': 'circle', 'color': '#FF0000', 'size': 50}
+    before = get_layer_cache().stats()
+    for _ in range(3):
+        assert np.array_equal(render_layer_raster('text', text_config, 320, 180),
+                              render_text_to_image(text_config, 320, 180))
+        assert np.array_equal(render_layer_raster('shape', shape_config, 320, 180),
+                              render_shape_to_image(shape_config, 320, 180))
+    after = get_layer_cache().stats()
+    assert after['misses'] - before['misses'] == 2 and after['hits'] - before['hits'] == 4
+    print("  ✓ Same pixels, 2 renders for 6 layers")
+
+
+if __name__ == "__main__":
+    test_keys_are_canonical()
+    test_memory_cache()
+    test_disk_cache()
+    test_render_layer_raster()
+    print("\n✅ All layer cache tests passed!")
+    sys.exit(0)
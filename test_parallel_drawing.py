@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Test frame-parallel rendering of the drawing phase (--frame-workers)."""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from frame_sink import PYAV_AVAILABLE
+from whiteboard_animator import (
+    AllVariables, HandCompositor, draw_whiteboard_animations, emitted_tile_steps,
+    find_dark_tiles, hand_mask_path, hand_path,
+    plan_tile_drawing_order, replay_tile_order, reveal_tiles, split_tile_steps
+)
+
+
+def make_scene(seed=0):
+    """Random line-art image, tile order and a small synthetic hand."""
+    rng = np.random.default_rng(seed)
+    img = np.full((90, 130, 3), 255, dtype=np.uint8)
+    img[rng.random((90, 130)) < 0.01] = (0, 0, 0)
+    tiles, grid_shape = find_dark_tiles(img[:, :, 0], 7)
+    tile_order = plan_tile_drawing_order(tiles, grid_shape)
+    hand = rng.integers(0, 256, (20, 15, 3), dtype=np.uint8)
+    hand_mask_inv = (rng.random((20, 15)) < 0.5).astype(np.float64)
+    return img, tile_order, hand, hand_mask_inv
+
+
+def render_range(img, tile_order, tile_start, tile_end, hand, hand_mask_inv, skip_rate):
+    canvas = np.full(img.shape, 255, dtype=np.uint8)
+    reveal_tiles(canvas, img, tile_order[:tile_start], 7)
+    compositor = HandCompositor(canvas, hand, hand_mask_inv)
+    return [
+        frame.copy() for _, frame, _, _ in replay_tile_order(
+            canvas, img, tile_order, tile_start, tile_end, 7, skip_rate, compositor
+        )
+    ]
+
+
+def test_emitted_steps():
+    """Frames are emitted every skip_rate tiles and after the last tile."""
+    print("Testing emitted tile steps...")
+    assert emitted_tile_steps(10, 3) == [2, 5, 8, 9]
+    assert emitted_tile_steps(9, 3) == [2, 5, 8]
+    assert emitted_tile_steps(2, 5) == [1]
+    assert emitted_tile_steps(0, 5) == []
+    assert split_tile_steps([2, 5, 8, 9], 10, 2) == [0, 6, 10]
+    assert split_tile_steps([2], 3, 4) == [0, 3]
+    print("  ✓ Steps and chunk boundaries")
+
+
+def test_chunks_match_sequential():
+    """Chunks rebuilt from the revealed tiles produce exactly the sequential frames."""
+    print("Testing chunked replay against sequential replay...")
+    img, tile_order, hand, hand_mask_inv = make_scene()
+    n_tiles = len(tile_order)
+    for skip_rate in (1, 4, 9):
+        expected = render_range(img, tile_order, 0, n_tiles, hand, hand_mask_inv, skip_rate)
+        boundaries = split_tile_steps(emitted_tile_steps(n_tiles, skip_rate), n_tiles, 5)
+        chunked = []
+        for tile_start, tile_end in zip(boundaries, boundaries[1:]):
+            chunked.extend(render_range(img, tile_order, tile_start, tile_end, hand, hand_mask_inv, skip_rate))
+        assert len(chunked) == len(expected), f"skip_rate={skip_rate}: frame count differs"
+        assert all(np.array_equal(a, b) for a, b in zip(chunked, expected)), f"skip_rate={skip_rate}: frames differ"
+        print(f"  ✓ skip_rate={skip_rate}: {len(expected)} identical frames in {len(boundaries) - 1} chunks")
+
+
+def test_frame_workers_render():
+    """draw_whiteboard_animations with frame_workers writes the same frames and JSON data."""
+    print("Testing draw_whiteboard_animations with frame_workers...")
+    if not PYAV_AVAILABLE:
+        print("  ⚠️ PyAV not installed, skipping")
+        return
+
+    import av
+    from frame_sink import create_frame_sink
+
+    img = make_scene(1)[0]
+    with tempfile.TemporaryDirectory() as tmp:
+        results = []
+        for workers in (1, 3):
+            path = os.path.join(tmp, f"workers{workers}.mp4")
+            variables = AllVariables(
+                frame_rate=30, resize_wd=130, resize_ht=90, split_len=7, object_skip_rate=4,
+                bg_object_skip_rate=20, end_gray_img_duration_in_sec=2, export_json=True,
+                crf=0, frame_workers=workers
+            )
+            # Lossless encoding so both videos can be compared exactly
+            sink = create_frame_sink(path, 30, 130, 90, crf=0, segmented=workers > 1)
+            draw_whiteboard_animations(img, None, hand_path, hand_mask_path, path, variables, frame_sink=sink)
+            frames_data = variables.animation_data["frames_written"]
+            with av.open(path) as container:
+                frames = [frame.to_ndarray(format='bgr24') for frame in container.decode(video=0)]
+            results.append((variables.frames_written, frames_data, frames))
+        assert sorted(os.listdir(tmp)) == ["workers1.mp4", "workers3.mp4"], \
+            "Temporary segments left behind"
+
+    (seq_count, seq_data, seq_frames), (par_count, par_data, par_frames) = results
+    assert seq_count == par_count == len(seq_frames) == len(par_frames) == 60
+    assert seq_data == par_data, "JSON frame data differs"
+    assert all(np.array_equal(a, b) for a, b in zip(seq_frames, par_frames)), "Frames differ"
+    print(f"  ✓ {par_count} identical frames, same JSON data")
+
+
+if __name__ == "__main__":
+    test_emitted_steps()
+    test_chunks_match_sequential()
+    test_frame_workers_render()
+    print("\n✅ All parallel drawing tests passed!")
+    sys.exit(0)
@@ -8,7 +8,9 @@ import os
 import sys
 import cv2
 import numpy as np
-from particle_system import ParticleSystem, apply_particle_effect
+from particle_system import (
+    ArrayParticleEmitter, ParticleEmitter, ParticleSystem, ParticleEffectRunner, apply_particle_effect
+)
 
 def test_particle_rendering():
     """Test particle rendering to images."""
@@ -141,9 +143,120 @@ def test_particle_rendering():
     
     return True
 
+def test_effect_runner():
+    """Test that the stateful runner matches a replay of the same seeded effect."""
+    print("\nTesting ParticleEffectRunner...")
+    frame = np.ones((240, 320, 3), dtype=np.uint8) * 255
+    
+    for effect_type in ['confetti', 'sparkle', 'smoke', 'explosion', 'magic']:
+        config = {"type": effect_type, "position": [160, 120], "duration": 1.0}
+        runner = ParticleEffectRunner(config, frame.shape, 30)
+        for i in range(12):
+            streamed = runner.render_next(frame)
+            replayed = apply_particle_effect(frame, config, i, 12, 30)
+            assert np.array_equal(streamed, replayed), f"{effect_type}: frame {i} differs"
+        print(f"   ✅ {effect_type}: streamed frames match replayed frames")
+    
+    # Seeking backward and forward reproduces the same frames
+    config = {"type": "sparkle", "position": [160, 120], "duration": 2.0}
+    runner = ParticleEffectRunner(config, frame.shape, 30)
+    frames = [runner.render_next(frame) for _ in range(20)]
+    runner.seek(5)
+    assert np.array_equal(runner.render_next(frame), frames[5]), "Backward seek differs"
+    runner.seek(15)
+    assert np.array_equal(runner.render_next(frame), frames[15]), "Forward seek differs"
+    print("   ✅ seek() resumes at the same simulation state")
+    
+    # The config seed changes the effect
+    seeded = ParticleEffectRunner(dict(config, seed=7), frame.shape, 30)
+    seeded.seek(19)
+    assert not np.array_equal(seeded.render_next(frame), frames[19]), "Seed is ignored"
+    print("   ✅ particle_effect 'seed' is honoured")
+    
+    # Unknown effect types leave the frame unchanged
+    unknown = ParticleEffectRunner({"type": "unknown"}, frame.shape, 30)
+    assert np.array_equal(unknown.render_next(frame), frame)
+    return True
+
+
+def test_array_emitter():
+    """Test that the array-backed emitter follows the Particle physics."""
+    print("\nTesting ArrayParticleEmitter...")
+    emitter = ArrayParticleEmitter(
+        position=(160, 120), emission_rate=0, particle_lifetime=1.0,
+        direction=90, spread=360, speed=(50, 150), sizes=(3, 9),
+        shapes=['circle', 'square', 'star', 'triangle'], gravity=120
+    )
+    emitter.burst_mode = True
+    emitter.emit_burst(200)
+    assert emitter.particle_count == 200
+    
+    # Same physics as updating Particle objects one by one
+    reference = emitter.particles
+    dt = 1.0 / 30
+    for _ in range(10):
+        emitter.update(dt)
+        for particle in reference:
+            particle.update(dt)
+    for particle, updated in zip(reference, emitter.particles):
+        assert abs(particle.x - updated.x) < 1e-9 and abs(particle.y - updated.y) < 1e-9
+        assert abs(particle.vy - updated.vy) < 1e-9
+        assert abs(particle.rotation - updated.rotation) < 1e-9
+    print("   ✅ Vectorized update matches Particle.update")
+    
+    # Rendering draws dark outlines and leaves the rest of the frame white
+    frame = np.ones((240, 320, 3), dtype=np.uint8) * 255
+    emitter.render(frame)
+    assert frame.min() == 0, "Particles were not drawn"
+    assert (frame == 255).mean() > 0.5, "Particles cover too much of the frame"
+    
+    # Dead particles are compacted
+    for _ in range(30):
+        emitter.update(dt)
+    assert emitter.particle_count == 0, "Dead particles were not removed"
+    print("   ✅ Dead particles removed")
+    
+    # Presets and JSON configs build array-backed systems
+    system = ParticleSystem.create_custom_particle_system({
+        "emitters": [{"position": [100, 100], "emission_rate": 30, "shapes": ["star"]}]
+    })
+    assert isinstance(system.emitters[0], ArrayParticleEmitter)
+    for _ in range(10):
+        system.update()
+    assert len(system.emitters[0].particles) > 0
+    print("   ✅ Custom JSON config uses the array engine")
+    return True
+
+
+def test_array_emitter_large_sizes():
+    """Large particles keep their outline thickness (size / 4) in the array engine."""
+    print("\nTesting ArrayParticleEmitter with large particles...")
+    for size in (70, 100):
+        for shape in ('circle', 'square'):
+            kwargs = dict(position=(200, 200), emission_rate=0, particle_lifetime=1.0,
+                          speed=(0, 0), sizes=(size, size), shapes=[shape])
+            array_emitter = ArrayParticleEmitter(**kwargs)
+            array_emitter.emit_burst(1)
+            array_emitter.angular_velocity[:] = 0
+            reference_emitter = ParticleEmitter(**kwargs)
+            reference_emitter.emit_burst(1)
+            reference_emitter.particles[0].angular_velocity = 0
+            
+            drawn = []
+            for emitter in (array_emitter, reference_emitter):
+                frame = np.full((400, 400, 3), 255, dtype=np.uint8)
+                emitter.render(frame)
+                drawn.append(int((frame[:, :, 0] < 128).sum()))
+            # Circles are 16-sided polygons in the array engine
+            assert abs(drawn[0] - drawn[1]) < 0.1 * drawn[1], (size, shape, drawn)
+    print("   ✅ Outline thickness matches ParticleEmitter for sizes >= 64")
+    return True
+
+
 if __name__ == "__main__":
     try:
-        success = test_particle_rendering()
+        success = (test_particle_rendering() and test_effect_runner() and test_array_emitter()
+                   and test_array_emitter_large_sizes())
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
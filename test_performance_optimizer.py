@@ -4,6 +4,7 @@ Test script for performance optimizer module.
 Tests all major features without requiring video rendering.
 """
 
+import argparse
 import sys
 import json
 import time
@@ -18,7 +19,9 @@ from performance_optimizer import (
     ProgressTracker,
     RenderQueue,
     parse_quality_preset,
-    create_batch_config
+    create_batch_config,
+    plan_batch_jobs,
+    process_batch
 )
 
 
@@ -227,6 +230,42 @@ def test_batch_config():
     print("✅ Batch Config tests passed!\n")
 
 
+def test_batch_processing():
+    """Test batch job planning and failure isolation."""
+    print("Testing Batch Processing...")
+    import shutil
+    import tempfile
+    
+    render_args = argparse.Namespace(quality_preset="draft", config=None, output_dir=None)
+    jobs = plan_batch_jobs(["a/video.json", "b/video.json", "intro.json"], "./out", render_args)
+    assert [Path(job['output_dir']).name for job in jobs] == ["video", "video_1", "intro"], "Job directories must be unique"
+    assert jobs[0]['argv'] == ["--config", "a/video.json", "--output-dir", jobs[0]['output_dir']]
+    assert vars(jobs[1]['args']) == {'quality_preset': "draft", 'config': "b/video.json",
+                                     'output_dir': jobs[1]['output_dir']}
+    assert render_args.config is None, "Shared arguments must not be modified"
+    print("  ✓ One output directory per job")
+    
+    # Neither config can render: each failure is reported without stopping the batch
+    tmp = tempfile.mkdtemp()
+    try:
+        empty_config = str(Path(tmp) / "empty.json")
+        with open(empty_config, 'w') as f:
+            json.dump({"slides": []}, f)
+        missing_config = str(Path(tmp) / "missing.json")
+        
+        output_dir = str(Path(tmp) / "out")
+        results = process_batch([empty_config, missing_config], parallel=True, max_workers=2, output_dir=output_dir)
+        assert [r['config_file'] for r in results] == [empty_config, missing_config], "Results must follow input order"
+        assert all(r['status'] == 'failed' and r['error'] for r in results), "Jobs should fail"
+        assert Path(results[0]['log_file']).exists(), "Job log not written"
+        assert (Path(output_dir) / "batch_summary.json").exists(), "Summary not written"
+    finally:
+        shutil.rmtree(tmp)
+    print("  ✓ Failed jobs reported with logs and summary")
+    
+    print("✅ Batch Processing tests passed!\n")
+
+
 def main():
     """Run all tests."""
     print("="*60)
@@ -241,6 +280,7 @@ def main():
         test_performance_optimizer()
         test_quality_presets()
         test_batch_config()
+        test_batch_processing()
         
         print("="*60)
         print("✅ All tests passed successfully!")
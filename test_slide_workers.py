@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test parallel slide rendering (--slide-workers) in process_multiple_images."""
+
+import os
+import sys
+import tempfile
+
+import cv2
+import numpy as np
+
+from whiteboard_animator import process_multiple_images
+
+
+def make_slides(tmp, count):
+    """Write small slides with a distinct rectangle each."""
+    paths = []
+    for i in range(count):
+        image = np.full((120, 160, 3), 255, dtype=np.uint8)
+        cv2.rectangle(image, (20 + i * 10, 20), (80 + i * 10, 90), (0, 0, 0), 3)
+        path = os.path.join(tmp, f"slide{i}.png")
+        cv2.imwrite(path, image)
+        paths.append(path)
+    return paths
+
+
+def count_frames(path):
+    cap = cv2.VideoCapture(path)
+    frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return frames
+
+
+def render(image_paths, save_path, slide_workers):
+    return process_multiple_images(
+        image_paths, 10, 30, 8, 20, 1, transition='fade', transition_duration=0.2,
+        save_path=save_path, slide_workers=slide_workers
+    )
+
+
+def test_parallel_matches_sequential():
+    """Parallel rendering produces the same combined video length as sequential."""
+    print("Testing --slide-workers...")
+    with tempfile.TemporaryDirectory() as tmp:
+        image_paths = make_slides(tmp, 3)
+        # A missing slide is reported and skipped in both modes
+        image_paths.insert(1, os.path.join(tmp, "missing.png"))
+
+        sequential = render(image_paths, os.path.join(tmp, "seq"), 1)
+        parallel = render(image_paths, os.path.join(tmp, "par"), 3)
+
+        assert sequential["status"] and parallel["status"]
+        assert sequential["videos_generated"] == parallel["videos_generated"] == 3
+        seq_frames = count_frames(sequential["message"])
+        par_frames = count_frames(parallel["message"])
+        assert seq_frames == par_frames, f"{seq_frames} != {par_frames} frames"
+    print(f"  ✓ {par_frames} frames in both modes")
+
+
+if __name__ == "__main__":
+    test_parallel_matches_sequential()
+    print("\n✅ All slide worker tests passed!")
+    sys.exit(0)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test that the precomputed tile drawing order matches the original greedy loop."""
+
+import sys
+import math
+import numpy as np
+
+from whiteboard_animator import euc_dist, find_dark_tiles, plan_tile_drawing_order
+
+
+def legacy_tile_order(img_thresh, split_len, black_pixel_threshold=10):
+    """Reference implementation: the original selection loop of draw_masked_object."""
+    height, width = img_thresh.shape
+    n_cuts_vertical = int(math.ceil(height / split_len))
+    n_cuts_horizontal = int(math.ceil(width / split_len))
+
+    cut_black_indices = []
+    for i in range(n_cuts_vertical):
+        for j in range(n_cuts_horizontal):
+            tile = img_thresh[i * split_len:(i + 1) * split_len, j * split_len:(j + 1) * split_len]
+            if np.sum(tile < black_pixel_threshold) > 0:
+                cut_black_indices.append((i, j))
+    cut_black_indices = np.array(cut_black_indices)
+
+    order = []
+    selected_ind = 0
+    while len(cut_black_indices) > 0:
+        selected_ind_val = cut_black_indices[selected_ind].copy()
+        order.append(tuple(selected_ind_val))
+        cut_black_indices = np.delete(cut_black_indices, selected_ind, axis=0)
+        if len(cut_black_indices) > 0:
+            selected_ind = np.argmin(euc_dist(cut_black_indices, selected_ind_val))
+    return order
+
+
+def make_test_image(height, width, density, seed):
+    """Create a thresholded image with random dark strokes."""
+    rng = np.random.default_rng(seed)
+    img = np.full((height, width), 255, dtype=np.uint8)
+    img[rng.random((height, width)) < density] = 0
+    return img
+
+
+def test_dark_tile_detection():
+    """Dark tiles (including smaller border tiles) are found in row-major order."""
+    print("Testing dark tile detection...")
+    img = np.full((50, 70), 255, dtype=np.uint8)
+    img[0, 0] = 0
+    img[49, 69] = 0   # Bottom-right border tile (smaller than split_len)
+    img[20, 35] = 5
+
+    tiles, grid_shape = find_dark_tiles(img, 15)
+    assert grid_shape == (4, 5), f"Unexpected grid shape {grid_shape}"
+    assert [tuple(t) for t in tiles] == [(0, 0), (1, 2), (3, 4)], f"Unexpected tiles {tiles}"
+    print("  ✓ Dark tiles detected correctly")
+
+
+def test_order_matches_legacy():
+    """The planned order is identical to the original greedy selection."""
+    print("Testing tile order against the original algorithm...")
+    cases = [
+        (120, 160, 0.002, 10),
+        (180, 320, 0.0005, 15),
+        (240, 240, 0.05, 8),
+        (97, 131, 0.01, 7),   # Uneven border tiles
+        (300, 400, 0.0001, 5),  # Very sparse: long jumps between tiles
+    ]
+    for seed, (height, width, density, split_len) in enumerate(cases):
+        img = make_test_image(height, width, density, seed)
+        expected = legacy_tile_order(img, split_len)
+
+        tiles, grid_shape = find_dark_tiles(img, split_len)
+        planned = [tuple(t) for t in plan_tile_drawing_order(tiles, grid_shape)]
+
+        assert planned == expected, f"Order mismatch for {height}x{width}, split_len={split_len}"
+        print(f"  ✓ {height}x{width}, split_len={split_len}: {len(planned)} tiles in identical order")
+
+
+def test_empty_image():
+    """A blank image yields an empty plan."""
+    print("Testing empty image...")
+    img = np.full((60, 60), 255, dtype=np.uint8)
+    tiles, grid_shape = find_dark_tiles(img, 15)
+    order = plan_tile_drawing_order(tiles, grid_shape)
+    assert len(order) == 0, "Expected no tiles for a blank image"
+    print("  ✓ No tiles planned")
+
+
+if __name__ == "__main__":
+    test_dark_tile_detection()
+    test_order_matches_legacy()
+    test_empty_image()
+    print("\n✅ All tile ordering tests passed!")
+    sys.exit(0)
@@ -14,10 +14,13 @@ Tests cover:
 
 import json
 import sys
+from dataclasses import FrozenInstanceError
+import numpy as np
 from timeline_system import (
     GlobalTimeline, Keyframe, TimeMarker, SyncPoint, LoopSegment,
     KeyframeInterpolation, PropertyTrack, TimeRemapping,
-    apply_easing, interpolate_values
+    apply_easing, apply_easing_array, interpolate_values,
+    CubicBezierEasing, cubic_bezier, cubic_bezier_array
 )
 
 
@@ -335,6 +338,135 @@ def test_step_interpolation():
     print("✅ Step interpolation test passed")
 
 
+def linear_scan_value(keyframes, time):
+    """Reference lookup: scan every keyframe (previous implementation)."""
+    if time < keyframes[0].time:
+        return keyframes[0].value
+    for kf in keyframes:
+        if abs(time - kf.time) < 0.0001:
+            return kf.value
+    if time > keyframes[-1].time:
+        return keyframes[-1].value
+    for kf1, kf2 in zip(keyframes, keyframes[1:]):
+        if kf1.time < time < kf2.time:
+            if kf1.interpolation == KeyframeInterpolation.STEP:
+                return kf1.value
+            progress = (time - kf1.time) / (kf2.time - kf1.time)
+            eased = apply_easing(progress, kf1.interpolation, kf1.bezier_handles)
+            return interpolate_values(kf1.value, kf2.value, eased)
+    return keyframes[-1].value
+
+
+def test_compiled_track():
+    """Test binary-search lookup against a linear scan of the keyframes."""
+    print("Testing compiled track lookup...")
+    
+    track = PropertyTrack("zoom")
+    # Added out of order, with a duplicate time and keyframes closer than the tolerance
+    for time, value, interp in [(2.0, 3, "ease_in_out"), (0.0, 1, "linear"), (1.0, 2.0, "ease_out_cubic"),
+                                (2.0, 5, "step"), (3.0, 4.0, "bezier"), (3.00005, 6.0, "ease_in"), (4.0, 1.5, "ease_out")]:
+        track.add_keyframe(time, value, KeyframeInterpolation(interp),
+                           (0.42, 0.0, 0.58, 1.0) if interp == "bezier" else None)
+    assert [kf.time for kf in track.keyframes] == [0.0, 1.0, 2.0, 2.0, 3.0, 3.00005, 4.0]
+    assert [kf.value for kf in track.keyframes][2:4] == [3, 5]
+    
+    times = [i / 30 for i in range(-10, 150)] + [2.00009, 2.99995, 3.0001, 3.00016]
+    expected = [linear_scan_value(track.keyframes, t) for t in times]
+    assert [track.get_value_at_time(t) for t in times] == expected
+    assert np.array_equal(track.sample(times), np.array(expected, dtype=float))
+    
+    # Easing formulas match element-wise
+    progress = np.linspace(0, 1, 11)
+    for interp in KeyframeInterpolation:
+        handles = (0.25, 0.1, 0.25, 1.0) if interp == KeyframeInterpolation.BEZIER else None
+        assert apply_easing_array(progress, interp, handles).tolist() == \
+            [apply_easing(p, interp, handles) for p in progress.tolist()], interp
+    
+    # Compiled track is rebuilt when keyframes change
+    track.add_keyframe(5.0, 10.0)
+    assert track.get_value_at_time(4.5) == 1.5 + (10.0 - 1.5) * apply_easing(0.5, KeyframeInterpolation.EASE_OUT)
+    track.keyframes = track.keyframes[:2]
+    assert track.get_value_at_time(5.0) == 2.0
+    
+    # ...and when a keyframe is edited through the track
+    track.update_keyframe(1, value=4.0)
+    assert track.get_value_at_time(5.0) == 4.0
+    track.update_keyframe(1, time=2.0)
+    assert track.get_value_at_time(1.0) == 2.5
+    track.update_keyframe(0, interpolation=KeyframeInterpolation.STEP)
+    assert track.get_value_at_time(1.0) == 1
+    track.update_keyframe(0, time=3.0)
+    assert [kf.time for kf in track.keyframes] == [2.0, 3.0]
+    try:
+        track.keyframes[0].value = 0.0
+        assert False, "Keyframes should be immutable"
+    except FrozenInstanceError:
+        pass
+    
+    # Keyframes created elsewhere do not invalidate the track
+    compiled = track.compile()
+    Keyframe(0.0, 1.0)
+    assert track.compile() is compiled
+    
+    print("✅ Compiled track test passed")
+
+
+def test_timeline_sample():
+    """Test batch evaluation of several properties over all frames."""
+    print("Testing timeline batch sampling...")
+    
+    timeline = GlobalTimeline(duration=4.0, frame_rate=30)
+    timeline.add_keyframe("camera.zoom", 0.0, 1.0, KeyframeInterpolation.EASE_IN_OUT)
+    timeline.add_keyframe("camera.zoom", 2.0, 2.0)
+    timeline.add_keyframe("layer.0.position", 0.0, {'x': 0, 'y': 0}, KeyframeInterpolation.EASE_OUT)
+    timeline.add_keyframe("layer.0.position", 4.0, {'x': 100, 'y': 50})
+    timeline.add_keyframe("layer.0.state", 1.0, "hidden", KeyframeInterpolation.STEP)
+    timeline.add_keyframe("layer.0.state", 3.0, "visible")
+    
+    frame_times = np.arange(int(4.0 * 30)) / 30
+    paths = ["camera.zoom", "layer.0.position", "layer.0.state", "missing"]
+    samples = timeline.sample(paths, frame_times)
+    
+    assert isinstance(samples["camera.zoom"], np.ndarray)
+    for path in paths:
+        expected = [timeline.get_property_value(path, t) for t in frame_times.tolist()]
+        assert list(samples[path]) == expected, path
+    assert samples["layer.0.state"][89] == "hidden" and samples["layer.0.state"][90] == "visible"
+    
+    print("✅ Timeline batch sampling test passed")
+
+
+def test_cubic_bezier_solver():
+    """Test the vectorized bezier solver against the scalar one and a bisection reference."""
+    print("Testing cubic bezier solver...")
+    
+    progress = np.linspace(0, 1, 501)
+    for handles in [(0.25, 0.1, 0.25, 1.0), (0.42, 0.0, 0.58, 1.0), (0.68, -0.55, 0.265, 1.55),
+                    (0.0, 0.0, 1.0, 1.0), (0.1, 0.7, 0.1, 1.0)]:
+        vectorized = cubic_bezier_array(progress, *handles)
+        assert vectorized.tolist() == [cubic_bezier(p, *handles) for p in progress.tolist()], handles
+        assert vectorized[0] == 0.0 and abs(vectorized[-1] - 1.0) < 1e-9
+        
+        # Reference: y at the curve parameter found by plain bisection on x
+        curve = CubicBezierEasing(*handles)
+        lo, hi = np.zeros_like(progress), np.ones_like(progress)
+        for _ in range(60):
+            mid = (lo + hi) / 2
+            below = curve._sample_x(mid) < progress
+            lo, hi = np.where(below, mid, lo), np.where(below, hi, mid)
+        reference = curve._sample_y((lo + hi) / 2)
+        assert np.abs(vectorized - reference).max() < 1e-6, handles
+        
+        table = CubicBezierEasing(*handles, table_size=1024)(progress)
+        assert np.abs(table - reference).max() < 1e-5, handles
+    
+    # Symmetric curve passes through the middle
+    assert abs(cubic_bezier(0.5, 0.42, 0.0, 0.58, 1.0) - 0.5) < 1e-6
+    assert apply_easing(0.3, KeyframeInterpolation.BEZIER, (0.42, 0.0, 0.58, 1.0)) == cubic_bezier(0.3, 0.42, 0.0, 0.58, 1.0)
+    
+    print("✅ Cubic bezier solver test passed")
+
+
 def run_all_tests():
     """Run all timeline tests."""
     print("="*60)
@@ -354,7 +486,10 @@ def run_all_tests():
         test_time_remapping,
         test_timeline_serialization,
         test_complex_animation_curve,
-        test_step_interpolation
+        test_step_interpolation,
+        test_compiled_track,
+        test_timeline_sample,
+        test_cubic_bezier_solver
     ]
     
     passed = 0
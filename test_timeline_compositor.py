@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""Test timeline-driven composition of layered slides (TimelineFrames / TimelineCompositor)."""
+
+import sys
+
+import numpy as np
+
+from timeline_system import GlobalTimeline, KeyframeInterpolation, TimelineFrames
+from whiteboard_animator import (
+    AllVariables, TimelineCompositor, draw_layered_whiteboard_animations, hand_mask_path, hand_path
+)
+
+WIDTH, HEIGHT, FPS = 160, 90, 10
+
+LAYERS = [
+    {'type': 'shape', 'z_index': 1, 'mode': 'static',
+     'shape_config': {'shape': 'rectangle', 'color': '#000000', 'fill_color': '#2040C0',
+                      'position': {'x': 40, 'y': 45}, 'width': 40, 'height': 30}},
+    {'type': 'shape', 'z_index': 2, 'mode': 'static',
+     'shape_config': {'shape': 'circle', 'color': '#000000', 'fill_color': '#C02020',
+                      'position': {'x': 120, 'y': 45}, 'size': 30}},
+]
+
+
+def make_timeline():
+    """Layer 0 slides right, layer 1 fades out, camera zooms in; everything holds after 2s."""
+    timeline = GlobalTimeline(duration=3.0, frame_rate=FPS)
+    timeline.add_keyframe('layer.0.position', 0.5, {'x': 0, 'y': 0}, KeyframeInterpolation.EASE_OUT)
+    timeline.add_keyframe('layer.0.position', 1.5, {'x': 30, 'y': 0})
+    timeline.add_keyframe('layer.1.opacity', 1.0, 1.0)
+    timeline.add_keyframe('layer.1.opacity.exit', 1.0, 1.0)
+    timeline.add_keyframe('layer.1.opacity.exit', 2.0, 0.0)
+    timeline.add_keyframe('camera.zoom', 1.5, 1.0, KeyframeInterpolation.EASE_IN_OUT)
+    timeline.add_keyframe('camera.zoom', 2.0, 1.5)
+    return timeline
+
+
+class ListSink:
+    """Keeps a copy of every frame written."""
+
+    def __init__(self):
+        self.frames = []
+
+    def write(self, frame):
+        self.frames.append(frame.copy())
+
+    def write_repeated(self, frame, count):
+        self.frames.extend(frame.copy() for _ in range(count))
+
+    def release(self):
+        pass
+
+
+def render_slide(layers, timeline_config, duration, start_frame=0):
+    """Frames of a layered slide rendered into a ListSink."""
+    variables = AllVariables(frame_rate=FPS, resize_wd=WIDTH, resize_ht=HEIGHT, split_len=10,
+                             object_skip_rate=8, bg_object_skip_rate=8, end_gray_img_duration_in_sec=duration,
+                             encoder_queue_size=0)
+    sink = ListSink()
+    draw_layered_whiteboard_animations(layers, hand_path, hand_mask_path, None, variables, frame_sink=sink,
+                                       timeline_config=timeline_config, start_frame=start_frame)
+    assert variables.frames_written == len(sink.frames) + start_frame
+    return sink.frames
+
+
+def test_timeline_frames():
+    """Per-frame arrays match per-frame queries; unchanged frames form runs."""
+    print("Testing TimelineFrames...")
+    timeline = make_timeline()
+    timeline.add_loop_segment(0.0, 1.0, 2)
+    frames = TimelineFrames(timeline, 30)
+    for frame in range(30):
+        t = timeline.get_effective_time(frame / FPS)
+        for path in frames.property_paths:
+            expected = timeline.get_property_value(path, t)
+            assert frames.value(path, frame) == expected, (path, frame)
+    assert frames.value('layer.7.scale', 3, 2.0) == 2.0
+
+    runs = list(frames.runs())
+    assert sum(length for _, length in runs) == 30
+    assert runs[-1] == (20, 10), runs  # Nothing changes after 2s
+    assert list(frames.runs(25, 28)) == [(25, 3)]
+    assert frames.composition_count(0, 5) == 1 + int(frames.changed[1:5].sum())
+
+    # Reading past the evaluated frames extends the arrays
+    short = TimelineFrames(make_timeline(), 5)
+    assert short.segment('layer.1.opacity.exit', 8, 4) == frames.segment('layer.1.opacity.exit', 8, 4)
+    assert short.frame_count >= 12 and short.segment('layer.7.scale', 0, 3) is None
+    assert list(short.runs(25, 30)) == [(25, 5)]
+    print(f"  ✓ {len(frames.property_paths)} properties, {len(runs)} runs for 30 frames")
+
+
+def test_compositor_seek_and_runs():
+    """Any frame renders the same when started there; static runs are composed once."""
+    print("Testing TimelineCompositor...")
+    compositor = TimelineCompositor(LAYERS, make_timeline(), 30, WIDTH, HEIGHT, FPS)
+    sequence = [compositor.compose(frame).copy() for frame in range(30)]
+    for frame in (0, 7, 13, 29):
+        fresh = TimelineCompositor(LAYERS, make_timeline(), 30, WIDTH, HEIGHT, FPS)
+        assert np.array_equal(fresh.compose(frame), sequence[frame]), frame
+
+    # Layer 0 moved right, layer 1 faded out, then the camera zoomed in
+    assert not np.array_equal(sequence[0], sequence[15])
+    assert np.array_equal(sequence[21], sequence[29])
+    red = (sequence[0][:, :, 2] > 150) & (sequence[0][:, :, 0] < 100)
+    assert red.any() and not ((sequence[20][:, :, 2] > 150) & (sequence[20][:, :, 0] < 100)).any()
+
+    variables = AllVariables(frame_rate=FPS, resize_wd=WIDTH, resize_ht=HEIGHT, split_len=10,
+                             object_skip_rate=8, bg_object_skip_rate=8, end_gray_img_duration_in_sec=3)
+    variables.video_object = ListSink()
+    compositor = TimelineCompositor(LAYERS, make_timeline(), 30, WIDTH, HEIGHT, FPS)
+    assert compositor.write(variables, 10, 30) == 20
+    assert variables.frames_written == 20
+    assert compositor.compositions == compositor.frames.composition_count(10, 30) < 20
+    assert all(np.array_equal(a, b) for a, b in zip(variables.video_object.frames, sequence[10:]))
+    print(f"  ✓ Seek matches sequential render, {compositor.compositions} compositions for 20 frames")
+
+
+def test_layered_slide_hold():
+    """draw_layered_whiteboard_animations composes its final hold from the timeline."""
+    print("Testing timeline hold in a layered slide...")
+    static = render_slide(LAYERS, None, 3)
+    animated = render_slide(LAYERS, make_timeline().to_dict(), 3)
+    assert len(static) == len(animated) == 30
+    hold_start = next(i for i in range(30) if not np.array_equal(static[i], animated[i]))
+    assert all(np.array_equal(a, b) for a, b in zip(static[:hold_start], animated[:hold_start]))
+    compositor = TimelineCompositor(LAYERS, make_timeline(), 30, WIDTH, HEIGHT, FPS)
+    assert np.array_equal(animated[-1], compositor.compose(29))
+    print(f"  ✓ Drawing frames unchanged, hold from frame {hold_start} follows the timeline")
+
+
+def test_hold_keeps_drawing_end_state():
+    """A timeline that animates nothing visible holds the last drawing frame."""
+    print("Testing timeline hold seeded from the end of drawing...")
+    layers = [
+        {'type': 'shape', 'z_index': 1, 'mode': 'static',
+         'shape_config': {'shape': 'rectangle', 'color': '#000000', 'fill_color': '#2040C0',
+                          'position': {'x': 40, 'y': 45}, 'width': 26, 'height': 20},
+         'path_animation': {'enabled': True, 'type': 'linear', 'duration': 0.5,
+                            'points': [[40, 45], [120, 45]]}},
+    ]
+    timeline = GlobalTimeline(duration=2.0, frame_rate=FPS)
+    timeline.add_keyframe('camera.zoom', 0.0, 1.0)
+    static = render_slide(layers, None, 2)
+    animated = render_slide(layers, timeline.to_dict(), 2)
+    assert len(static) == len(animated) == 20
+    hold_start = 5  # Static layer: the drawing phase is the 0.5s path animation
+    assert not np.array_equal(animated[0], animated[hold_start - 1])
+    assert all(np.array_equal(frame, animated[hold_start - 1]) for frame in animated[hold_start:])
+    assert all(np.array_equal(a, b) for a, b in zip(static, animated))
+
+    # Unchanged tracks on a lower layer must not undo what the layers above did
+    # (here the camera applied after drawing layer 1)
+    layers = [dict(LAYERS[0]), dict(LAYERS[1], camera={'zoom': 2})]
+    timeline = GlobalTimeline(duration=2.0, frame_rate=FPS)
+    timeline.add_keyframe('layer.0.opacity', 0.0, 1.0)
+    static = render_slide(layers, None, 2)
+    animated = render_slide(layers, timeline.to_dict(), 2)
+    assert len(static) == len(animated) == 20
+    assert all(np.array_equal(a, b) for a, b in zip(static, animated))
+    print("  ✓ Hold frames equal the end of drawing when the timeline changes nothing")
+
+
+def test_timeline_drives_drawing():
+    """layer.N.path and layer.N.opacity tracks drive the drawing phase itself."""
+    print("Testing timeline-driven path animation...")
+    layers = [
+        {'type': 'shape', 'z_index': 1, 'mode': 'static',
+         'shape_config': {'shape': 'rectangle', 'color': '#000000', 'fill_color': '#2040C0',
+                          'position': {'x': 40, 'y': 45}, 'width': 26, 'height': 20},
+         'path_animation': {'enabled': True, 'type': 'linear', 'duration': 1.0,
+                            'points': [[40, 45], [120, 45]]}},
+    ]
+    timeline = GlobalTimeline(duration=2.0, frame_rate=FPS)
+    timeline.add_keyframe('layer.0.path', 0.0, 0.0)
+    timeline.add_keyframe('layer.0.path', 0.4, 1.0)  # Arrives after 4 of the 10 path frames
+    timeline.add_keyframe('layer.0.opacity', 0.0, 1.0)
+    timeline.add_keyframe('layer.0.opacity', 1.5, 1.0)
+    timeline.add_keyframe('layer.0.opacity', 2.0, 0.0)
+    static = render_slide(layers, None, 2)
+    animated = render_slide(layers, timeline.to_dict(), 2)
+    assert len(static) == len(animated) == 20
+    assert np.array_equal(static[0], animated[0])
+    assert not np.array_equal(static[2], animated[2])
+    assert all(np.array_equal(frame, animated[4]) for frame in animated[4:15])
+    assert np.array_equal(animated[9], static[9])  # Same end point
+    assert animated[-1].min() > animated[9].min()  # Faded out in the hold
+
+    # Resuming at any frame writes the tail of the full render
+    for start_frame in (3, 12):
+        resumed = render_slide(layers, timeline.to_dict(), 2, start_frame=start_frame)
+        assert len(resumed) == 20 - start_frame
+        assert all(np.array_equal(a, b) for a, b in zip(resumed, animated[start_frame:]))
+    full = render_slide(LAYERS, make_timeline().to_dict(), 3)
+    resumed = render_slide(LAYERS, make_timeline().to_dict(), 3, start_frame=7)
+    assert all(np.array_equal(a, b) for a, b in zip(resumed, full[7:]))
+    print("  ✓ Path and opacity follow the timeline; resumed renders match")
+
+
+if __name__ == "__main__":
+    test_timeline_frames()
+    test_compositor_seek_and_runs()
+    test_layered_slide_hold()
+    test_hold_keeps_drawing_end_state()
+    test_timeline_drives_drawing()
+    print("\n✅ All timeline compositor tests passed!")
+    sys.exit(0)
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Test PreparedWatermark against a float reference blend."""
+
+import os
+import sys
+import tempfile
+
+import cv2
+import numpy as np
+
+from whiteboard_animator import AllVariables, HandCompositor, PreparedWatermark, apply_watermark
+
+
+def reference_blend(frame, watermark, y1, x1, opacity):
+    """Float alpha blend of a BGRA watermark at (y1, x1)."""
+    result = frame.astype(np.float64)
+    h, w = watermark.shape[:2]
+    alpha = watermark[:, :, 3:4] / 255.0 * opacity
+    roi = result[y1:y1 + h, x1:x1 + w]
+    result[y1:y1 + h, x1:x1 + w] = roi * (1 - alpha) + watermark[:, :, :3] * alpha
+    return np.rint(result).astype(np.uint8)
+
+
+def make_watermark(height=20, width=40, seed=0):
+    rng = np.random.default_rng(seed)
+    watermark = rng.integers(0, 256, (height, width, 4), dtype=np.uint8)
+    return watermark
+
+
+def test_blend_matches_reference():
+    """Integer blend stays within one level of the float blend."""
+    print("Testing PreparedWatermark blend...")
+    rng = np.random.default_rng(1)
+    frame = rng.integers(0, 256, (120, 200, 3), dtype=np.uint8)
+    watermark = make_watermark()
+
+    # scale 0.2 of a 200px frame keeps the 40x20 watermark at its native size
+    prepared = PreparedWatermark(watermark, 'bottom-right', 0.6, 0.2)
+    result = prepared.apply(frame.copy())
+    expected = reference_blend(frame, watermark, 120 - 20 - 20, 200 - 40 - 20, 0.6)
+
+    assert np.abs(result.astype(int) - expected).max() <= 1, "Blend differs from reference"
+    outside = np.ones(frame.shape[:2], dtype=bool)
+    outside[80:100, 140:180] = False
+    assert np.array_equal(result[outside], frame[outside]), "Pixels outside the ROI changed"
+    print("  ✓ Integer blend within ±1 of float blend, ROI only")
+
+
+def test_positions_and_cropping():
+    """Every position stays inside the frame; oversized watermarks are cropped."""
+    print("Testing positions and cropping...")
+    frame = np.full((100, 100, 3), 255, dtype=np.uint8)
+    watermark = make_watermark(50, 50)
+    for position in ['top-left', 'top-right', 'bottom-left', 'bottom-right', 'center', 'unknown']:
+        prepared = PreparedWatermark(watermark, position, 1.0, 0.3)
+        y1, y2, x1, x2 = prepared.region(100, 100)[:4]
+        assert 0 <= y1 < y2 <= 100 and 0 <= x1 < x2 <= 100, f"{position} out of frame"
+        prepared.apply(frame.copy())
+
+    prepared = PreparedWatermark(watermark, 'top-left', 1.0, 1.5)
+    y1, y2, x1, x2 = prepared.region(100, 100)[:4]
+    assert (y1, x1) == (20, 20) and (y2, x2) == (100, 100)
+    prepared.apply(frame.copy())
+
+    assert PreparedWatermark(watermark, scale=0.001).region(100, 100) is None
+    print("  ✓ All positions valid")
+
+
+def test_loaded_once_and_cached():
+    """AllVariables decodes the file once; the prepared planes are reused."""
+    print("Testing watermark loading and caching...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "wm.png")
+        cv2.imwrite(path, make_watermark())
+        variables = AllVariables(watermark_path=path, watermark_scale=0.2)
+        assert isinstance(variables.watermark, PreparedWatermark)
+
+        frame = np.zeros((120, 200, 3), dtype=np.uint8)
+        first = variables.watermark.region(120, 200)
+        variables.watermark.apply(frame)
+        assert variables.watermark.region(120, 200) is first
+
+        # Path-based calls still work
+        expected = variables.watermark.apply(np.zeros_like(frame))
+        assert np.array_equal(apply_watermark(np.zeros_like(frame), path, scale=0.2), expected)
+
+    assert AllVariables(watermark_path=None).watermark is None
+    assert AllVariables(watermark_path="/nonexistent.png").watermark is None
+    print("  ✓ Decoded once, planes cached")
+
+
+def test_compositor_applies_watermark():
+    """The compositor blends the watermark and restores its ROI each frame."""
+    print("Testing HandCompositor with watermark...")
+    rng = np.random.default_rng(2)
+    canvas = np.full((120, 200, 3), 255, dtype=np.uint8)
+    prepared = PreparedWatermark(make_watermark(), 'bottom-right', 0.5, 0.2)
+    compositor = HandCompositor(canvas, watermark=prepared)
+
+    for step in range(3):
+        # Draw something under the watermark so the ROI changes
+        canvas[80:100, 140 + step * 10:150 + step * 10] = rng.integers(0, 256, 3)
+        compositor.mark_dirty(80, 100, 140 + step * 10, 150 + step * 10)
+        frame = compositor.compose()
+        expected = prepared.apply(canvas.copy())
+        assert np.array_equal(frame, expected), f"Frame {step} differs"
+    print("  ✓ Watermark blended once per frame")
+
+
+if __name__ == "__main__":
+    test_blend_matches_reference()
+    test_positions_and_cropping()
+    test_loaded_once_and_cached()
+    test_compositor_applies_watermark()
+    print("\n✅ All watermark tests passed!")
+    sys.exit(0)
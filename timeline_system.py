@@ -9,13 +9,19 @@ This module provides advanced timeline features including:
 - Animation curves (easing functions)
 - Time remapping capabilities
 - Loop segments functionality
+- Compiled tracks for fast per-frame and batch evaluation
+- Per-frame property arrays for the renderer (TimelineFrames)
 """
 
 import math
-from typing import Dict, List, Any, Optional, Tuple, Callable
-from dataclasses import dataclass, field
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Callable
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
+import numpy as np
+
 
 class KeyframeInterpolation(Enum):
     """Types of interpolation between keyframes."""
@@ -29,9 +35,13 @@ class KeyframeInterpolation(Enum):
     BEZIER = "bezier"  # Custom bezier curve
 
 
-@dataclass
+@dataclass(frozen=True)
 class Keyframe:
-    """Represents a keyframe at a specific time with a value."""
+    """Represents a keyframe at a specific time with a value.
+    
+    Keyframes are immutable: edit one through PropertyTrack.update_keyframe
+    so the track's compiled lookup is rebuilt.
+    """
     time: float  # Time in seconds
     value: Any  # Can be number, tuple, dict, etc.
     interpolation: KeyframeInterpolation = KeyframeInterpolation.LINEAR
@@ -39,7 +49,7 @@ class Keyframe:
     
     def __post_init__(self):
         if isinstance(self.interpolation, str):
-            self.interpolation = KeyframeInterpolation(self.interpolation)
+            object.__setattr__(self, 'interpolation', KeyframeInterpolation(self.interpolation))
 
 
 @dataclass
@@ -95,59 +105,204 @@ class TimeRemapping:
         return self.remapped_start + eased_progress * (self.remapped_end - self.remapped_start)
 
 
+# Two keyframes closer than this are the same instant
+EXACT_TIME_TOLERANCE = 0.0001
+
+
+class CompiledTrack:
+    """Lookup structure for a track's keyframes.
+    
+    Keyframe times are kept in a sorted NumPy array (and a list for scalar
+    bisect lookups), and the easing of each segment (keyframe i to i + 1) is
+    resolved once. Values are the same as a linear scan of the keyframes:
+    the first value before the first keyframe, the keyframe value within
+    EXACT_TIME_TOLERANCE of a keyframe, the last value after the last one,
+    and the eased interpolation in between.
+    """
+    
+    def __init__(self, keyframes: List[Keyframe]):
+        self.source = keyframes
+        self.size = len(keyframes)
+        ordered = sorted(keyframes, key=lambda k: k.time)
+        self.time_list = [kf.time for kf in ordered]
+        self.times = np.array(self.time_list, dtype=np.float64)
+        self.values = [kf.value for kf in ordered]
+        
+        # Easing of each segment, grouped by (interpolation, bezier handles)
+        self.segment_step = [kf.interpolation == KeyframeInterpolation.STEP for kf in ordered[:-1]]
+        self.segment_easing = [easing_function(kf.interpolation, kf.bezier_handles) for kf in ordered[:-1]]
+        self.easing_groups: List[Tuple[KeyframeInterpolation, Optional[Tuple[float, float, float, float]]]] = []
+        group_ids = {}
+        segment_group = []
+        for kf in ordered[:-1]:
+            handles = tuple(kf.bezier_handles) if kf.bezier_handles else None
+            key = (kf.interpolation, handles)
+            if key not in group_ids:
+                group_ids[key] = len(self.easing_groups)
+                self.easing_groups.append(key)
+            segment_group.append(group_ids[key])
+        self.segment_group = np.array(segment_group, dtype=np.int64)
+        
+        # Numeric tracks are interpolated as arrays
+        self.numeric = bool(ordered) and all(isinstance(v, (int, float)) for v in self.values)
+        self.numeric_values = np.array(self.values, dtype=np.float64) if self.numeric else None
+    
+    def _exact_index(self, time: float) -> int:
+        """Index of the first keyframe within EXACT_TIME_TOLERANCE of time, or -1."""
+        j = bisect_left(self.time_list, time - 2 * EXACT_TIME_TOLERANCE)
+        while j < self.size and self.time_list[j] < time + 2 * EXACT_TIME_TOLERANCE:
+            if abs(time - self.time_list[j]) < EXACT_TIME_TOLERANCE:
+                return j
+            j += 1
+        return -1
+    
+    def value_at(self, time: float) -> Any:
+        """Interpolated value at time."""
+        if not self.size:
+            return None
+        if time < self.time_list[0]:
+            return self.values[0]
+        exact = self._exact_index(time)
+        if exact >= 0:
+            return self.values[exact]
+        if time > self.time_list[-1]:
+            return self.values[-1]
+        
+        # Segment [i, i + 1] such that times[i] < time < times[i + 1]
+        i = bisect_right(self.time_list, time) - 1
+        if self.segment_step[i]:
+            return self.values[i]
+        t1 = self.time_list[i]
+        progress = (time - t1) / (self.time_list[i + 1] - t1)
+        return interpolate_values(self.values[i], self.values[i + 1], self.segment_easing[i](progress))
+    
+    def sample(self, times: Sequence[float]):
+        """Values at every time of times in one pass.
+        
+        Returns a float64 array for numeric tracks, a list otherwise (same
+        values as value_at, numbers converted to float).
+        """
+        ts = np.asarray(times, dtype=np.float64).reshape(-1)
+        count = len(ts)
+        if not self.size:
+            return [None] * count
+        n = self.size
+        
+        # Keyframe whose value is used as-is (-1: interpolated)
+        index = np.full(count, -1, dtype=np.int64)
+        
+        # First keyframe within the tolerance (usually at most one candidate)
+        exact = np.full(count, -1, dtype=np.int64)
+        j = np.searchsorted(self.times, ts - 2 * EXACT_TIME_TOLERANCE, side='left')
+        pending = np.flatnonzero(j < n)
+        while len(pending):
+            jj = j[pending]
+            tt = ts[pending]
+            hit = np.abs(tt - self.times[jj]) < EXACT_TIME_TOLERANCE
+            exact[pending[hit]] = jj[hit]
+            more = ~hit & (self.times[jj] < tt + 2 * EXACT_TIME_TOLERANCE) & (jj + 1 < n)
+            pending = pending[more]
+            j[pending] += 1
+        
+        after = ts > self.times[-1]
+        index[after] = n - 1
+        index = np.where(exact >= 0, exact, index)
+        index[ts < self.times[0]] = 0
+        
+        # Eased progress of the interpolated times, one vectorized call per easing
+        inner = np.flatnonzero(index < 0)
+        segment = np.searchsorted(self.times, ts[inner], side='right') - 1
+        t1 = self.times[segment]
+        progress = (ts[inner] - t1) / (self.times[segment + 1] - t1)
+        eased = np.empty_like(progress)
+        groups = self.segment_group[segment]
+        for group_id in np.unique(groups):
+            interpolation, handles = self.easing_groups[group_id]
+            in_group = groups == group_id
+            if interpolation == KeyframeInterpolation.STEP:
+                # Step segments hold the first keyframe value
+                index[inner[in_group]] = segment[in_group]
+            else:
+                eased[in_group] = apply_easing_array(progress[in_group], interpolation, handles)
+        interpolated = index[inner] < 0
+        inner, segment, eased = inner[interpolated], segment[interpolated], eased[interpolated]
+        
+        if self.numeric:
+            result = np.empty(count, dtype=np.float64)
+            held = index >= 0
+            result[held] = self.numeric_values[index[held]]
+            v1 = self.numeric_values[segment]
+            result[inner] = v1 + (self.numeric_values[segment + 1] - v1) * eased
+            return result
+        
+        result = [self.values[i] if i >= 0 else None for i in index.tolist()]
+        for k, i, p in zip(inner.tolist(), segment.tolist(), eased.tolist()):
+            result[k] = interpolate_values(self.values[i], self.values[i + 1], p)
+        return result
+
+
+def _insertion_index(keyframes: List[Keyframe], time: float) -> int:
+    """Position after the keyframes at or before time (keyframes sorted by time)."""
+    lo, hi = 0, len(keyframes)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if time < keyframes[mid].time:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
 @dataclass
 class PropertyTrack:
     """A track of keyframes for a specific property."""
     property_path: str  # e.g., "layers.0.opacity", "camera.zoom"
     keyframes: List[Keyframe] = field(default_factory=list)
+    _compiled: Optional[CompiledTrack] = field(default=None, init=False, repr=False, compare=False)
     
     def add_keyframe(self, time: float, value: Any, 
                      interpolation: KeyframeInterpolation = KeyframeInterpolation.LINEAR,
                      bezier_handles: Optional[Tuple[float, float, float, float]] = None):
         """Add a keyframe to this track."""
         kf = Keyframe(time, value, interpolation, bezier_handles)
-        self.keyframes.append(kf)
-        # Keep keyframes sorted by time
-        self.keyframes.sort(key=lambda k: k.time)
+        # Keep keyframes sorted by time (after existing keyframes at the same time)
+        self.keyframes.insert(_insertion_index(self.keyframes, kf.time), kf)
+        self._compiled = None
+    
+    def update_keyframe(self, index: int, **changes) -> Keyframe:
+        """Replace keyframe index with a copy carrying changes (time, value, interpolation, ...)."""
+        kf = replace(self.keyframes[index], **changes)
+        if kf.time == self.keyframes[index].time:
+            self.keyframes[index] = kf
+        else:
+            del self.keyframes[index]
+            self.keyframes.insert(_insertion_index(self.keyframes, kf.time), kf)
+        self._compiled = None
+        return kf
+    
+    def compile(self) -> CompiledTrack:
+        """Compiled lookup structure, rebuilt after add_keyframe and update_keyframe.
+        
+        Rebuilt too when the keyframes list is replaced or changes length;
+        call invalidate() after assigning into the list or mutating a value
+        (e.g. a dict value's entries) in place.
+        """
+        compiled = self._compiled
+        if compiled is None or compiled.source is not self.keyframes or compiled.size != len(self.keyframes):
+            compiled = self._compiled = CompiledTrack(self.keyframes)
+        return compiled
+    
+    def invalidate(self):
+        """Drop the compiled track (after editing the keyframes list or a value in place)."""
+        self._compiled = None
     
     def get_value_at_time(self, time: float) -> Any:
         """Get the interpolated value at a specific time."""
-        if not self.keyframes:
-            return None
-        
-        # If before first keyframe, return first value
-        if time < self.keyframes[0].time:
-            return self.keyframes[0].value
-        
-        # Check for exact keyframe match first
-        for kf in self.keyframes:
-            if abs(time - kf.time) < 0.0001:  # Close enough to be considered exact
-                return kf.value
-        
-        # If after last keyframe, return last value
-        if time > self.keyframes[-1].time:
-            return self.keyframes[-1].value
-        
-        # Find surrounding keyframes
-        for i in range(len(self.keyframes) - 1):
-            kf1 = self.keyframes[i]
-            kf2 = self.keyframes[i + 1]
-            
-            if kf1.time < time < kf2.time:
-                # Calculate progress between keyframes
-                progress = (time - kf1.time) / (kf2.time - kf1.time)
-                
-                # Apply interpolation
-                if kf1.interpolation == KeyframeInterpolation.STEP:
-                    return kf1.value
-                
-                # Apply easing
-                eased_progress = apply_easing(progress, kf1.interpolation, kf1.bezier_handles)
-                
-                # Interpolate value
-                return interpolate_values(kf1.value, kf2.value, eased_progress)
-        
-        return self.keyframes[-1].value
+        return self.compile().value_at(time)
+    
+    def sample(self, times: Sequence[float]):
+        """Get the values at many times at once (array for numeric tracks, list otherwise)."""
+        return self.compile().sample(times)
 
 
 class GlobalTimeline:
@@ -209,6 +364,23 @@ class GlobalTimeline:
             return self.property_tracks[property_path].get_value_at_time(time)
         return None
     
+    def sample(self, property_paths: Sequence[str], times: Sequence[float]) -> Dict[str, Any]:
+        """Evaluate several properties at many times (e.g. every frame of a render).
+        
+        Returns {property_path: values}, values being a float array for
+        numeric tracks and a list otherwise (None for unknown properties).
+        Times are used as given: pass effective times to apply loops and
+        remapping.
+        """
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        samples = {}
+        for property_path in property_paths:
+            if property_path in self.property_tracks:
+                samples[property_path] = self.property_tracks[property_path].sample(times)
+            else:
+                samples[property_path] = [None] * len(times)
+        return samples
+    
     def get_remapped_time(self, time: float) -> float:
         """Get remapped time if time remapping is active."""
         for remap in self.time_remappings:
@@ -366,6 +538,87 @@ class GlobalTimeline:
         return timeline
 
 
+class TimelineFrames:
+    """Every property of a timeline evaluated once for frames 0..frame_count-1.
+
+    Frame f plays at time f / frame_rate, mapped through loops and time
+    remapping. A renderer reads values from the precomputed arrays, can start
+    at any frame, and can write runs of frames whose properties do not change
+    as a single composition. Reading past frame_count evaluates more frames.
+    """
+
+    def __init__(self, timeline: GlobalTimeline, frame_count: int,
+                 frame_rate: Optional[float] = None, property_paths: Optional[Sequence[str]] = None):
+        self.timeline = timeline
+        self.frame_rate = frame_rate or timeline.frame_rate
+        if property_paths is None:
+            property_paths = sorted(timeline.property_tracks)
+        self.property_paths = list(property_paths)
+        self._evaluate(frame_count)
+
+    def _evaluate(self, frame_count: int):
+        self.frame_count = max(0, int(frame_count))
+        times = (np.arange(self.frame_count) / self.frame_rate).tolist()
+        self.times = np.array([self.timeline.get_effective_time(t) for t in times], dtype=np.float64)
+        self.values = self.timeline.sample(self.property_paths, self.times)
+        self.changed = self._changed_frames()
+
+    def extend(self, frame_count: int):
+        """Make frames up to frame_count available (evaluated again, at least doubling)."""
+        if frame_count > self.frame_count:
+            self._evaluate(max(frame_count, 2 * self.frame_count))
+
+    def _changed_frames(self) -> np.ndarray:
+        """changed[f]: some property differs between frames f - 1 and f (always true for frame 0)."""
+        changed = np.zeros(self.frame_count, dtype=bool)
+        if self.frame_count == 0:
+            return changed
+        changed[0] = True
+        for values in self.values.values():
+            if isinstance(values, np.ndarray):
+                changed[1:] |= values[1:] != values[:-1]
+            else:
+                changed[1:] |= np.fromiter(
+                    (a != b for a, b in zip(values[1:], values[:-1])), dtype=bool, count=self.frame_count - 1
+                )
+        return changed
+
+    def value(self, property_path: str, frame: int, default: Any = None) -> Any:
+        """Value of a property at a frame (default when the timeline does not animate it)."""
+        if property_path not in self.values:
+            return default
+        self.extend(frame + 1)
+        values = self.values[property_path]
+        value = values[frame]
+        if value is None:
+            return default
+        return float(value) if isinstance(values, np.ndarray) else value
+
+    def segment(self, property_path: str, start: int, count: int) -> Optional[List[Any]]:
+        """Values of a property for frames [start, start + count), or None when it is not animated."""
+        if property_path not in self.values:
+            return None
+        self.extend(start + count)
+        values = self.values[property_path][start:start + count]
+        return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+    def runs(self, start: int = 0, end: Optional[int] = None):
+        """Yield (first_frame, run_length) for runs of frames with identical properties in [start, end)."""
+        if end is None:
+            end = self.frame_count
+        self.extend(end)
+        if start >= end:
+            return
+        starts = np.flatnonzero(self.changed[start + 1:end]) + start + 1
+        bounds = [start] + starts.tolist() + [end]
+        for first, last in zip(bounds, bounds[1:]):
+            yield first, last - first
+
+    def composition_count(self, start: int = 0, end: Optional[int] = None) -> int:
+        """Number of distinct compositions needed to render frames [start, end)."""
+        return sum(1 for _ in self.runs(start, end))
+
+
 def apply_easing(progress: float, easing: KeyframeInterpolation,
                  bezier_handles: Optional[Tuple[float, float, float, float]] = None) -> float:
     """Apply easing function to progress value."""
@@ -392,6 +645,70 @@ def apply_easing(progress: float, easing: KeyframeInterpolation,
     return progress
 
 
+def easing_function(easing: KeyframeInterpolation,
+                    bezier_handles: Optional[Tuple[float, float, float, float]] = None) -> Callable[[float], float]:
+    """Easing as a function of progress (same values as apply_easing), resolved once."""
+    if easing == KeyframeInterpolation.BEZIER and bezier_handles:
+        cp1x, cp1y, cp2x, cp2y = bezier_handles
+        return lambda progress: cubic_bezier(progress, cp1x, cp1y, cp2x, cp2y)
+    return _EASING_FUNCTIONS.get(easing, _linear)
+
+
+def apply_easing_array(progress: np.ndarray, easing: KeyframeInterpolation,
+                       bezier_handles: Optional[Tuple[float, float, float, float]] = None) -> np.ndarray:
+    """Apply an easing function to an array of progress values."""
+    progress = np.asarray(progress, dtype=np.float64)
+    if easing == KeyframeInterpolation.EASE_IN_OUT:
+        return np.where(progress < 0.5, 2 * progress * progress, -1 + (4 - 2 * progress) * progress)
+    if easing == KeyframeInterpolation.STEP:
+        return np.zeros_like(progress)
+    if easing == KeyframeInterpolation.BEZIER and bezier_handles:
+        return cubic_bezier_array(progress, *bezier_handles)
+    return _EASING_FUNCTIONS.get(easing, _linear)(progress)
+
+
+def _linear(progress):
+    return progress
+
+
+def _ease_in_out(progress):
+    if progress < 0.5:
+        return 2 * progress * progress
+    return -1 + (4 - 2 * progress) * progress
+
+
+def _ease_out_cubic(progress):
+    p = progress - 1
+    return p * p * p + 1
+
+
+# Element-wise formulas of apply_easing (work on floats and arrays)
+_EASING_FUNCTIONS = {
+    KeyframeInterpolation.LINEAR: _linear,
+    KeyframeInterpolation.EASE_IN: lambda progress: progress * progress,
+    KeyframeInterpolation.EASE_OUT: lambda progress: progress * (2 - progress),
+    KeyframeInterpolation.EASE_IN_OUT: _ease_in_out,
+    KeyframeInterpolation.EASE_IN_CUBIC: lambda progress: progress * progress * progress,
+    KeyframeInterpolation.EASE_OUT_CUBIC: _ease_out_cubic,
+    KeyframeInterpolation.STEP: lambda progress: 0.0,
+}
+
+
+# Cubic bezier solver settings (x solved to BEZIER_EPSILON in [0, 1])
+BEZIER_EPSILON = 1e-7
+BEZIER_NEWTON_ITERATIONS = 8
+BEZIER_BISECTION_ITERATIONS = 40
+BEZIER_MIN_SLOPE = 1e-6
+
+
+def _bezier_coefficients(p1: float, p2: float) -> Tuple[float, float, float]:
+    """Polynomial coefficients (a, b, c) of a timing curve axis: ((a*t + b)*t + c)*t."""
+    c = 3.0 * p1
+    b = 3.0 * (p2 - p1) - c
+    a = 1.0 - c - b
+    return a, b, c
+
+
 def cubic_bezier(t: float, cp1x: float, cp1y: float, cp2x: float, cp2y: float) -> float:
     """Calculate cubic bezier curve value.
     
@@ -403,31 +720,119 @@ def cubic_bezier(t: float, cp1x: float, cp1y: float, cp2x: float, cp2y: float) -
     Returns:
         Y value at time t
     """
-    # Simplified cubic bezier for timing functions
     # P0 = (0, 0), P3 = (1, 1), P1 = (cp1x, cp1y), P2 = (cp2x, cp2y)
+    # Solve x(u) = t with Newton-Raphson, falling back to bisection when the
+    # slope vanishes or Newton does not converge (same steps as cubic_bezier_array)
+    ax, bx, cx = _bezier_coefficients(cp1x, cp2x)
+    ay, by, cy = _bezier_coefficients(cp1y, cp2y)
+    x = min(max(t, 0.0), 1.0)
+    
+    u = x
+    for _ in range(BEZIER_NEWTON_ITERATIONS):
+        error = ((ax * u + bx) * u + cx) * u - x
+        if abs(error) < BEZIER_EPSILON:
+            return ((ay * u + by) * u + cy) * u
+        slope = (3.0 * ax * u + 2.0 * bx) * u + cx
+        if abs(slope) < BEZIER_MIN_SLOPE:
+            break
+        u = u - error / slope
+    
+    lo, hi, u = 0.0, 1.0, x
+    for _ in range(BEZIER_BISECTION_ITERATIONS):
+        error = ((ax * u + bx) * u + cx) * u - x
+        if abs(error) < BEZIER_EPSILON:
+            break
+        if error < 0:
+            lo = u
+        else:
+            hi = u
+        u = (lo + hi) * 0.5
+    return ((ay * u + by) * u + cy) * u
+
+
+class CubicBezierEasing:
+    """CSS-style cubic-bezier timing function for arrays of progress values.
     
-    # Use Newton-Raphson method to solve for x
-    # This is a simplified version - in production, you'd want more iterations
+    By default x is solved per value (Newton-Raphson, bisection fallback) and
+    matches cubic_bezier exactly. With table_size, the curve is sampled once
+    into a lookup table and values are linearly interpolated from it, which is
+    faster for long arrays at a small accuracy cost (see benchmark_bezier_easing.py).
+    """
     
-    def bezier_x(t):
-        return 3 * (1 - t) ** 2 * t * cp1x + 3 * (1 - t) * t ** 2 * cp2x + t ** 3
+    def __init__(self, cp1x: float, cp1y: float, cp2x: float, cp2y: float,
+                 table_size: Optional[int] = None):
+        self.handles = (cp1x, cp1y, cp2x, cp2y)
+        self.ax, self.bx, self.cx = _bezier_coefficients(cp1x, cp2x)
+        self.ay, self.by, self.cy = _bezier_coefficients(cp1y, cp2y)
+        self.table_size = table_size
+        self.table_x = self.table_y = None
+        if table_size:
+            u = np.linspace(0.0, 1.0, table_size)
+            # x must increase for np.interp (handles with x outside [0, 1] fold back)
+            self.table_x = np.maximum.accumulate(self._sample_x(u))
+            self.table_y = self._sample_y(u)
     
-    def bezier_y(t):
-        return 3 * (1 - t) ** 2 * t * cp1y + 3 * (1 - t) * t ** 2 * cp2y + t ** 3
+    def _sample_x(self, u):
+        return ((self.ax * u + self.bx) * u + self.cx) * u
     
-    # Binary search to find t for given x value (progress)
-    t_guess = t
-    for _ in range(8):  # 8 iterations should be enough
-        x = bezier_x(t_guess)
-        if abs(x - t) < 0.001:
-            break
-        # Derivative
-        dx = 3 * (1 - t_guess) ** 2 * cp1x + 6 * (1 - t_guess) * t_guess * (cp2x - cp1x) + 3 * t_guess ** 2 * (1 - cp2x)
-        if abs(dx) < 0.000001:
-            break
-        t_guess -= (x - t) / dx
+    def _sample_y(self, u):
+        return ((self.ay * u + self.by) * u + self.cy) * u
     
-    return bezier_y(t_guess)
+    def solve_x(self, x: np.ndarray) -> np.ndarray:
+        """Curve parameter u with x(u) = x, element-wise (x clipped to [0, 1])."""
+        x = np.clip(np.asarray(x, dtype=np.float64), 0.0, 1.0)
+        u = x.copy()
+        solved = np.zeros(x.shape, dtype=bool)
+        newton = np.ones(x.shape, dtype=bool)
+        for _ in range(BEZIER_NEWTON_ITERATIONS):
+            error = self._sample_x(u) - x
+            solved |= newton & (np.abs(error) < BEZIER_EPSILON)
+            newton &= ~solved
+            slope = (3.0 * self.ax * u + 2.0 * self.bx) * u + self.cx
+            newton &= np.abs(slope) >= BEZIER_MIN_SLOPE
+            if not newton.any():
+                break
+            u = np.where(newton, u - error / np.where(newton, slope, 1.0), u)
+        
+        # Bisection for the values Newton did not solve
+        pending = ~solved
+        if pending.any():
+            xb = x[pending]
+            ub = xb.copy()
+            lo = np.zeros_like(xb)
+            hi = np.ones_like(xb)
+            active = np.ones(xb.shape, dtype=bool)
+            for _ in range(BEZIER_BISECTION_ITERATIONS):
+                error = self._sample_x(ub) - xb
+                active &= np.abs(error) >= BEZIER_EPSILON
+                if not active.any():
+                    break
+                below = error < 0
+                lo = np.where(active & below, ub, lo)
+                hi = np.where(active & ~below, ub, hi)
+                ub = np.where(active, (lo + hi) * 0.5, ub)
+            u[pending] = ub
+        return u
+    
+    def __call__(self, progress) -> np.ndarray:
+        """Eased values for an array of progress values."""
+        if self.table_x is not None:
+            return np.interp(np.clip(np.asarray(progress, dtype=np.float64), 0.0, 1.0),
+                             self.table_x, self.table_y)
+        return self._sample_y(self.solve_x(progress))
+
+
+@lru_cache(maxsize=256)
+def bezier_easing(cp1x: float, cp1y: float, cp2x: float, cp2y: float,
+                  table_size: Optional[int] = None) -> CubicBezierEasing:
+    """Shared CubicBezierEasing per handle set (and table size)."""
+    return CubicBezierEasing(cp1x, cp1y, cp2x, cp2y, table_size)
+
+
+def cubic_bezier_array(progress, cp1x: float, cp1y: float, cp2x: float, cp2y: float,
+                       table_size: Optional[int] = None) -> np.ndarray:
+    """Vectorized cubic_bezier (lookup table of table_size samples if given)."""
+    return bezier_easing(float(cp1x), float(cp1y), float(cp2x), float(cp2y), table_size)(progress)
 
 
 def interpolate_values(value1: Any, value2: Any, progress: float) -> Any:
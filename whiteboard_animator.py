@@ -6,18 +6,27 @@ import time
 import math
 import json
 import datetime
+import tempfile
+import io
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
 import cv2
 import numpy as np
 import argparse
 from PIL import Image, ImageDraw, ImageFont
-from fontTools.ttLib import TTFont
-from fontTools.pens.recordingPen import RecordingPen
+
+from frame_sink import ResumeFrameSink, ThreadedFrameSink, create_frame_sink, static_runs, write_static_run
+from frame_pool import FrameBufferPool, white_frame_like
+from glyph_cache import SPACE_CHARS, get_glyph_cache, set_glyph_cache_dir
+from font_registry import get_font_registry
+from layer_cache import get_layer_cache, set_layer_cache_dir
 
 # Import performance optimizer module
 try:
     from performance_optimizer import (
         PerformanceOptimizer, RenderCheckpoint, ProgressTracker,
-        RenderQueue, parse_quality_preset, process_batch
+        RenderQueue, parse_quality_preset, process_batch, DEFAULT_BATCH_OUTPUT_DIR
     )
     PERFORMANCE_MODULE_AVAILABLE = True
 except ImportError:
@@ -62,13 +71,21 @@ except ImportError:
 try:
     from particle_system import (
         ParticleSystem, ParticleEmitter, Particle,
-        apply_particle_effect
+        ParticleEffectRunner, apply_particle_effect
     )
     PARTICLE_SYSTEM_AVAILABLE = True
 except ImportError:
     PARTICLE_SYSTEM_AVAILABLE = False
     print("⚠️ Warning: particle_system module not available. Particle effects disabled.")
 
+# Import timeline module
+try:
+    from timeline_system import GlobalTimeline, TimelineFrames
+    TIMELINE_AVAILABLE = True
+except ImportError:
+    TIMELINE_AVAILABLE = False
+    print("⚠️ Warning: timeline_system module not available. Timeline animations disabled.")
+
 # from kivy.clock import Clock # COMMENTÉ: Remplacé par un appel direct pour CLI
 
 # --- Variables Globales ---
@@ -93,6 +110,7 @@ DEFAULT_OBJECT_SKIP_RATE = 8
 DEFAULT_BG_OBJECT_SKIP_RATE = 20
 DEFAULT_MAIN_IMG_DURATION = 3
 DEFAULT_CRF = 18  # Lower = better quality (0-51, 18 is visually lossless)
+DEFAULT_ENCODER_QUEUE_SIZE = 8  # Frame buffers between rendering and the encoder thread
 
 # --- Classes et Fonctions ---
 
@@ -180,82 +198,12 @@ def render_text_to_image(text_config, target_width, target_height):
     img = Image.new('RGB', (target_width, target_height), color='white')
     draw = ImageDraw.Draw(img)
     
-    # Load font with style and fallbacks
-    font = None
-    fonts_to_try = [(font_name, style)]
-    
-    # Add fallback fonts
-    for fallback_font in font_fallbacks:
-        fonts_to_try.append((fallback_font, 'normal'))
-    
-    # Add common system fonts as last resort
-    fonts_to_try.extend([
-        ("DejaVuSans", "normal"),
-        ("Arial", "normal"),
-        ("NotoSans", "normal"),
-        ("NotoSansArabic", "normal"),  # For Arabic
-        ("NotoSansHebrew", "normal"),  # For Hebrew
-        ("NotoSansCJK", "normal"),     # For Chinese/Japanese/Korean
-    ])
-    
-    # Load font with style
-    for font_name_try, font_style in fonts_to_try:
-        if font is not None:
-            break
-            
-        try:
-            # Try to load the font with style
-            if font_style == 'bold' or (font_style == 'normal' and style == 'bold'):
-                # Try common bold font variations
-                for font_variant in [f"{font_name_try} Bold", f"{font_name_try}-Bold", f"{font_name_try}bd"]:
-                    try:
-                        font = ImageFont.truetype(font_variant, font_size)
-                        break
-                    except:
-                        pass
-            elif font_style == 'italic' or (font_style == 'normal' and style == 'italic'):
-                # Try common italic font variations
-                for font_variant in [f"{font_name_try} Italic", f"{font_name_try}-Italic", f"{font_name_try}i"]:
-                    try:
-                        font = ImageFont.truetype(font_variant, font_size)
-                        break
-                    except:
-                        pass
-            elif font_style == 'bold_italic' or (font_style == 'normal' and style == 'bold_italic'):
-                # Try common bold italic font variations
-                for font_variant in [f"{font_name_try} Bold Italic", f"{font_name_try}-BoldItalic", f"{font_name_try}bi"]:
-                    try:
-                        font = ImageFont.truetype(font_variant, font_size)
-                        break
-                    except:
-                        pass
-            
-            # If no styled font found, try base font
-            if font is None:
-                font = ImageFont.truetype(font_name_try, font_size)
-        except:
-            # Try common system font paths
-            common_fonts = [
-                f"{font_name_try}.ttf",
-                f"/usr/share/fonts/truetype/dejavu/{font_name_try}.ttf",
-                f"/usr/share/fonts/truetype/liberation/Liberation{font_name_try}-Regular.ttf",
-                f"/usr/share/fonts/truetype/noto/{font_name_try}-Regular.ttf",
-                f"C:\\Windows\\Fonts\\{font_name_try}.ttf"
-            ]
-            for font_path in common_fonts:
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                    break
-                except:
-                    pass
-        
+    # Load font with style and fallbacks (resolved once per process by the font registry)
+    font = get_font_registry().get_font(font_name, font_size, style, font_fallbacks, processed_text)
+    
     # Fall back to default font if nothing works
     if font is None:
-        try:
-            font = ImageFont.load_default()
-        except:
-            # Last resort: use default PIL font
-            font = ImageFont.load_default()
+        font = ImageFont.load_default()
     
     # Split text into lines
     lines = processed_text.split('\n')
@@ -511,47 +459,64 @@ def render_shape_to_image(shape_config, target_width, target_height):
     return img
 
 
+def render_layer_raster(layer_type, layer_config, target_width, target_height):
+    """Render a text or shape layer, reusing the layer cache (see layer_cache.py).
+    
+    Args:
+        layer_type: "text" or "shape"
+        layer_config: text_config or shape_config of the layer
+        target_width: Canvas width
+        target_height: Canvas height
+        
+    Returns:
+        numpy array (BGR format), owned by the caller
+    """
+    if layer_type == 'text':
+        # Le rendu dépend aussi des polices installées et du support RTL
+        registry = get_font_registry()
+        style = layer_config.get('style', 'normal')
+        font_names = [layer_config.get('font', 'Arial')] + list(layer_config.get('font_fallbacks', []))
+        extra = {'fonts': [registry.find_path(name, style) for name in font_names], 'bidi': BIDI_SUPPORT}
+        return get_layer_cache().render('text', layer_config, target_width, target_height,
+                                        render_text_to_image, extra)
+    return get_layer_cache().render('shape', layer_config, target_width, target_height,
+                                    render_shape_to_image)
+
+
 def extract_character_paths(text, font_path, font_size):
     """
     Extract vector paths from font characters.
     
+    Glyph outlines come from the process-wide glyph cache (see glyph_cache.py):
+    each font is parsed once and each character flattened once, at unit scale.
+    
     Args:
         text: Text to extract paths for
         font_path: Path to TTF/OTF font file
         font_size: Font size in points
         
     Returns:
-        List of character path data with drawing commands
+        List of character path data with their contours in font units
     """
     try:
-        font = TTFont(font_path)
-        glyf_table = font['glyf'] if 'glyf' in font else None
-        cmap = font.getBestCmap()
-        
-        if not glyf_table or not cmap:
+        contours = get_glyph_cache().text_contours(font_path, text)
+        if contours is None:
             return None
             
         char_paths = []
         
         for char in text:
-            if char in ['\n', ' ', '\t']:
-                char_paths.append({'char': char, 'paths': [], 'is_space': True})
+            if char in SPACE_CHARS:
+                char_paths.append({'char': char, 'contours': [], 'is_space': True})
                 continue
                 
-            char_code = ord(char)
-            if char_code not in cmap:
+            char_contours = contours.get(char)
+            if char_contours is None:
                 continue
-                
-            glyph_name = cmap[char_code]
-            glyph = glyf_table[glyph_name]
-            
-            # Use RecordingPen to capture drawing commands
-            pen = RecordingPen()
-            glyph.draw(pen, glyf_table)
             
             char_paths.append({
                 'char': char,
-                'paths': pen.value,
+                'contours': char_contours,
                 'is_space': False
             })
         
@@ -637,43 +602,11 @@ def convert_glyph_paths_to_points(char_paths, font_size, text_config, target_wid
                     char_boundaries.append(len(drawing_segments))
                 continue
                 
-            paths = char_data.get('paths', [])
-            char_segments = []
-            
-            current_segment = []
-            for command_type, coords in paths:
-                if command_type == 'moveTo':
-                    if current_segment:
-                        char_segments.append(current_segment)
-                        current_segment = []
-                    point = coords[0]
-                    x, y = point
-                    screen_x = int(current_x + x * scale)
-                    screen_y = int(current_y + (font_size - y * scale))
-                    current_segment.append((screen_x, screen_y))
-                    
-                elif command_type == 'lineTo':
-                    point = coords[0]
-                    x, y = point
-                    screen_x = int(current_x + x * scale)
-                    screen_y = int(current_y + (font_size - y * scale))
-                    current_segment.append((screen_x, screen_y))
-                    
-                elif command_type == 'qCurveTo':
-                    for point in coords:
-                        if isinstance(point, tuple) and len(point) == 2:
-                            x, y = point
-                            screen_x = int(current_x + x * scale)
-                            screen_y = int(current_y + (font_size - y * scale))
-                            current_segment.append((screen_x, screen_y))
-                            
-                elif command_type == 'closePath':
-                    if current_segment and len(current_segment) > 1:
-                        char_segments.append(current_segment)
-                        current_segment = []
-            
-            if current_segment:
-                char_segments.append(current_segment)
+            # Contours are cached in font units: only scale and offset here
+            char_segments = [
+                [(int(current_x + x * scale), int(current_y + (font_size - y * scale))) for x, y in contour]
+                for contour in char_data.get('contours', [])
+            ]
                 
             drawing_segments.extend(char_segments)
             
@@ -739,27 +672,8 @@ def draw_svg_path_handwriting(
         font_name = text_config.get('font', 'Arial')
         font_size = text_config.get('size', 32)
         
-        # Try to find font file
-        font_path = None
-        try:
-            # Try to load font to get path
-            temp_font = ImageFont.truetype(font_name, font_size)
-            # Get font path from PIL font
-            if hasattr(temp_font, 'path'):
-                font_path = temp_font.path
-            else:
-                # Try common font locations
-                common_paths = [
-                    f"/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-                    f"/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-                    f"C:\\Windows\\Fonts\\arial.ttf",
-                ]
-                for path in common_paths:
-                    if os.path.exists(path):
-                        font_path = path
-                        break
-        except:
-            pass
+        # Same font file as the rendered text (font registry), no system fallback
+        font_path = get_font_registry().find_path(font_name, text_config.get('style', 'normal'))
         
         # Try to extract character paths
         if font_path and os.path.exists(font_path):
@@ -789,6 +703,8 @@ def draw_svg_path_handwriting(
     # Draw using path-based approach
     counter = 0
     current_char_idx = 0
+    hand_coord_x, hand_coord_y = None, None
+    compositor = create_hand_compositor(variables, mode, eraser, eraser_mask_inv)
     
     for seg_idx, segment in enumerate(drawing_segments):
         if len(segment) < 2:
@@ -815,48 +731,19 @@ def draw_svg_path_handwriting(
                 except:
                     color = [0, 0, 0]
                 cv2.line(variables.drawn_frame, pt1, pt2, color, 2)
+            # Bounding box of the line (thickness 2), clipped to the canvas
+            compositor.mark_dirty(
+                max(0, min(pt1[1], pt2[1]) - 2), min(variables.resize_ht, max(pt1[1], pt2[1]) + 3),
+                max(0, min(pt1[0], pt2[0]) - 2), min(variables.resize_wd, max(pt1[0], pt2[0]) + 3)
+            )
             
             # Hand position at current point
             hand_coord_x, hand_coord_y = pt2
             
-            # Draw hand
-            if mode == 'static':
-                drawn_frame_with_hand = variables.drawn_frame.copy()
-            elif mode == 'eraser' and eraser is not None:
-                drawn_frame_with_hand = draw_eraser_on_img(
-                    variables.drawn_frame.copy(),
-                    eraser.copy(),
-                    hand_coord_x,
-                    hand_coord_y,
-                    eraser_mask_inv.copy(),
-                    eraser_ht,
-                    eraser_wd,
-                    variables.resize_ht,
-                    variables.resize_wd,
-                )
-            else:
-                drawn_frame_with_hand = draw_hand_on_img(
-                    variables.drawn_frame.copy(),
-                    variables.hand.copy(),
-                    hand_coord_x,
-                    hand_coord_y,
-                    variables.hand_mask_inv.copy(),
-                    variables.hand_ht,
-                    variables.hand_wd,
-                    variables.resize_ht,
-                    variables.resize_wd,
-                )
-            
             counter += 1
             if counter % skip_rate == 0:
-                if variables.watermark_path:
-                    drawn_frame_with_hand = apply_watermark(
-                        drawn_frame_with_hand,
-                        variables.watermark_path,
-                        variables.watermark_position,
-                        variables.watermark_opacity,
-                        variables.watermark_scale
-                    )
+                # Draw hand only for frames that are written
+                drawn_frame_with_hand = compositor.compose(hand_coord_x, hand_coord_y)
                 
                 variables.video_object.write(drawn_frame_with_hand)
                 variables.frames_written += 1
@@ -866,17 +753,9 @@ def draw_svg_path_handwriting(
             # Finished a character
             if pause_after_char > 0:
                 # Hold the current frame for pause
-                for _ in range(pause_after_char):
-                    if variables.watermark_path:
-                        drawn_frame_with_hand = apply_watermark(
-                            drawn_frame_with_hand,
-                            variables.watermark_path,
-                            variables.watermark_position,
-                            variables.watermark_opacity,
-                            variables.watermark_scale
-                        )
-                    variables.video_object.write(drawn_frame_with_hand)
-                    variables.frames_written += 1
+                drawn_frame_with_hand = compositor.compose(hand_coord_x, hand_coord_y)
+                write_static_run(variables.video_object, drawn_frame_with_hand, pause_after_char)
+                variables.frames_written += pause_after_char
             
             current_char_idx += 1
     
@@ -890,6 +769,97 @@ def euc_dist(arr1, point):
     square_sub = (arr1 - point) ** 2
     return np.sqrt(np.sum(square_sub, axis=1))
 
+
+def find_dark_tiles(img_thresh, split_len, black_pixel_threshold=10):
+    """Find the grid tiles that contain at least one dark pixel.
+
+    Args:
+        img_thresh: Thresholded grayscale image (numpy array)
+        split_len: Tile size in pixels (border tiles may be smaller)
+        black_pixel_threshold: Pixels below this value count as dark
+
+    Returns:
+        tuple: (tile_indices, grid_shape) where tile_indices is an (N, 2) array
+        of (row, col) tile indices in row-major order
+    """
+    height, width = img_thresh.shape[:2]
+    row_starts = np.arange(0, height, split_len)
+    col_starts = np.arange(0, width, split_len)
+
+    dark = img_thresh < black_pixel_threshold
+    # Reduce each tile (including the smaller border tiles) to a single flag
+    tile_has_dark = np.logical_or.reduceat(dark, row_starts, axis=0)
+    tile_has_dark = np.logical_or.reduceat(tile_has_dark, col_starts, axis=1)
+
+    return np.argwhere(tile_has_dark), tile_has_dark.shape
+
+
+def _nearest_remaining_tile(occupancy, row, col):
+    """Return the remaining tile closest to (row, col) in the occupancy grid.
+
+    Ties are broken by row-major order, like np.argmin over the row-major
+    list of remaining tiles. Returns None when no tile remains.
+    """
+    n_rows, n_cols = occupancy.shape
+    max_radius = max(n_rows, n_cols)
+    radius = 1
+
+    while True:
+        r0, r1 = max(0, row - radius), min(n_rows, row + radius + 1)
+        c0, c1 = max(0, col - radius), min(n_cols, col + radius + 1)
+        rows, cols = np.nonzero(occupancy[r0:r1, c0:c1])
+
+        if len(rows) > 0:
+            sq_dist = (rows + r0 - row) ** 2 + (cols + c0 - col) ** 2
+            # Every tile at least as close as the best candidate lies within
+            # this Chebyshev radius; widen the window once if needed
+            reach = math.isqrt(int(sq_dist.min()))
+            if reach > radius:
+                r0, r1 = max(0, row - reach), min(n_rows, row + reach + 1)
+                c0, c1 = max(0, col - reach), min(n_cols, col + reach + 1)
+                rows, cols = np.nonzero(occupancy[r0:r1, c0:c1])
+                sq_dist = (rows + r0 - row) ** 2 + (cols + c0 - col) ** 2
+            best = np.argmin(sq_dist)
+            return int(rows[best] + r0), int(cols[best] + c0)
+
+        if radius >= max_radius:
+            return None
+        radius *= 2
+
+
+def plan_tile_drawing_order(tile_indices, grid_shape):
+    """Compute the full nearest-neighbour drawing order for a set of tiles.
+
+    Starts from the first tile in row-major order and repeatedly moves to the
+    closest remaining tile, exactly like the original selection loop of
+    draw_masked_object, but uses the tile grid as a spatial index so each pick
+    only inspects the neighbourhood of the current tile.
+
+    Args:
+        tile_indices: (N, 2) array of (row, col) tile indices in row-major order
+        grid_shape: (n_rows, n_cols) of the tile grid
+
+    Returns:
+        (N, 2) numpy array of (row, col) tile indices in drawing order
+    """
+    tile_indices = np.asarray(tile_indices, dtype=np.int64).reshape(-1, 2)
+    n_tiles = len(tile_indices)
+    order = np.empty((n_tiles, 2), dtype=np.int64)
+    if n_tiles == 0:
+        return order
+
+    occupancy = np.zeros(grid_shape, dtype=bool)
+    occupancy[tile_indices[:, 0], tile_indices[:, 1]] = True
+
+    row, col = int(tile_indices[0][0]), int(tile_indices[0][1])
+    for k in range(n_tiles):
+        order[k] = (row, col)
+        occupancy[row, col] = False
+        if k < n_tiles - 1:
+            row, col = _nearest_remaining_tile(occupancy, row, col)
+
+    return order
+
 def preprocess_image(img, variables):
     """Redimensionne, convertit en niveaux de gris et seuille l'image source."""
     img_ht, img_wd = img.shape[0], img.shape[1]
@@ -998,18 +968,21 @@ def easing_function(progress, easing_type='linear'):
         return progress
 
 
-def apply_camera_transform(frame, camera_config, frame_width, frame_height, camera_size=None):
+def apply_camera_transform(frame, camera_config, frame_width, frame_height, camera_size=None, dst=None):
     """Apply camera zoom and position transformations to a frame.
     
+    The input frame is never modified.
+    
     Args:
         frame: Input frame (numpy array)
         camera_config: Dictionary with camera settings (zoom, position, size)
         frame_width: Target frame width
         frame_height: Target frame height
         camera_size: Optional dict with 'width' and 'height' for camera viewport size
+        dst: Optional (frame_height, frame_width) buffer receiving the resized view
     
     Returns:
-        Transformed frame
+        Transformed frame (dst, or a view of frame when no resize is needed)
     """
     if camera_config is None:
         return frame
@@ -1056,37 +1029,132 @@ def apply_camera_transform(frame, camera_config, frame_width, frame_height, came
     if cropped.shape[:2] == (frame_height, frame_width):
         return cropped
     
-    zoomed = cv2.resize(cropped, (frame_width, frame_height), interpolation=cv2.INTER_LINEAR)
+    zoomed = cv2.resize(cropped, (frame_width, frame_height), dst=dst, interpolation=cv2.INTER_LINEAR)
     
     return zoomed
 
 
-def generate_camera_sequence_frames(base_frame, cameras, frame_rate, target_width, target_height):
-    """Generate frames for a sequence of camera movements.
+# Interpolations disponibles pour les caméras ("interpolation" dans la config)
+CAMERA_INTERPOLATIONS = {
+    'linear': cv2.INTER_LINEAR,
+    'cubic': cv2.INTER_CUBIC,
+    'lanczos': cv2.INTER_LANCZOS4,
+}
+
+
+class CameraPyramid:
+    """Pyramide d'images (mip-maps) d'une trame, construite une fois par séquence caméra.
+    
+    Chaque vue est échantillonnée par un seul warpAffine (position sous-pixel,
+    donc panoramiques fluides) depuis le niveau le plus proche de sa
+    réduction, dans un tampon préalloué. Les niveaux réduits ne sont calculés
+    qu'à la première vue qui en a besoin. Une vue alignée sur les pixels du
+    niveau 0 passe par crop + cv2.resize, plus rapide à résultat égal.
+    """
+    
+    def __init__(self, frame):
+        self.levels = [frame]
+    
+    def level(self, index):
+        """Niveau index de la pyramide (ou le plus petit niveau disponible)."""
+        while len(self.levels) <= index and min(self.levels[-1].shape[:2]) >= 2:
+            self.levels.append(cv2.pyrDown(self.levels[-1]))
+        return min(index, len(self.levels) - 1)
+    
+    def render(self, camera_config, frame_width, frame_height, camera_size=None, dst=None,
+               interpolation='linear'):
+        """Vue de la caméra (mêmes paramètres que apply_camera_transform).
+        
+        Args:
+            camera_config: Dictionary with camera settings (zoom, position, size)
+            frame_width: Target frame width
+            frame_height: Target frame height
+            camera_size: Optional dict with 'width' and 'height' for camera viewport size
+            dst: Optional (frame_height, frame_width) output buffer
+            interpolation: 'linear', 'cubic' or 'lanczos'
+        
+        Returns:
+            Transformed frame (dst, or a view of the frame when the viewport
+            is pixel-aligned and needs no scaling)
+        """
+        base = self.levels[0]
+        h, w = base.shape[:2]
+        zoom = camera_config.get('zoom', 1.0)
+        position = camera_config.get('position', {'x': 0.5, 'y': 0.5})
+        if camera_size is None:
+            camera_size = camera_config.get('size', None)
+        
+        # Viewport en coordonnées flottantes (pas d'arrondi au pixel)
+        if camera_size:
+            viewport_w = float(camera_size.get('width', w))
+            viewport_h = float(camera_size.get('height', h))
+        else:
+            viewport_w = w / zoom
+            viewport_h = h / zoom
+        viewport_w = min(viewport_w, w)
+        viewport_h = min(viewport_h, h)
+        x1 = min(max(0.0, w * position['x'] - viewport_w / 2), w - viewport_w)
+        y1 = min(max(0.0, h * position['y'] - viewport_h / 2), h - viewport_h)
+        
+        scale_x = viewport_w / frame_width
+        scale_y = viewport_h / frame_height
+        # Réduction résiduelle entre 1 et 2 sur le niveau choisi
+        level_index = int(np.log2(max(min(scale_x, scale_y), 1.0)))
+        
+        aligned = all(float(v).is_integer() for v in (x1, y1, viewport_w, viewport_h))
+        if aligned and level_index == 0:
+            x1, y1, x2, y2 = int(x1), int(y1), int(x1 + viewport_w), int(y1 + viewport_h)
+            cropped = base[y1:y2, x1:x2]
+            if cropped.shape[:2] == (frame_height, frame_width):
+                return cropped
+            return cv2.resize(cropped, (frame_width, frame_height), dst=dst,
+                              interpolation=CAMERA_INTERPOLATIONS.get(interpolation, cv2.INTER_LINEAR))
+        
+        level_index = self.level(level_index)
+        factor = 2 ** level_index
+        
+        # Pixel de sortie (u, v) -> coordonnées dans le niveau (centres de pixels alignés)
+        matrix = np.array([
+            [scale_x / factor, 0, (x1 + 0.5 * scale_x) / factor - 0.5],
+            [0, scale_y / factor, (y1 + 0.5 * scale_y) / factor - 0.5],
+        ])
+        flags = CAMERA_INTERPOLATIONS.get(interpolation, cv2.INTER_LINEAR) | cv2.WARP_INVERSE_MAP
+        return cv2.warpAffine(
+            self.levels[level_index], matrix, (frame_width, frame_height), dst=dst,
+            flags=flags, borderMode=cv2.BORDER_REPLICATE
+        )
+
+
+def camera_output_buffers(base_frame, target_width, target_height):
+    """Deux tampons de sortie alternés pour les générateurs de trames caméra."""
+    shape = (target_height, target_width) + base_frame.shape[2:]
+    return [np.empty(shape, dtype=base_frame.dtype) for _ in range(2)]
+
+
+def camera_sequence_arrays(cameras, frame_rate):
+    """État de la caméra à chaque trame d'une séquence de caméras, calculé en une passe.
     
     Args:
-        base_frame: The base frame to apply cameras to
-        cameras: List of camera configurations, each with:
-            - size: dict with width, height (optional, uses aspect ratio by default)
-            - zoom: zoom level (default 1.0)
-            - position: dict with x, y (0.0-1.0, default 0.5, 0.5)
-            - duration: how long to hold this camera view in seconds
-            - transition_duration: time to transition from previous camera (default 0)
-            - easing: easing function type for transition (default 'ease_out')
+        cameras: Liste de caméras (voir generate_camera_sequence_frames)
         frame_rate: Video frame rate
-        target_width: Output frame width
-        target_height: Output frame height
     
     Returns:
-        List of frames for the entire camera sequence
+        dict de listes d'une entrée par trame: zoom, x, y, size (dict ou None),
+        interpolation, et changed (vrai quand la vue change à cette trame:
+        chaque trame de transition et le début de chaque maintien).
     """
-    if not cameras or len(cameras) == 0:
-        return [base_frame]
+    state = {'zoom': [], 'x': [], 'y': [], 'size': [], 'interpolation': [], 'changed': []}
     
-    all_frames = []
-    prev_camera = None
+    def add(zoom, x, y, size, interpolation, count=1):
+        state['zoom'].extend([zoom] * count)
+        state['x'].extend([x] * count)
+        state['y'].extend([y] * count)
+        state['size'].extend([size] * count)
+        state['interpolation'].extend([interpolation] * count)
+        state['changed'].extend([True] + [False] * (count - 1))
     
-    for camera_idx, camera in enumerate(cameras):
+    prev_camera = None
+    for camera_idx, camera in enumerate(cameras or []):
         # Extract camera parameters
         camera_zoom = camera.get('zoom', 1.0)
         camera_pos = camera.get('position', {'x': 0.5, 'y': 0.5})
@@ -1094,6 +1162,7 @@ def generate_camera_sequence_frames(base_frame, cameras, frame_rate, target_widt
         duration = camera.get('duration', 2.0)
         transition_duration = camera.get('transition_duration', 0)
         easing = camera.get('easing', 'ease_out')
+        interpolation = camera.get('interpolation', 'linear')
         
         # Calculate frame counts
         hold_frames = int(frame_rate * duration)
@@ -1103,7 +1172,7 @@ def generate_camera_sequence_frames(base_frame, cameras, frame_rate, target_widt
         if transition_frames > 0:
             print(f"       Transition: {transition_duration}s with {easing} easing")
         
-        # Generate transition frames from previous camera to current
+        # Transition frames from previous camera to current
         if prev_camera and transition_frames > 0:
             prev_zoom = prev_camera.get('zoom', 1.0)
             prev_pos = prev_camera.get('position', {'x': 0.5, 'y': 0.5})
@@ -1113,13 +1182,6 @@ def generate_camera_sequence_frames(base_frame, cameras, frame_rate, target_widt
                 progress = i / max(1, transition_frames - 1) if transition_frames > 1 else 1.0
                 eased_progress = easing_function(progress, easing)
                 
-                # Interpolate camera parameters
-                current_zoom = prev_zoom + (camera_zoom - prev_zoom) * eased_progress
-                current_pos = {
-                    'x': prev_pos['x'] + (camera_pos['x'] - prev_pos['x']) * eased_progress,
-                    'y': prev_pos['y'] + (camera_pos['y'] - prev_pos['y']) * eased_progress
-                }
-                
                 # Interpolate size if both cameras have size specified
                 current_size = None
                 if prev_size and camera_size:
@@ -1130,46 +1192,97 @@ def generate_camera_sequence_frames(base_frame, cameras, frame_rate, target_widt
                 elif camera_size:
                     current_size = camera_size
                 
-                # Apply camera transform
-                interpolated_camera = {
-                    'zoom': current_zoom,
-                    'position': current_pos,
-                    'size': current_size
-                }
-                
-                frame = apply_camera_transform(
-                    base_frame.copy(),
-                    interpolated_camera,
-                    target_width,
-                    target_height,
-                    current_size
-                )
-                all_frames.append(frame)
-        
-        # Generate hold frames at current camera position
-        camera_config = {
-            'zoom': camera_zoom,
-            'position': camera_pos,
-            'size': camera_size
-        }
+                add(prev_zoom + (camera_zoom - prev_zoom) * eased_progress,
+                    prev_pos['x'] + (camera_pos['x'] - prev_pos['x']) * eased_progress,
+                    prev_pos['y'] + (camera_pos['y'] - prev_pos['y']) * eased_progress,
+                    current_size, interpolation)
         
-        for i in range(hold_frames):
-            frame = apply_camera_transform(
-                base_frame.copy(),
-                camera_config,
-                target_width,
-                target_height,
-                camera_size
-            )
-            all_frames.append(frame)
+        # Hold frames at current camera position: the view does not move
+        if hold_frames > 0:
+            add(camera_zoom, camera_pos['x'], camera_pos['y'], camera_size, interpolation, hold_frames)
         
         prev_camera = camera
+    return state
+
+
+def camera_sequence_runs(base_frame, cameras, frame_rate, target_width, target_height, start_frame=0,
+                         state=None):
+    """(trame, longueur de la suite) d'une séquence de caméras, à partir de start_frame.
+    
+    Les états de la caméra sont précalculés (camera_sequence_arrays, ou state
+    s'il a déjà été calculé); une vue
+    n'est rendue qu'au début d'une suite de trames identiques, et les trames
+    avant start_frame ne sont pas rendues. Les trames suivent les règles de
+    generate_camera_sequence_frames (tampons alternés, à copier avant de les
+    garder).
+    """
+    if state is None:
+        state = camera_sequence_arrays(cameras, frame_rate)
+    changed = state['changed']
+    frame_count = len(changed)
+    start_frame = max(0, start_frame)
+    if start_frame >= frame_count:
+        return
+    bounds = [start_frame] + [i for i in range(start_frame + 1, frame_count) if changed[i]] + [frame_count]
+    
+    pyramid = CameraPyramid(base_frame)
+    out_buffers = camera_output_buffers(base_frame, target_width, target_height)
+    out_idx = 0
+    for first, last in zip(bounds, bounds[1:]):
+        size = state['size'][first]
+        camera_config = {
+            'zoom': state['zoom'][first],
+            'position': {'x': state['x'][first], 'y': state['y'][first]},
+            'size': size
+        }
+        frame = pyramid.render(
+            camera_config,
+            target_width,
+            target_height,
+            size,
+            dst=out_buffers[out_idx],
+            interpolation=state['interpolation'][first]
+        )
+        out_idx ^= 1
+        yield frame, last - first
+
+
+def generate_camera_sequence_frames(base_frame, cameras, frame_rate, target_width, target_height):
+    """Generate frames for a sequence of camera movements, lazily.
+    
+    Args:
+        base_frame: The base frame to apply cameras to
+        cameras: List of camera configurations, each with:
+            - size: dict with width, height (optional, uses aspect ratio by default)
+            - zoom: zoom level (default 1.0)
+            - position: dict with x, y (0.0-1.0, default 0.5, 0.5)
+            - duration: how long to hold this camera view in seconds
+            - transition_duration: time to transition from previous camera (default 0)
+            - easing: easing function type for transition (default 'ease_out')
+            - interpolation: 'linear' (default), 'cubic' or 'lanczos'
+        frame_rate: Video frame rate
+        target_width: Output frame width
+        target_height: Output frame height
     
-    return all_frames
+    Yields:
+        The frames of the entire camera sequence. The hold frames of a camera
+        are the same array object repeated (a static run, see
+        frame_sink.static_runs). Frames are resized into two alternating
+        buffers, so a frame stays valid until the frame after the next one
+        is requested; frames may also be views of base_frame. Copy a frame
+        before modifying or keeping it.
+    """
+    if not cameras or len(cameras) == 0:
+        yield base_frame
+        return
+    
+    for frame, run_length in camera_sequence_runs(base_frame, cameras, frame_rate, target_width, target_height):
+        for _ in range(run_length):
+            yield frame
 
 
 def apply_post_animation_effect(frames_list, effect_config, frame_rate, target_width, target_height):
-    """Apply post-animation effects like zoom-in or zoom-out.
+    """Apply post-animation effects like zoom-in or zoom-out, lazily.
     
     Args:
         frames_list: List of frames to apply effect to
@@ -1178,11 +1291,15 @@ def apply_post_animation_effect(frames_list, effect_config, frame_rate, target_w
         target_width: Target frame width
         target_height: Target frame height
     
-    Returns:
-        List of frames with effect applied
+    Yields:
+        The frames of frames_list, then the effect frames. Like
+        generate_camera_sequence_frames, effect frames use two alternating
+        buffers (or are views of the last input frame): copy a frame before
+        modifying or keeping it.
     """
+    yield from frames_list
     if not effect_config or len(frames_list) == 0:
-        return frames_list
+        return
     
     effect_type = effect_config.get('type', 'none')
     duration = effect_config.get('duration', 1.0)
@@ -1190,15 +1307,17 @@ def apply_post_animation_effect(frames_list, effect_config, frame_rate, target_w
     end_zoom = effect_config.get('end_zoom', 1.5)
     
     if effect_type == 'none':
-        return frames_list
+        return
     
     effect_frames = int(frame_rate * duration)
     if effect_frames <= 0:
-        return frames_list
+        return
     
-    # Take the last frame as base
-    base_frame = frames_list[-1].copy()
-    effect_frames_list = []
+    # Take the last frame as base (only read, never modified)
+    base_frame = frames_list[-1]
+    pyramid = CameraPyramid(base_frame)
+    out_buffers = camera_output_buffers(base_frame, target_width, target_height)
+    interpolation = effect_config.get('interpolation', 'linear')
     
     for i in range(effect_frames):
         progress = i / max(1, effect_frames - 1)
@@ -1208,7 +1327,8 @@ def apply_post_animation_effect(frames_list, effect_config, frame_rate, target_w
         elif effect_type == 'zoom_out':
             current_zoom = end_zoom - (end_zoom - start_zoom) * progress
         else:
-            effect_frames_list.append(base_frame.copy())
+            # Unknown effect: hold the base frame (static run)
+            yield base_frame
             continue
         
         # Apply zoom
@@ -1217,10 +1337,10 @@ def apply_post_animation_effect(frames_list, effect_config, frame_rate, target_w
             'position': effect_config.get('focus_position', {'x': 0.5, 'y': 0.5})
         }
         
-        transformed = apply_camera_transform(base_frame, camera_config, target_width, target_height)
-        effect_frames_list.append(transformed)
-    
-    return frames_list + effect_frames_list
+        yield pyramid.render(
+            camera_config, target_width, target_height, dst=out_buffers[i % 2],
+            interpolation=interpolation
+        )
 
 
 def draw_hand_on_img(
@@ -1332,7 +1452,96 @@ def draw_eraser_on_img(
     return drawing
 
 
-def apply_push_animation_with_hand(frame, animation_config, frame_index, total_frames, frame_rate, hand, hand_mask_inv, hand_ht, hand_wd):
+class HandCompositor:
+    """Composite the hand (or eraser) over a live drawing canvas in place.
+
+    Keeps one reusable output buffer in sync with the canvas by copying back
+    only the regions that changed since the last composited frame (regions
+    reported with mark_dirty plus the area the hand covered), then blends the
+    hand into its ROI with a precomputed uint8 mask. A watermark, if given, is
+    blended last and its ROI restored on the next call like the hand's. Steps
+    that are not written to the video only need mark_dirty; compose is called
+    for emitted frames.
+
+    The buffer returned by compose is overwritten by the next call, so it must
+    be consumed (written or copied) before then.
+    """
+
+    def __init__(self, canvas, overlay=None, overlay_mask_inv=None, watermark=None):
+        """
+        Args:
+            canvas: The drawing canvas (numpy array BGR), read but never modified
+            overlay: Hand or eraser image with a black background, or None for no overlay
+            overlay_mask_inv: Inverted overlay mask in [0, 1] (as built by preprocess_hand_image)
+            watermark: PreparedWatermark blended on top of every composited frame, or None
+        """
+        self.canvas = canvas
+        self.frame = canvas.copy()
+        self.overlay = overlay
+        self.watermark = watermark
+        self.overlay_mask_inv = None
+        if overlay is not None:
+            mask_inv = np.rint(np.asarray(overlay_mask_inv) * 255).astype(np.uint8)
+            self.overlay_mask_inv = cv2.merge([mask_inv, mask_inv, mask_inv])
+        self._dirty = []
+        self._overlay_roi = None
+        self._watermark_roi = None
+
+    def mark_dirty(self, y_start, y_end, x_start, x_end):
+        """Record a canvas region that changed since the last composited frame."""
+        self._dirty.append((y_start, y_end, x_start, x_end))
+
+    def compose(self, x=None, y=None):
+        """Update the output buffer and draw the overlay with its top-left at (x, y).
+
+        Returns:
+            The output buffer (numpy array BGR)
+        """
+        for roi in (self._overlay_roi, self._watermark_roi):
+            if roi is not None:
+                self._dirty.append(roi)
+        self._overlay_roi = None
+        self._watermark_roi = None
+        for y_start, y_end, x_start, x_end in self._dirty:
+            self.frame[y_start:y_end, x_start:x_end] = self.canvas[y_start:y_end, x_start:x_end]
+        self._dirty.clear()
+
+        if self.overlay is not None and x is not None and y is not None:
+            self._draw_overlay(x, y)
+
+        if self.watermark is not None:
+            prepared = self.watermark.region(*self.frame.shape[:2])
+            if prepared is not None:
+                self.watermark.apply(self.frame)
+                self._watermark_roi = prepared[:4]
+        return self.frame
+
+    def _draw_overlay(self, x, y):
+        img_ht, img_wd = self.frame.shape[:2]
+        crop_ht = min(img_ht - y, self.overlay.shape[0])
+        crop_wd = min(img_wd - x, self.overlay.shape[1])
+        if crop_ht <= 0 or crop_wd <= 0:
+            return
+
+        roi = self.frame[y:y + crop_ht, x:x + crop_wd]
+        # Clear the overlay area with the inverted mask, then add the overlay
+        cv2.multiply(roi, self.overlay_mask_inv[:crop_ht, :crop_wd], dst=roi, scale=1.0 / 255)
+        cv2.add(roi, self.overlay[:crop_ht, :crop_wd], dst=roi)
+        self._overlay_roi = (y, y + crop_ht, x, x + crop_wd)
+
+
+def create_hand_compositor(variables, mode, eraser=None, eraser_mask_inv=None):
+    """Create the HandCompositor matching a drawing mode ('draw', 'eraser' or 'static')."""
+    if mode == 'static':
+        return HandCompositor(variables.drawn_frame, watermark=variables.watermark)
+    if mode == 'eraser' and eraser is not None:
+        return HandCompositor(variables.drawn_frame, eraser, eraser_mask_inv, watermark=variables.watermark)
+    return HandCompositor(
+        variables.drawn_frame, variables.hand, variables.hand_mask_inv, watermark=variables.watermark
+    )
+
+
+def apply_push_animation_with_hand(frame, animation_config, frame_index, total_frames, frame_rate, hand, hand_mask_inv, hand_ht, hand_wd, pool=None):
     """Apply push animation with hand overlay to a frame.
     
     Args:
@@ -1345,6 +1554,7 @@ def apply_push_animation_with_hand(frame, animation_config, frame_index, total_f
         hand_mask_inv: Inverted hand mask (numpy array)
         hand_ht: Hand height
         hand_wd: Hand width
+        pool: Optional FrameBufferPool providing the result buffer
         
     Returns:
         Animated frame with hand overlay
@@ -1365,7 +1575,7 @@ def apply_push_animation_with_hand(frame, animation_config, frame_index, total_f
     progress = easing_function(raw_progress, 'ease_out')
     
     h, w = frame.shape[:2]
-    result = np.ones_like(frame) * 255
+    result = white_frame_like(frame, pool)
     
     # Calculate object position based on eased progress
     if direction == 'left':
@@ -1420,7 +1630,7 @@ def apply_push_animation_with_hand(frame, animation_config, frame_index, total_f
     return result
 
 
-def apply_entrance_animation(frame, animation_config, frame_index, total_frames, frame_rate):
+def apply_entrance_animation(frame, animation_config, frame_index, total_frames, frame_rate, pool=None):
     """Apply entrance animation to a frame.
     
     Args:
@@ -1429,6 +1639,8 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
         frame_index: Current frame index in the animation
         total_frames: Total number of frames in the animation
         frame_rate: Frame rate of the video
+        pool: Optional FrameBufferPool providing the result buffer (release it
+            with pool.release once the frame has been used)
         
     Returns:
         Animated frame
@@ -1446,15 +1658,15 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
     progress = frame_index / anim_frames
     
     if anim_type == 'fade_in':
-        # Fade from white to image
-        white = np.ones_like(frame) * 255
-        return cv2.addWeighted(white, 1 - progress, frame, progress, 0)
+        # Fade from white to image (white * (1 - progress) + frame * progress)
+        result = pool.acquire(frame.shape, frame.dtype) if pool is not None else None
+        return cv2.addWeighted(frame, progress, frame, 0, 255 * (1 - progress), dst=result)
     
     elif anim_type == 'slide_in_left':
         # Slide in from left
         h, w = frame.shape[:2]
         offset = int(w * (1 - progress))
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < w:
             result[:, offset:] = frame[:, :w-offset]
         return result
@@ -1463,7 +1675,7 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
         # Slide in from right
         h, w = frame.shape[:2]
         offset = int(w * (1 - progress))
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < w:
             result[:, :w-offset] = frame[:, offset:]
         return result
@@ -1472,7 +1684,7 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
         # Slide in from top
         h, w = frame.shape[:2]
         offset = int(h * (1 - progress))
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < h:
             result[offset:, :] = frame[:h-offset, :]
         return result
@@ -1481,7 +1693,7 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
         # Slide in from bottom
         h, w = frame.shape[:2]
         offset = int(h * (1 - progress))
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < h:
             result[:h-offset, :] = frame[offset:, :]
         return result
@@ -1493,7 +1705,7 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
         new_h, new_w = int(h * scale), int(w * scale)
         resized = cv2.resize(frame, (new_w, new_h))
         
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         y_offset = (h - new_h) // 2
         x_offset = (w - new_w) // 2
         result[y_offset:y_offset+new_h, x_offset:x_offset+new_w] = resized
@@ -1504,7 +1716,7 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
         # Direction can be: push_from_left, push_from_right, push_from_top, push_from_bottom
         direction = anim_type.replace('push_from_', '')
         h, w = frame.shape[:2]
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         
         if direction == 'left':
             # Push from left side
@@ -1537,7 +1749,7 @@ def apply_entrance_animation(frame, animation_config, frame_index, total_frames,
     return frame
 
 
-def apply_exit_animation(frame, animation_config, frame_index, total_frames, frame_rate):
+def apply_exit_animation(frame, animation_config, frame_index, total_frames, frame_rate, pool=None):
     """Apply exit animation to a frame.
     
     Args:
@@ -1546,6 +1758,8 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
         frame_index: Current frame index in the animation (from start of exit)
         total_frames: Total number of frames in the exit animation
         frame_rate: Frame rate of the video
+        pool: Optional FrameBufferPool providing the result buffer (release it
+            with pool.release once the frame has been used)
         
     Returns:
         Animated frame
@@ -1559,20 +1773,20 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
     
     if frame_index >= anim_frames:
         # Animation complete, return white frame
-        return np.ones_like(frame) * 255
+        return white_frame_like(frame, pool)
     
     progress = frame_index / anim_frames
     
     if anim_type == 'fade_out':
-        # Fade to white
-        white = np.ones_like(frame) * 255
-        return cv2.addWeighted(frame, 1 - progress, white, progress, 0)
+        # Fade to white (frame * (1 - progress) + white * progress)
+        result = pool.acquire(frame.shape, frame.dtype) if pool is not None else None
+        return cv2.addWeighted(frame, 1 - progress, frame, 0, 255 * progress, dst=result)
     
     elif anim_type == 'slide_out_left':
         # Slide out to left
         h, w = frame.shape[:2]
         offset = int(w * progress)
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < w:
             result[:, :w-offset] = frame[:, offset:]
         return result
@@ -1581,7 +1795,7 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
         # Slide out to right
         h, w = frame.shape[:2]
         offset = int(w * progress)
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < w:
             result[:, offset:] = frame[:, :w-offset]
         return result
@@ -1590,7 +1804,7 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
         # Slide out to top
         h, w = frame.shape[:2]
         offset = int(h * progress)
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < h:
             result[:h-offset, :] = frame[offset:, :]
         return result
@@ -1599,7 +1813,7 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
         # Slide out to bottom
         h, w = frame.shape[:2]
         offset = int(h * progress)
-        result = np.ones_like(frame) * 255
+        result = white_frame_like(frame, pool)
         if offset < h:
             result[offset:, :] = frame[:h-offset, :]
         return result
@@ -1611,7 +1825,6 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
         new_h, new_w = int(h * scale), int(w * scale)
         resized = cv2.resize(frame, (new_w, new_h))
         
-        result = np.ones_like(frame) * 255
         y_offset = (h - new_h) // 2
         x_offset = (w - new_w) // 2
         
@@ -1622,8 +1835,10 @@ def apply_exit_animation(frame, animation_config, frame_index, total_frames, fra
         x2 = x1 + w
         
         if y2 <= new_h and x2 <= new_w:
-            result = resized[y1:y2, x1:x2]
-        return result
+            if pool is None:
+                return resized[y1:y2, x1:x2]
+            return pool.copy(resized[y1:y2, x1:x2])
+        return white_frame_like(frame, pool)
     
     return frame
 
@@ -1916,7 +2131,7 @@ def apply_speed_curve(t, speed_profile='linear'):
         return t
 
 
-def draw_path_progressive(frame, path_config, progress, color=(0, 0, 0), thickness=2):
+def draw_path_progressive(frame, path_config, progress, color=(0, 0, 0), thickness=2, in_place=False):
     """Draw a path progressively from start to current progress.
     
     Args:
@@ -1925,11 +2140,12 @@ def draw_path_progressive(frame, path_config, progress, color=(0, 0, 0), thickne
         progress: How much of the path to draw (0 to 1)
         color: Line color (BGR tuple)
         thickness: Line thickness
+        in_place: Draw directly on frame instead of a copy
         
     Returns:
         Frame with path drawn
     """
-    result = frame.copy()
+    result = frame if in_place else frame.copy()
     
     if progress <= 0:
         return result
@@ -1951,7 +2167,8 @@ def draw_path_progressive(frame, path_config, progress, color=(0, 0, 0), thickne
     return result
 
 
-def apply_path_animation(layer_img, path_config, frame_index, total_frames, orient_to_path=False):
+def apply_path_animation(layer_img, path_config, frame_index, total_frames, orient_to_path=False, pool=None,
+                         return_bounds=False):
     """Apply path animation to move and optionally rotate an object along a path.
     
     Args:
@@ -1963,12 +2180,13 @@ def apply_path_animation(layer_img, path_config, frame_index, total_frames, orie
         frame_index: Current frame index
         total_frames: Total frames in animation
         orient_to_path: Whether to rotate object to face path direction
+        pool: Optional FrameBufferPool providing the result buffer
+        return_bounds: Also return the (y1, y2, x1, x2) region the layer was
+            placed in (None when it is off-screen); the frame is white elsewhere
         
     Returns:
-        Positioned and optionally rotated frame
+        Positioned and optionally rotated frame (and its bounds if return_bounds)
     """
-    h, w = layer_img.shape[:2]
-    
     # Calculate progress
     t = frame_index / max(total_frames - 1, 1)
     
@@ -1976,11 +2194,34 @@ def apply_path_animation(layer_img, path_config, frame_index, total_frames, orie
     speed_profile = path_config.get('speed_profile', 'linear')
     t = apply_speed_curve(t, speed_profile)
     
+    return place_on_path(layer_img, path_config, t, orient_to_path, pool, return_bounds)
+
+
+def path_progress(path_config, total_frames):
+    """t sur le chemin de chaque trame d'une animation de chemin (mêmes valeurs que apply_path_animation)."""
+    t = np.arange(total_frames) / max(total_frames - 1, 1)
+    speed_profile = path_config.get('speed_profile', 'linear')
+    if speed_profile == 'ease_in':
+        t = t * t
+    elif speed_profile == 'ease_out':
+        t = 1 - (1 - t) * (1 - t)
+    elif speed_profile == 'ease_in_out':
+        t = np.where(t < 0.5, 2 * t * t, 1 - 2 * (1 - t) * (1 - t))
+    return t.tolist()
+
+
+def place_on_path(layer_img, path_config, t, orient_to_path=False, pool=None, return_bounds=False):
+    """Couche centrée sur le point t (0 à 1) du chemin, sur fond blanc.
+    
+    Voir apply_path_animation pour les arguments et le résultat.
+    """
+    h, w = layer_img.shape[:2]
+    
     # Get position and angle on path
     x, y, angle = evaluate_path_at_time(path_config, t)
     
     # Create white canvas
-    result = np.ones((h, w, 3), dtype=np.uint8) * 255
+    result = pool.white((h, w, 3)) if pool is not None else np.full((h, w, 3), 255, dtype=np.uint8)
     
     # Get layer dimensions
     layer_h, layer_w = layer_img.shape[:2]
@@ -2007,6 +2248,7 @@ def apply_path_animation(layer_img, path_config, frame_index, total_frames, orie
     start_y = center_y - layer_h // 2
     
     # Clip to bounds and place layer
+    bounds = None
     if 0 <= start_x < w and 0 <= start_y < h:
         end_x = min(start_x + layer_w, w)
         end_y = min(start_y + layer_h, h)
@@ -2025,7 +2267,10 @@ def apply_path_animation(layer_img, path_config, frame_index, total_frames, orie
             mask = np.any(layer_region < 250, axis=2)
             
             result[dst_start_y:end_y, dst_start_x:end_x][mask] = layer_region[mask]
+            bounds = (dst_start_y, end_y, dst_start_x, end_x)
     
+    if return_bounds:
+        return result, bounds
     return result
 
 
@@ -2162,22 +2407,17 @@ def draw_character_by_character_text(
                     variables.resize_ht, variables.resize_wd
                 )
             
+            if variables.watermark:
+                drawn_frame_with_hand = variables.watermark.apply(drawn_frame_with_hand)
+            
             # Write frames for this character
-            for _ in range(char_duration_frames):
-                if variables.watermark_path:
-                    drawn_frame_with_hand = apply_watermark(
-                        drawn_frame_with_hand, variables.watermark_path,
-                        variables.watermark_position, variables.watermark_opacity,
-                        variables.watermark_scale
-                    )
-                variables.video_object.write(drawn_frame_with_hand)
-                variables.frames_written += 1
+            write_static_run(variables.video_object, drawn_frame_with_hand, char_duration_frames)
+            variables.frames_written += char_duration_frames
             
             # Pause after character if configured
             if pause_after_char > 0:
-                for _ in range(pause_after_char):
-                    variables.video_object.write(drawn_frame_with_hand)
-                    variables.frames_written += 1
+                write_static_run(variables.video_object, drawn_frame_with_hand, pause_after_char)
+                variables.frames_written += pause_after_char
             
             # Check if word ended (next character is space or we're at end)
             char_idx += 1
@@ -2185,9 +2425,8 @@ def draw_character_by_character_text(
                 if chars_to_draw[char_idx].get('is_space') or chars_to_draw[char_idx].get('is_newline'):
                     # Word ended, apply pause
                     if pause_after_word > 0:
-                        for _ in range(pause_after_word):
-                            variables.video_object.write(drawn_frame_with_hand)
-                            variables.frames_written += 1
+                        write_static_run(variables.video_object, drawn_frame_with_hand, pause_after_word)
+                        variables.frames_written += pause_after_word
 
 
 def draw_word_by_word_text(
@@ -2289,22 +2528,61 @@ def draw_word_by_word_text(
                     variables.resize_ht, variables.resize_wd
                 )
             
+            if variables.watermark:
+                drawn_frame_with_hand = variables.watermark.apply(drawn_frame_with_hand)
+            
             # Write frames for this word
-            for _ in range(word_duration_frames):
-                if variables.watermark_path:
-                    drawn_frame_with_hand = apply_watermark(
-                        drawn_frame_with_hand, variables.watermark_path,
-                        variables.watermark_position, variables.watermark_opacity,
-                        variables.watermark_scale
-                    )
-                variables.video_object.write(drawn_frame_with_hand)
-                variables.frames_written += 1
+            write_static_run(variables.video_object, drawn_frame_with_hand, word_duration_frames)
+            variables.frames_written += word_duration_frames
             
             # Pause after word
             if pause_after_word > 0:
-                for _ in range(pause_after_word):
-                    variables.video_object.write(drawn_frame_with_hand)
-                    variables.frames_written += 1
+                write_static_run(variables.video_object, drawn_frame_with_hand, pause_after_word)
+                variables.frames_written += pause_after_word
+
+
+def text_column_segments(img_thresh, threshold=250, max_gap=3, line_merge_distance=20):
+    """Segments verticaux (x, y_debut, y_fin) du texte, dans l'ordre d'écriture.
+    
+    Les pixels sombres (< threshold) sont parcourus colonne par colonne, de
+    haut en bas ; dans une colonne, un écart de plus de max_gap lignes démarre
+    un nouveau segment. Les segments sont ensuite regroupés en lignes de texte
+    d'après l'histogramme des centres verticaux (un écart de plus de
+    max(line_merge_distance, 1.5 x l'écart moyen) entre centres occupés
+    sépare deux lignes), puis triés par ligne, x et y.
+    """
+    # Parcours colonne par colonne (limité à la boîte englobante du texte) :
+    # coordonnées triées par x puis y
+    mask = img_thresh < threshold
+    bounds = content_bounds(mask)
+    if bounds is None:
+        return []
+    y1, y2, x1, x2 = bounds
+    xs, ys = np.nonzero(mask[y1:y2, x1:x2].T)
+    xs += x1
+    ys += y1
+    
+    # Début d'un segment : première ligne sombre d'une colonne ou après un écart
+    starts = np.ones(len(xs), dtype=bool)
+    starts[1:] = (xs[1:] != xs[:-1]) | (np.diff(ys) > max_gap)
+    start_idx = np.flatnonzero(starts)
+    end_idx = np.append(start_idx[1:] - 1, len(xs) - 1)
+    seg_x = xs[start_idx]
+    seg_y_start = ys[start_idx]
+    seg_y_end = ys[end_idx]
+    
+    # Lignes de texte : centres occupés (histogramme), coupés aux grands écarts
+    centers = (seg_y_start + seg_y_end) // 2
+    occupied = np.flatnonzero(np.bincount(centers))
+    line_of_row = np.zeros(len(occupied), dtype=np.int64)
+    if len(occupied) > 1:
+        gaps = np.diff(occupied)
+        gap_threshold = max(line_merge_distance, gaps.sum() / len(gaps) * 1.5)
+        line_of_row[1:] = np.cumsum(gaps > gap_threshold)
+    seg_line = line_of_row[np.searchsorted(occupied, centers)]
+    
+    order = np.lexsort((seg_y_start, seg_x, seg_line))
+    return list(zip(seg_x[order].tolist(), seg_y_start[order].tolist(), seg_y_end[order].tolist()))
 
 
 def draw_text_handwriting(
@@ -2328,98 +2606,11 @@ def draw_text_handwriting(
     if mode == 'eraser':
         variables.drawn_frame[:, :, :] = variables.img
     
-    # Convert to grayscale and threshold to find text pixels
-    img_thresh = variables.img_thresh.copy()
-    
-    # Find all columns that contain black pixels (text)
-    # We'll process column by column from left to right
-    height, width = img_thresh.shape
-    
-    # Find columns with text content
-    columns_with_text = []
-    for x in range(width):
-        column = img_thresh[:, x]
-        if np.any(column < 250):  # Has dark pixels (text)
-            columns_with_text.append(x)
-    
-    if len(columns_with_text) == 0:
+    # Vertical segments of the text pixels, line by line then left to right
+    column_segments = text_column_segments(variables.img_thresh)
+    if len(column_segments) == 0:
         return  # No text to draw
     
-    # For each column, find the vertical segments (top to bottom)
-    column_segments = []
-    for x in columns_with_text:
-        column = img_thresh[:, x]
-        # Find continuous segments in this column
-        text_pixels = np.where(column < 250)[0]
-        
-        if len(text_pixels) > 0:
-            # Group consecutive pixels into segments
-            segments = []
-            start_y = text_pixels[0]
-            prev_y = text_pixels[0]
-            
-            for y in text_pixels[1:]:
-                if y - prev_y > 3:  # Gap detected, start new segment
-                    segments.append((start_y, prev_y))
-                    start_y = y
-                prev_y = y
-            
-            # Add the last segment
-            segments.append((start_y, prev_y))
-            
-            # Add all segments for this column
-            for y_start, y_end in segments:
-                column_segments.append((x, y_start, y_end))
-    
-    # Group segments by line based on y-coordinates
-    # This ensures multiline text is written line-by-line instead of column-by-column across all lines
-    if len(column_segments) > 0:
-        # Find line breaks by detecting significant y-coordinate gaps
-        y_centers = sorted(set((seg[1] + seg[2]) // 2 for seg in column_segments))
-        
-        # Group y_centers into lines (gap threshold is half the average line height)
-        lines = []
-        current_line = [y_centers[0]]
-        
-        if len(y_centers) > 1:
-            # Calculate average distance between consecutive y_centers
-            y_diffs = [y_centers[i+1] - y_centers[i] for i in range(len(y_centers)-1)]
-            avg_diff = sum(y_diffs) / len(y_diffs) if y_diffs else 0
-            gap_threshold = max(20, avg_diff * 1.5)  # Minimum 20px gap or 1.5x average spacing
-            
-            for y_center in y_centers[1:]:
-                if y_center - current_line[-1] > gap_threshold:
-                    # New line detected
-                    lines.append(current_line)
-                    current_line = [y_center]
-                else:
-                    current_line.append(y_center)
-            
-        lines.append(current_line)
-        
-        # Assign each segment to a line based on its y_center
-        def get_line_number(seg):
-            y_center = (seg[1] + seg[2]) // 2
-            for line_idx, line_y_centers in enumerate(lines):
-                if y_center in line_y_centers or any(abs(y_center - ly) <= 5 for ly in line_y_centers):
-                    return line_idx
-            # Fallback: assign to closest line
-            min_dist = float('inf')
-            closest_line = 0
-            for line_idx, line_y_centers in enumerate(lines):
-                for ly in line_y_centers:
-                    dist = abs(y_center - ly)
-                    if dist < min_dist:
-                        min_dist = dist
-                        closest_line = line_idx
-            return closest_line
-        
-        # Sort segments: first by line number, then by x coordinate (left to right), then by y
-        column_segments.sort(key=lambda seg: (get_line_number(seg), seg[0], seg[1]))
-    else:
-        # Fallback to original sorting if no segments
-        column_segments.sort(key=lambda seg: (seg[0], seg[1]))
-    
     # Initialize animation data if JSON export is enabled
     if variables.export_json:
         variables.animation_data = {
@@ -2427,6 +2618,9 @@ def draw_text_handwriting(
             "frames_written": []
         }
     
+    # Hand/eraser compositor reusing a single output buffer
+    compositor = create_hand_compositor(variables, mode, eraser, eraser_mask_inv)
+    
     # Draw each segment
     counter = 0
     for seg_idx, (x, y_start, y_end) in enumerate(column_segments):
@@ -2437,51 +2631,17 @@ def draw_text_handwriting(
         else:
             # In draw mode, copy from original image
             variables.drawn_frame[y_start:y_end+1, x] = variables.img[y_start:y_end+1, x]
+        compositor.mark_dirty(y_start, y_end + 1, x, x + 1)
         
         # Calculate hand position at the middle of the segment
         hand_coord_x = x
         hand_coord_y = (y_start + y_end) // 2
         
-        # Draw hand or eraser
-        if mode == 'static':
-            drawn_frame_with_hand = variables.drawn_frame.copy()
-        elif mode == 'eraser' and eraser is not None:
-            drawn_frame_with_hand = draw_eraser_on_img(
-                variables.drawn_frame.copy(),
-                eraser.copy(),
-                hand_coord_x,
-                hand_coord_y,
-                eraser_mask_inv.copy(),
-                eraser_ht,
-                eraser_wd,
-                variables.resize_ht,
-                variables.resize_wd,
-            )
-        else:
-            drawn_frame_with_hand = draw_hand_on_img(
-                variables.drawn_frame.copy(),
-                variables.hand.copy(),
-                hand_coord_x,
-                hand_coord_y,
-                variables.hand_mask_inv.copy(),
-                variables.hand_ht,
-                variables.hand_wd,
-                variables.resize_ht,
-                variables.resize_wd,
-            )
-        
         counter += 1
         # Write frame based on skip rate
         if counter % skip_rate == 0 or seg_idx == len(column_segments) - 1:
-            # Apply watermark if specified
-            if variables.watermark_path:
-                drawn_frame_with_hand = apply_watermark(
-                    drawn_frame_with_hand,
-                    variables.watermark_path,
-                    variables.watermark_position,
-                    variables.watermark_opacity,
-                    variables.watermark_scale
-                )
+            # Draw hand or eraser only for frames that are written
+            drawn_frame_with_hand = compositor.compose(hand_coord_x, hand_coord_y)
             
             variables.video_object.write(drawn_frame_with_hand)
             variables.frames_written += 1
@@ -2513,30 +2673,228 @@ def draw_text_handwriting(
         variables.drawn_frame[:, :, :] = variables.img
 
 
-def draw_masked_object(
-    variables, object_mask=None, skip_rate=5, black_pixel_threshold=10, mode='draw', 
-    eraser=None, eraser_mask_inv=None, eraser_ht=0, eraser_wd=0
+def tile_bounds(tile, split_len, frame_ht, frame_wd):
+    """Bornes (y_start, y_end, x_start, x_end) d'une tuile (les tuiles de bord peuvent être plus petites)."""
+    range_v_start = int(tile[0]) * split_len
+    range_h_start = int(tile[1]) * split_len
+    return (
+        range_v_start, min(range_v_start + split_len, frame_ht),
+        range_h_start, min(range_h_start + split_len, frame_wd)
+    )
+
+
+def tile_center(bounds):
+    """Centre (x, y) d'une tuile, où est placée la main."""
+    range_v_start, range_v_end, range_h_start, range_h_end = bounds
+    return (
+        range_h_start + int((range_h_end - range_h_start) / 2),
+        range_v_start + int((range_v_end - range_v_start) / 2)
+    )
+
+
+def reveal_tiles(canvas, img, tiles, split_len):
+    """Copie d'un coup les tuiles données de img vers canvas (état du dessin après ces tuiles)."""
+    if len(tiles) == 0:
+        return canvas
+    frame_ht, frame_wd = canvas.shape[:2]
+    revealed = np.zeros((-(-frame_ht // split_len), -(-frame_wd // split_len)), dtype=bool)
+    revealed[tiles[:, 0], tiles[:, 1]] = True
+    mask = np.repeat(np.repeat(revealed, split_len, axis=0), split_len, axis=1)[:frame_ht, :frame_wd]
+    canvas[mask] = img[mask]
+    return canvas
+
+
+def replay_tile_order(
+    canvas, img, tile_order, tile_start, tile_end, split_len, skip_rate, compositor, mode='draw', verbose=False
 ):
-    """
-    Implémente la logique de dessin en quadrillage.
-    Sépare l'image en blocs, sélectionne le bloc le plus proche à dessiner
-    et enregistre la trame.
+    """Dessine les tuiles tile_order[tile_start:tile_end] sur canvas.
     
-    Args:
-        mode: 'draw' for normal drawing with hand, 'eraser' for eraser mode, 'static' for no animation
-        eraser: Eraser image (for eraser mode)
-        eraser_mask_inv: Inverted eraser mask (for eraser mode)
-        eraser_ht, eraser_wd: Eraser dimensions
+    Une trame est émise toutes les skip_rate tuiles (compteur global depuis la
+    première tuile) et après la dernière tuile de tile_order, comme dans
+    draw_masked_object.
+    
+    Yields:
+        (tile_idx, frame, tile_bounds, hand_coord) pour chaque trame à écrire;
+        frame est le tampon du compositeur, à consommer avant l'itération suivante
     """
-    # print("Skip Rate: ", skip_rate)
+    frame_ht, frame_wd = canvas.shape[:2]
+    n_tiles = len(tile_order)
     
-    # For eraser mode, start with the full image visible
-    if mode == 'eraser':
-        if object_mask is not None:
-            object_ind = np.where(object_mask == 255)
-            variables.drawn_frame[object_ind] = variables.img[object_ind]
+    for tile_idx in range(tile_start, tile_end):
+        tiles_remaining = n_tiles - tile_idx - 1
+        bounds = tile_bounds(tile_order[tile_idx], split_len, frame_ht, frame_wd)
+        range_v_start, range_v_end, range_h_start, range_h_end = bounds
+        
+        # Appliquer la tuile au cadre de dessin
+        if mode == 'eraser':
+            # En mode eraser, on efface (met en blanc/noir) la tuile
+            canvas[range_v_start:range_v_end, range_h_start:range_h_end] = 255
         else:
-            variables.drawn_frame[:, :, :] = variables.img
+            # En mode normal, on dessine la tuile de l'image originale en couleur
+            canvas[range_v_start:range_v_end, range_h_start:range_h_end] = \
+                img[range_v_start:range_v_end, range_h_start:range_h_end]
+        compositor.mark_dirty(*bounds)
+        
+        # Coordonnées pour le centre de la main/eraser
+        hand_coord = tile_center(bounds)
+        
+        counter = tile_idx + 1
+        if counter % skip_rate == 0 or tiles_remaining == 0:
+            # Dessiner la main ou l'eraser uniquement pour les trames écrites
+            yield tile_idx, compositor.compose(*hand_coord), bounds, hand_coord
+        
+        if verbose and counter % 40 == 0 and tiles_remaining > 0:
+            print(f"Tuiles restantes: {tiles_remaining}")
+
+
+def emitted_tile_steps(n_tiles, skip_rate):
+    """Indices des tuiles après lesquelles replay_tile_order émet une trame."""
+    steps = list(range(skip_rate - 1, n_tiles, skip_rate))
+    if n_tiles > 0 and (not steps or steps[-1] != n_tiles - 1):
+        steps.append(n_tiles - 1)
+    return steps
+
+
+def split_tile_steps(steps, n_tiles, num_chunks):
+    """Découpe [0, n_tiles) en intervalles contigus émettant (à peu près) autant de trames.
+    
+    Returns:
+        Liste des bornes [0, ..., n_tiles]; l'intervalle k va de bornes[k] à bornes[k + 1]
+    """
+    num_chunks = max(1, min(num_chunks, len(steps)))
+    return [0] + [steps[len(steps) * k // num_chunks - 1] + 1 for k in range(1, num_chunks)] + [n_tiles]
+
+
+def build_tile_frame_data(frame_number, tile, bounds, hand_coord, tiles_remaining):
+    """Données JSON d'une trame écrite pendant le dessin en quadrillage."""
+    range_v_start, range_v_end, range_h_start, range_h_end = bounds
+    return {
+        "frame_number": frame_number,
+        "tile_drawn": {
+            "grid_position": [int(tile[0]), int(tile[1])],
+            "pixel_coords": {
+                "x_start": int(range_h_start),
+                "x_end": int(range_h_end),
+                "y_start": int(range_v_start),
+                "y_end": int(range_v_end)
+            }
+        },
+        "hand_position": {
+            "x": int(hand_coord[0]),
+            "y": int(hand_coord[1])
+        },
+        "tiles_remaining": int(tiles_remaining)
+    }
+
+
+def render_drawing_chunk(job):
+    """Rend et encode les trames des tuiles [tile_start, tile_end) dans un segment.
+    
+    Exécutée dans un processus du pool de draw_whiteboard_animations: l'état du
+    canevas au début de l'intervalle est reconstruit directement à partir des
+    tuiles déjà dessinées, sans rejouer les trames précédentes.
+    
+    Returns:
+        Nombre de trames écrites dans le segment
+    """
+    from frame_sink import PyAVFrameSink
+    
+    img = job['img']
+    tile_order = job['tile_order']
+    canvas = np.full(img.shape, 255, dtype=np.uint8)
+    reveal_tiles(canvas, img, tile_order[:job['tile_start']], job['split_len'])
+    compositor = HandCompositor(canvas, job['hand'], job['hand_mask_inv'], watermark=job['watermark'])
+    
+    sink = PyAVFrameSink(
+        job['segment_path'], job['frame_rate'], img.shape[1], img.shape[0], crf=job['crf']
+    )
+    try:
+        for _, frame, _, _ in replay_tile_order(
+            canvas, img, tile_order, job['tile_start'], job['tile_end'],
+            job['split_len'], job['skip_rate'], compositor
+        ):
+            sink.write(frame)
+    finally:
+        sink.release()
+    return sink.frames_written
+
+
+def draw_masked_object_parallel(variables, skip_rate, num_workers, black_pixel_threshold=10):
+    """Variante de draw_masked_object (mode 'draw', sans masque) rendue par plusieurs processus.
+    
+    L'ordre des tuiles est calculé une seule fois, puis les trames émises sont
+    découpées en intervalles contigus; chaque intervalle est rendu et encodé
+    dans un segment par un processus, et les segments sont ajoutés dans l'ordre
+    au SegmentedFrameSink variables.video_object.
+    """
+    cut_black_indices, grid_shape = find_dark_tiles(
+        variables.img_thresh, variables.split_len, black_pixel_threshold
+    )
+    tile_order = plan_tile_drawing_order(cut_black_indices, grid_shape)
+    n_tiles = len(tile_order)
+    steps = emitted_tile_steps(n_tiles, skip_rate)
+    sink = variables.video_object
+    
+    if variables.export_json:
+        variables.animation_data = {"drawing_sequence": [], "frames_written": []}
+        frame_ht, frame_wd = variables.drawn_frame.shape[:2]
+        for frame_number, tile_idx in enumerate(steps):
+            bounds = tile_bounds(tile_order[tile_idx], variables.split_len, frame_ht, frame_wd)
+            variables.animation_data["frames_written"].append(
+                build_tile_frame_data(
+                    frame_number, tile_order[tile_idx], bounds, tile_center(bounds), n_tiles - tile_idx - 1
+                )
+            )
+    
+    boundaries = split_tile_steps(steps, n_tiles, num_workers)
+    jobs = [
+        {
+            'img': variables.img, 'tile_order': tile_order[:tile_end],
+            'tile_start': tile_start, 'tile_end': tile_end,
+            'split_len': variables.split_len, 'skip_rate': skip_rate,
+            'hand': variables.hand, 'hand_mask_inv': variables.hand_mask_inv,
+            'watermark': variables.watermark, 'frame_rate': variables.frame_rate, 'crf': variables.crf,
+            'segment_path': sink.segment_path(f"drawing_{k}"),
+        }
+        for k, (tile_start, tile_end) in enumerate(zip(boundaries, boundaries[1:]))
+    ]
+    print(f"  ⚡ Dessin parallèle: {n_tiles} tuiles, {len(steps)} trames, {len(jobs)} segments")
+    
+    with ProcessPoolExecutor(
+        max_workers=len(jobs), initializer=cv2.setNumThreads, initargs=(1,)
+    ) as executor:
+        for job, frame_count in zip(jobs, executor.map(render_drawing_chunk, jobs)):
+            sink.add_segment(job['segment_path'], frame_count)
+    variables.frames_written += len(steps)
+    
+    # Superposer l'objet original en couleur, comme draw_masked_object
+    variables.drawn_frame[:, :, :] = variables.img
+
+
+def draw_masked_object(
+    variables, object_mask=None, skip_rate=5, black_pixel_threshold=10, mode='draw', 
+    eraser=None, eraser_mask_inv=None, eraser_ht=0, eraser_wd=0
+):
+    """
+    Implémente la logique de dessin en quadrillage.
+    Sépare l'image en blocs, sélectionne le bloc le plus proche à dessiner
+    et enregistre la trame.
+    
+    Args:
+        mode: 'draw' for normal drawing with hand, 'eraser' for eraser mode, 'static' for no animation
+        eraser: Eraser image (for eraser mode)
+        eraser_mask_inv: Inverted eraser mask (for eraser mode)
+        eraser_ht, eraser_wd: Eraser dimensions
+    """
+    # print("Skip Rate: ", skip_rate)
+    
+    # For eraser mode, start with the full image visible
+    if mode == 'eraser':
+        if object_mask is not None:
+            object_ind = np.where(object_mask == 255)
+            variables.drawn_frame[object_ind] = variables.img[object_ind]
+        else:
+            variables.drawn_frame[:, :, :] = variables.img
     
     # Si un masque d'objet est fourni, le seuil s'appliquera uniquement à cette zone
     img_thresh_copy = variables.img_thresh.copy()
@@ -2544,9 +2902,6 @@ def draw_masked_object(
         object_mask_black_ind = np.where(object_mask == 0)
         img_thresh_copy[object_mask_black_ind] = 255
 
-    selected_ind_val = None
-    selected_ind = 0
-    
     # Initialize animation data if JSON export is enabled
     if variables.export_json:
         variables.animation_data = {
@@ -2554,147 +2909,33 @@ def draw_masked_object(
             "frames_written": []
         }
     
-    # Calculer le nombre de coupes pour la grille
-    n_cuts_vertical = int(math.ceil(variables.resize_ht / variables.split_len))
-    n_cuts_horizontal = int(math.ceil(variables.resize_wd / variables.split_len))
-
-    # Construire la grille de tuiles (même les tuiles de bord de taille inégale)
-    grid_of_cuts = []
-    for i in range(n_cuts_vertical):
-        row_cuts = []
-        for j in range(n_cuts_horizontal):
-            y_start = i * variables.split_len
-            y_end = min(y_start + variables.split_len, variables.resize_ht)
-            x_start = j * variables.split_len
-            x_end = min(x_start + variables.split_len, variables.resize_wd)
-            tile = img_thresh_copy[y_start:y_end, x_start:x_end]
-            row_cuts.append(tile)
-        grid_of_cuts.append(row_cuts)
-    
-    # Note: grid_of_cuts is kept as nested lists (not converted to numpy array)
-    # because tiles can have inconsistent sizes at image borders
-
-    # Trouver les tuiles (tiles) contenant au moins un pixel noir
-    cut_black_indices = []
-    for i in range(n_cuts_vertical):
-        for j in range(n_cuts_horizontal):
-            if np.sum(grid_of_cuts[i][j] < black_pixel_threshold) > 0:
-                cut_black_indices.append((i, j))
-    
-    cut_black_indices = np.array(cut_black_indices)
+    # Planifier l'ordre de dessin une seule fois (tuiles contenant au moins un
+    # pixel noir, parcourues du plus proche voisin au plus proche voisin)
+    cut_black_indices, grid_shape = find_dark_tiles(
+        img_thresh_copy, variables.split_len, black_pixel_threshold
+    )
+    tile_order = plan_tile_drawing_order(cut_black_indices, grid_shape)
+    n_tiles = len(tile_order)
 
-    counter = 0
-    # Continue tant qu'il y a des tuiles à dessiner
-    while len(cut_black_indices) > 0:
-        if selected_ind >= len(cut_black_indices):
-            selected_ind = 0 
-            
-        selected_ind_val = cut_black_indices[selected_ind].copy()
-        
-        # Récupérer la tuile à dessiner (peut être de taille variable)
-        tile_to_draw = grid_of_cuts[selected_ind_val[0]][selected_ind_val[1]]
-        tile_ht, tile_wd = tile_to_draw.shape # <-- On récupère la taille réelle
-        
-        # Calculer les coordonnées de la tuile sélectionnée EN UTILISANT LA TAILLE RÉELLE
-        range_v_start = selected_ind_val[0] * variables.split_len
-        range_v_end = range_v_start + tile_ht # MODIFIÉ pour utiliser la taille réelle de la tuile
-        range_h_start = selected_ind_val[1] * variables.split_len
-        range_h_end = range_h_start + tile_wd # MODIFIÉ pour utiliser la taille réelle de la tuile
+    # Compositeur main/eraser réutilisant un seul tampon de sortie
+    compositor = create_hand_compositor(variables, mode, eraser, eraser_mask_inv)
 
-        # Obtenir la tuile correspondante de l'image originale en couleur
-        original_tile = variables.img[range_v_start:range_v_end, range_h_start:range_h_end]
+    # Rejouer l'ordre précalculé
+    for tile_idx, drawn_frame_with_hand, tile_bounds, hand_coord in replay_tile_order(
+        variables.drawn_frame, variables.img, tile_order, 0, n_tiles,
+        variables.split_len, skip_rate, compositor, mode, verbose=True
+    ):
+        variables.video_object.write(drawn_frame_with_hand)
+        variables.frames_written += 1
         
-        # Appliquer la tuile au cadre de dessin
-        if mode == 'eraser':
-            # En mode eraser, on efface (met en blanc/noir) la tuile
-            variables.drawn_frame[range_v_start:range_v_end, range_h_start:range_h_end] = 255
-        else:
-            # En mode normal, on dessine la tuile
-            variables.drawn_frame[range_v_start:range_v_end, range_h_start:range_h_end] = original_tile
-
-        # Coordonnées pour le centre de la main/eraser
-        hand_coord_x = range_h_start + int(tile_wd / 2)
-        hand_coord_y = range_v_start + int(tile_ht / 2)
-        
-        # Dessiner la main ou l'eraser selon le mode
-        if mode == 'static':
-            # Mode statique: pas de main/eraser
-            drawn_frame_with_hand = variables.drawn_frame.copy()
-        elif mode == 'eraser' and eraser is not None:
-            # Mode eraser: utiliser l'image de l'eraser
-            drawn_frame_with_hand = draw_eraser_on_img(
-                variables.drawn_frame.copy(),
-                eraser.copy(),
-                hand_coord_x,
-                hand_coord_y,
-                eraser_mask_inv.copy(),
-                eraser_ht,
-                eraser_wd,
-                variables.resize_ht,
-                variables.resize_wd,
-            )
-        else:
-            # Mode normal: utiliser l'image de la main
-            drawn_frame_with_hand = draw_hand_on_img(
-                variables.drawn_frame.copy(),
-                variables.hand.copy(),
-                hand_coord_x,
-                hand_coord_y,
-                variables.hand_mask_inv.copy(),
-                variables.hand_ht,
-                variables.hand_wd,
-                variables.resize_ht,
-                variables.resize_wd,
-            )
-
-        # Supprimer l'index sélectionné
-        cut_black_indices = np.delete(cut_black_indices, selected_ind, axis=0)
-
-        # Sélectionner le nouvel index le plus proche
-        if len(cut_black_indices) > 0:
-            euc_arr = euc_dist(cut_black_indices, selected_ind_val)
-            selected_ind = np.argmin(euc_arr)
-        else:
-            selected_ind = -1 
-
-        counter += 1
-        if counter % skip_rate == 0 or len(cut_black_indices) == 0:
-            # Apply watermark if specified
-            if variables.watermark_path:
-                drawn_frame_with_hand = apply_watermark(
-                    drawn_frame_with_hand,
-                    variables.watermark_path,
-                    variables.watermark_position,
-                    variables.watermark_opacity,
-                    variables.watermark_scale
+        # Capture animation data if JSON export is enabled
+        if variables.export_json:
+            variables.animation_data["frames_written"].append(
+                build_tile_frame_data(
+                    len(variables.animation_data["frames_written"]), tile_order[tile_idx],
+                    tile_bounds, hand_coord, n_tiles - tile_idx - 1
                 )
-            
-            variables.video_object.write(drawn_frame_with_hand)
-            variables.frames_written += 1
-            
-            # Capture animation data if JSON export is enabled
-            if variables.export_json:
-                frame_data = {
-                    "frame_number": len(variables.animation_data["frames_written"]),
-                    "tile_drawn": {
-                        "grid_position": [int(selected_ind_val[0]), int(selected_ind_val[1])],
-                        "pixel_coords": {
-                            "x_start": int(range_h_start),
-                            "x_end": int(range_h_end),
-                            "y_start": int(range_v_start),
-                            "y_end": int(range_v_end)
-                        }
-                    },
-                    "hand_position": {
-                        "x": int(hand_coord_x),
-                        "y": int(hand_coord_y)
-                    },
-                    "tiles_remaining": int(len(cut_black_indices))
-                }
-                variables.animation_data["frames_written"].append(frame_data)
-
-        if counter % 40 == 0 and len(cut_black_indices) > 0:
-            print(f"Tuiles restantes: {len(cut_black_indices)}")
+            )
 
     # Après avoir dessiné toutes les lignes, superposer l'objet original en couleur
     # (sauf en mode eraser où on veut garder l'état effacé)
@@ -2706,10 +2947,48 @@ def draw_masked_object(
             variables.drawn_frame[:, :, :] = variables.img
 
 
+def open_video_object(variables, frame_sink, start_frame=0):
+    """Installe frame_sink comme variables.video_object.
+    
+    Avec variables.encoder_queue_size > 0, l'encodage se fait dans un thread
+    d'écriture (ThreadedFrameSink): les boucles de rendu ne font que remettre
+    leurs trames dans une file bornée de tampons préalloués. Avec
+    start_frame > 0, les trames précédentes ne sont pas écrites
+    (ResumeFrameSink): voir frames_to_skip.
+    """
+    if variables.encoder_queue_size > 0:
+        frame_sink = ThreadedFrameSink(frame_sink, variables.encoder_queue_size)
+    if start_frame > 0:
+        frame_sink = ResumeFrameSink(frame_sink, start_frame)
+    variables.video_object = frame_sink
+    return frame_sink
+
+
+def release_video_object(variables):
+    """Termine l'encodage de variables.video_object et affiche les métriques de la file."""
+    variables.video_object.release()
+    sink = variables.video_object
+    if isinstance(sink, ResumeFrameSink):
+        sink = sink.sink
+    if isinstance(sink, ThreadedFrameSink):
+        stats = sink.stats()
+        variables.encoder_stats = stats
+        print(f"  ⏱️ Encodeur: file max {stats['max_depth']}/{stats['queue_size']} "
+              f"(moyenne {stats['mean_depth']:.1f}), bloqué {stats['blocked_time']:.2f}s, "
+              f"encodage {stats['encode_time']:.2f}s")
+
+
 def draw_whiteboard_animations(
-    img, mask_path, hand_path, hand_mask_path, save_video_path, variables
+    img, mask_path, hand_path, hand_mask_path, save_video_path, variables, frame_sink=None
 ):
-    """Fonction principale pour orchestrer l'animation de dessin."""
+    """Fonction principale pour orchestrer l'animation de dessin.
+    
+    Args:
+        frame_sink: Sink recevant les trames (voir frame_sink.py). Par défaut,
+            un sink est créé pour save_video_path (H.264 direct si PyAV est installé).
+            Avec variables.frame_workers > 1 et un sink segmenté (create_frame_sink
+            avec segmented=True), le dessin est rendu par plusieurs processus.
+    """
     object_mask_exists = (mask_path is not None)
 
     # 1. Pré-traitement de l'image source et de la main
@@ -2721,17 +3000,12 @@ def draw_whiteboard_animations(
     start_time = time.time()
 
     # 2. Définition de l'objet vidéo
-    if platform == "android":
-        fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-    else:
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v") 
-        
-    variables.video_object = cv2.VideoWriter(
-        save_video_path,
-        fourcc,
-        variables.frame_rate,
-        (variables.resize_wd, variables.resize_ht),
-    )
+    if frame_sink is None:
+        frame_sink = create_frame_sink(
+            save_video_path, variables.frame_rate, variables.resize_wd, variables.resize_ht,
+            crf=variables.crf, platform=platform, segmented=variables.frame_workers > 1
+        )
+    open_video_object(variables, frame_sink)
 
     # 3. Création d'un cadre vide (fond blanc)
     variables.drawn_frame = np.zeros(variables.img.shape, np.uint8) + np.array(
@@ -2740,10 +3014,18 @@ def draw_whiteboard_animations(
 
     # 4. Dessin de l'animation
     # Dessiner l'image entière sans masque
-    draw_masked_object(
-        variables=variables,
-        skip_rate=variables.object_skip_rate,
-    )
+    if variables.frame_workers > 1 and hasattr(frame_sink, 'add_segment'):
+        # Trames du dessin rendues et encodées par segments dans plusieurs processus
+        draw_masked_object_parallel(
+            variables=variables,
+            skip_rate=variables.object_skip_rate,
+            num_workers=variables.frame_workers,
+        )
+    else:
+        draw_masked_object(
+            variables=variables,
+            skip_rate=variables.object_skip_rate,
+        )
 
 
     # 5. Fin de la vidéo avec l'image originale en couleur
@@ -2764,29 +3046,278 @@ def draw_whiteboard_animations(
     if animation_frames > total_frames_needed:
         print(f"  ⚠️ Warning: Animation duration ({animation_duration:.2f}s) exceeds specified duration ({variables.end_gray_img_duration_in_sec}s)")
     
-    for i in range(remaining_frames):
-        final_frame = variables.img.copy()
-        # Apply watermark if specified
-        if variables.watermark_path:
-            final_frame = apply_watermark(
-                final_frame,
-                variables.watermark_path,
-                variables.watermark_position,
-                variables.watermark_opacity,
-                variables.watermark_scale
-            )
-        variables.video_object.write(final_frame)
-        variables.frames_written += 1
+    final_frame = variables.img.copy()
+    # Apply watermark if specified
+    if variables.watermark:
+        final_frame = variables.watermark.apply(final_frame)
+    write_static_run(variables.video_object, final_frame, remaining_frames)
+    variables.frames_written += remaining_frames
+
+    # 6. Fermeture de l'objet vidéo
+    release_video_object(variables)
 
     end_time = time.time()
     print(f"Temps total d'exécution pour le dessin: {end_time - start_time:.2f} secondes")
 
-    # 6. Fermeture de l'objet vidéo
-    variables.video_object.release()
+
+def content_mask(image, pool=None, threshold=250):
+    """Masque booléen (h, w) des pixels non blancs d'une couche."""
+    if pool is None:
+        return np.any(image < threshold, axis=2)
+    below = pool.acquire(image.shape, bool)
+    np.less(image, threshold, out=below)
+    mask = pool.acquire(image.shape[:2], bool)
+    np.any(below, axis=2, out=mask)
+    pool.release(below)
+    return mask
+
+
+def content_bounds(mask):
+    """Boîte englobante (y1, y2, x1, x2) des pixels vrais d'un masque, ou None s'il est vide."""
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    return int(rows[0]), int(rows[-1]) + 1, int(cols[0]), int(cols[-1]) + 1
+
+
+def blend_layer_into(dst, layer, mask, opacity, pool=None):
+    """Compose layer sur dst (en place) là où mask est vrai, avec l'opacité donnée."""
+    where = mask[:, :, None]
+    if opacity < 1.0:
+        blended = pool.acquire(dst.shape, dst.dtype) if pool is not None else None
+        blended = cv2.addWeighted(dst, 1 - opacity, layer, opacity, 0, dst=blended)
+        np.copyto(dst, blended, where=where)
+        if pool is not None:
+            pool.release(blended)
+    else:
+        np.copyto(dst, layer, where=where)
+    return dst
+
+
+def write_camera_frames(variables, frame, count=1):
+    """Écrit une trame produite par un générateur caméra/effet, count fois.
+    
+    La trame peut être une vue de l'état courant ou un tampon réutilisé par
+    le générateur: le watermark est appliqué sur une copie prise du pool.
+    """
+    if variables.watermark:
+        pool = variables.buffer_pool
+        marked = variables.watermark.apply(pool.copy(frame))
+        write_static_run(variables.video_object, marked, count)
+        pool.release(marked)
+    else:
+        write_static_run(variables.video_object, frame, count)
+    variables.frames_written += count
+
+
+def frames_to_skip(variables, count):
+    """Nombre de trames, parmi les count suivantes, qu'un rendu repris (start_frame) n'écrit pas."""
+    return min(count, getattr(variables.video_object, 'pending', 0))
+
+
+def skip_frames(variables, count):
+    """Passe count trames d'avant start_frame sans les composer (voir ResumeFrameSink.advance)."""
+    if count > 0:
+        variables.video_object.advance(count)
+        variables.frames_written += count
+
+
+def load_layer_image(layer, target_width, target_height, base_path="."):
+    """Raster d'une couche (texte, forme ou image) avant échelle, ou None s'il est introuvable."""
+    layer_type = layer.get('type', 'image')
+    if layer_type == 'text':
+        text_config = layer.get('text_config', {})
+        if not text_config or 'text' not in text_config:
+            return None
+        return render_layer_raster('text', text_config, target_width, target_height)
+    if layer_type == 'shape':
+        shape_config = layer.get('shape_config', {})
+        if not shape_config or 'shape' not in shape_config:
+            return None
+        return render_layer_raster('shape', shape_config, target_width, target_height)
+    image_path = layer.get('image_path', '')
+    if not os.path.isabs(image_path):
+        image_path = os.path.join(base_path, image_path)
+    if not os.path.exists(image_path):
+        return None
+    return cv2.imread(image_path)
+
+
+def timeline_layer_state(frames, index, layer, frame):
+    """(opacité, échelle, position, t sur le chemin ou None) de la couche index à une trame.
+    
+    Les propriétés sans piste dans frames (TimelineFrames, ou None sans
+    timeline) prennent la valeur de la configuration de la couche; t vaut 1
+    (fin du chemin) pour une couche avec path_animation.
+    """
+    opacity = layer.get('opacity', 1.0)
+    scale = layer.get('scale', 1.0)
+    position = layer.get('position', {'x': 0, 'y': 0})
+    path_anim = layer.get('path_animation')
+    path_t = 1.0 if path_anim and path_anim.get('enabled', False) else None
+    if frames is None:
+        return opacity, scale, position, path_t
+    prefix = f"layer.{index}."
+    opacity = frames.value(prefix + 'opacity', frame, opacity)
+    for path in frames.property_paths:
+        if path.startswith(prefix + 'opacity.'):
+            opacity *= frames.value(path, frame, 1.0)
+    scale = frames.value(prefix + 'scale', frame, scale)
+    position = frames.value(prefix + 'position', frame) or position
+    if path_t is not None:
+        path_t = frames.value(prefix + 'path', frame, path_t)
+    return max(0.0, min(1.0, opacity)), scale, position, path_t
+
+
+class TimelineCompositor:
+    """Compose les couches d'une slide trame par trame depuis une timeline.
+    
+    Les propriétés animées sont évaluées une seule fois pour toutes les
+    trames (TimelineFrames), puis lues dans des tableaux:
+    
+    - layer.N.opacity (multipliée par les pistes layer.N.opacity.*, ex. .exit)
+    - layer.N.position ({x, y}, coin supérieur gauche), layer.N.scale
+    - layer.N.path (t de 0 à 1 sur le path_animation de la couche)
+    - camera.zoom, camera.position ({x, y} normalisés)
+    
+    N est l'indice de la couche dans la liste de la slide. Les rasters des
+    couches sont chargés une fois; une trame n'est recomposée que si une
+    propriété a changé depuis la précédente, et le rendu peut commencer à
+    n'importe quelle trame.
+    
+    Sans base_frame, les couches sont composées sur un canvas blanc. Avec
+    base_frame (l'état de fin du dessin), seules les couches de layer_indices
+    sont recomposées par-dessus: les autres gardent leur état final (chemin,
+    sortie, caméra, effets). Une propriété sans piste prend sa valeur de fin
+    de dessin (layer.N.path vaut 1).
+    """
+    
+    def __init__(self, layers_config, timeline, frame_count, target_width, target_height,
+                 frame_rate=None, base_path=".", pool=None, base_frame=None, layer_indices=None):
+        if isinstance(timeline, TimelineFrames):
+            self.frames = timeline  # déjà évaluée (slide en cours de rendu)
+        else:
+            self.frames = TimelineFrames(timeline, frame_count, frame_rate)
+        self.width = target_width
+        self.height = target_height
+        self.pool = pool if pool is not None else FrameBufferPool()
+        self.base_frame = base_frame
+        self.layers = []  # (indice dans la slide, configuration, raster) par z_index croissant
+        indexed = sorted(enumerate(layers_config), key=lambda item: item[1].get('z_index', 0))
+        for index, layer in indexed:
+            if layer_indices is not None and index not in layer_indices:
+                continue
+            raster = load_layer_image(layer, target_width, target_height, base_path)
+            if raster is None:
+                print(f"    ⚠️ Couche {index} ignorée par la timeline (source introuvable)")
+                continue
+            self.layers.append((index, layer, raster))
+        self._scaled = {}  # indice -> (échelle, couche mise à l'échelle)
+        self._view = None  # tampon de sortie de la caméra
+        self.compositions = 0
+    
+    @staticmethod
+    def animated_layers(timeline):
+        """Indices N des couches ayant au moins une piste layer.N.* dans la timeline."""
+        indices = set()
+        for path in timeline.property_tracks:
+            parts = path.split('.')
+            if len(parts) > 2 and parts[0] == 'layer' and parts[1].isdigit():
+                indices.add(int(parts[1]))
+        return indices
+    
+    def _scaled_layer(self, index, raster, scale):
+        """(contenu recadré, masque, décalage y, décalage x, hauteur, largeur) de la couche à l'échelle.
+        
+        Recalculé seulement quand l'échelle de la couche change.
+        """
+        cached = self._scaled.get(index)
+        if cached is not None and cached[0] == scale:
+            return cached[1]
+        image = raster
+        if scale != 1.0:
+            new_width = max(1, int(raster.shape[1] * scale))
+            new_height = max(1, int(raster.shape[0] * scale))
+            image = cv2.resize(raster, (new_width, new_height))
+        mask = content_mask(image)
+        bounds = content_bounds(mask)
+        height, width = image.shape[:2]
+        if bounds is None:
+            scaled = (None, None, 0, 0, height, width)
+        else:
+            by1, by2, bx1, bx2 = bounds
+            scaled = (image[by1:by2, bx1:bx2], mask[by1:by2, bx1:bx2], by1, bx1, height, width)
+        self._scaled[index] = (scale, scaled)
+        return scaled
+    
+    def layer_state(self, index, layer, frame):
+        """(opacité, échelle, position, t sur le chemin ou None) d'une couche à une trame."""
+        return timeline_layer_state(self.frames, index, layer, frame)
+    
+    def compose(self, frame, out=None):
+        """Trame composée (dans out si fourni): couches puis caméra de la timeline."""
+        if out is None:
+            out = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        if self.base_frame is None:
+            out.fill(255)
+        else:
+            np.copyto(out, self.base_frame)
+        for index, layer, raster in self.layers:
+            opacity, scale, position, path_t = self.layer_state(index, layer, frame)
+            if opacity <= 0.0:
+                continue
+            image, mask, offset_y, offset_x, layer_h, layer_w = self._scaled_layer(index, raster, scale)
+            if image is None:
+                continue
+            if path_t is not None:
+                # Comme apply_path_animation: couche centrée sur le point du chemin
+                center_x, center_y, _ = evaluate_path_at_time(layer['path_animation'], path_t)
+                x = int(center_x) - layer_w // 2
+                y = int(center_y) - layer_h // 2
+            else:
+                x = int(round(position.get('x', 0)))
+                y = int(round(position.get('y', 0)))
+            x += offset_x
+            y += offset_y
+            content_h, content_w = image.shape[:2]
+            x1, y1 = max(0, x), max(0, y)
+            x2, y2 = min(self.width, x + content_w), min(self.height, y + content_h)
+            if x2 <= x1 or y2 <= y1:
+                continue
+            region = (slice(y1 - y, y2 - y), slice(x1 - x, x2 - x))
+            canvas_roi = out[y1:y2, x1:x2]
+            if layer.get('intelligent_eraser', False):
+                canvas_roi[mask[region]] = 255
+            blend_layer_into(canvas_roi, image[region], mask[region], opacity, self.pool)
+        self.compositions += 1
+        
+        zoom = self.frames.value('camera.zoom', frame, 1.0)
+        position = self.frames.value('camera.position', frame)
+        if zoom == 1.0 and position is None:
+            return out
+        if self._view is None:
+            self._view = np.empty_like(out)
+        camera_config = {'zoom': zoom, 'position': position or {'x': 0.5, 'y': 0.5}}
+        return CameraPyramid(out).render(camera_config, self.width, self.height, dst=self._view)
+    
+    def write(self, variables, start_frame, end_frame):
+        """Écrit les trames [start_frame, end_frame): une composition par suite de trames identiques."""
+        out = self.pool.acquire((self.height, self.width, 3))
+        written = 0
+        for frame, run_length in self.frames.runs(start_frame, end_frame):
+            skipped = frames_to_skip(variables, run_length)
+            skip_frames(variables, skipped)
+            if run_length > skipped:
+                write_camera_frames(variables, self.compose(frame, out), run_length - skipped)
+            written += run_length
+        self.pool.release(out)
+        return written
 
 
 def draw_layered_whiteboard_animations(
-    layers_config, hand_path, hand_mask_path, save_video_path, variables, base_path=".", slide_config=None
+    layers_config, hand_path, hand_mask_path, save_video_path, variables, base_path=".", slide_config=None,
+    frame_sink=None, timeline_config=None, start_frame=0
 ):
     """Dessine une animation avec plusieurs couches, chacune avec son propre skip_rate.
     
@@ -2798,6 +3329,19 @@ def draw_layered_whiteboard_animations(
         variables: Objet AllVariables contenant les paramètres
         base_path: Chemin de base pour résoudre les chemins relatifs
         slide_config: Configuration complète de la slide (pour les cameras, etc.)
+        frame_sink: Sink recevant les trames (voir frame_sink.py). Par défaut,
+            un sink est créé pour save_video_path (H.264 direct si PyAV est installé).
+        timeline_config: Timeline de la slide (format GlobalTimeline.to_dict, temps
+            relatifs au début de la slide), évaluée une fois pour toutes les
+            trames (TimelineFrames). Elle fixe la position et l'échelle de
+            chaque couche au début de son dessin, son opacité à chaque trame
+            et le t de son path_animation (piste layer.N.path). Dans la pause
+            finale, un TimelineCompositor recompose les couches à partir de
+            la première dont la timeline change l'état; les autres gardent
+            leur état de fin du dessin.
+        start_frame: Première trame écrite dans le sink. Les trames précédentes
+            ne sont pas écrites et, pour les chemins, la caméra et la pause
+            finale, pas composées.
     """
     # Trier les couches par z_index
     sorted_layers = sorted(layers_config, key=lambda x: x.get('z_index', 0))
@@ -2831,21 +3375,19 @@ def draw_layered_whiteboard_animations(
     start_time = time.time()
     
     # Créer l'objet vidéo
-    if platform == "android":
-        fourcc = cv2.VideoWriter_fourcc(*"MJPG")
-    else:
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-    
-    variables.video_object = cv2.VideoWriter(
-        save_video_path,
-        fourcc,
-        variables.frame_rate,
-        (variables.resize_wd, variables.resize_ht),
-    )
+    if frame_sink is None:
+        frame_sink = create_frame_sink(
+            save_video_path, variables.frame_rate, variables.resize_wd, variables.resize_ht,
+            crf=variables.crf, platform=platform
+        )
+    open_video_object(variables, frame_sink, start_frame)
     
     # Créer un canvas blanc de base
     base_canvas = np.ones((variables.resize_ht, variables.resize_wd, 3), dtype=np.uint8) * 255
     variables.drawn_frame = base_canvas.copy()
+    # Les trames temporaires (animations, masques) viennent du pool et y
+    # retournent une fois écrites
+    pool = variables.buffer_pool
     
     # Initialiser les données d'animation si export JSON est activé
     if variables.export_json:
@@ -2854,11 +3396,34 @@ def draw_layered_whiteboard_animations(
             "layer_info": []
         }
     
+    # Timeline de la slide: propriétés évaluées une fois (tableaux étendus au
+    # besoin). Pour la pause finale, on garde l'état appliqué de chaque couche
+    # (applied_states) et l'état du dessin avant chaque couche animée par la
+    # timeline (hold_snapshots)
+    slide_frames = None
+    timeline_layers = set()
+    # Indices dans la slide, dans l'ordre de sorted_layers (tri stable)
+    layer_order = sorted(range(len(layers_config)), key=lambda i: layers_config[i].get('z_index', 0))
+    if timeline_config and TIMELINE_AVAILABLE:
+        slide_timeline = GlobalTimeline.from_dict(timeline_config)
+        slide_frames = TimelineFrames(
+            slide_timeline, max(1, int(variables.frame_rate * variables.end_gray_img_duration_in_sec)),
+            variables.frame_rate
+        )
+        timeline_layers = TimelineCompositor.animated_layers(slide_timeline)
+    applied_states = {}
+    hold_snapshots = {}
+    
     # Dessiner chaque couche séquentiellement
     for layer_idx, layer in enumerate(sorted_layers):
         print(f"  🖌️ Dessin de la couche {layer_idx + 1}/{len(sorted_layers)}: " + 
               f"z_index={layer.get('z_index', 0)}")
+        slide_index = layer_order[layer_idx]
+        layer_start = variables.frames_written
+        if slide_index in timeline_layers:
+            hold_snapshots[layer_idx] = variables.drawn_frame.copy()
         
+        layer_full = None
         try:
             # Check if this is a text layer
             layer_type = layer.get('type', 'image')
@@ -2871,8 +3436,8 @@ def draw_layered_whiteboard_animations(
                     continue
                 
                 print(f"    📝 Génération de texte: \"{text_config.get('text', '')[:50]}...\"")
-                layer_img_original = render_text_to_image(
-                    text_config,
+                layer_img_original = render_layer_raster(
+                    'text', text_config,
                     variables.resize_wd,
                     variables.resize_ht
                 )
@@ -2885,8 +3450,8 @@ def draw_layered_whiteboard_animations(
                 
                 shape_type = shape_config.get('shape', 'circle')
                 print(f"    🔷 Génération de forme: {shape_type}")
-                layer_img_original = render_shape_to_image(
-                    shape_config,
+                layer_img_original = render_layer_raster(
+                    'shape', shape_config,
                     variables.resize_wd,
                     variables.resize_ht
                 )
@@ -2905,22 +3470,22 @@ def draw_layered_whiteboard_animations(
                     print(f"    ⚠️ Impossible de lire l'image: {image_path}")
                     continue
             
+            # Position, échelle et opacité de la couche au début de son dessin
+            # (configuration, ou pistes layer.N.* de la timeline)
+            opacity, scale, position, _ = timeline_layer_state(slide_frames, slide_index, layer, layer_start)
+            
             # Appliquer l'échelle
-            scale = layer.get('scale', 1.0)
             if scale != 1.0:
                 new_width = int(layer_img_original.shape[1] * scale)
                 new_height = int(layer_img_original.shape[0] * scale)
                 layer_img_original = cv2.resize(layer_img_original, (new_width, new_height))
             
-            # Obtenir position et opacité
-            position = layer.get('position', {'x': 0, 'y': 0})
-            x_offset = position.get('x', 0)
-            y_offset = position.get('y', 0)
-            opacity = layer.get('opacity', 1.0)
+            x_offset = int(round(position.get('x', 0)))
+            y_offset = int(round(position.get('y', 0)))
             layer_skip_rate = layer.get('skip_rate', variables.object_skip_rate)
             
             # Créer une image complète avec la couche positionnée
-            layer_full = base_canvas.copy()
+            layer_full = pool.copy(base_canvas)
             layer_h, layer_w = layer_img_original.shape[:2]
             
             # Calculer les limites pour copier la couche
@@ -2989,12 +3554,8 @@ def draw_layered_whiteboard_animations(
                 
                 morph_frames = generate_morph_frames(prev_frame, target_preview, morph_frames_count)
                 for morph_frame in morph_frames:
-                    if variables.watermark_path:
-                        morph_frame = apply_watermark(
-                            morph_frame, variables.watermark_path,
-                            variables.watermark_position, variables.watermark_opacity,
-                            variables.watermark_scale
-                        )
+                    if variables.watermark:
+                        morph_frame = variables.watermark.apply(morph_frame)
                     variables.video_object.write(morph_frame)
                     variables.frames_written += 1
                 
@@ -3098,9 +3659,16 @@ def draw_layered_whiteboard_animations(
             # Accumulate frame count from this layer
             variables.frames_written += layer_vars.frames_written
             
-            # Create mask for this layer's content (from the original layer image position)
-            layer_mask = np.any(layer_full < 250, axis=2).astype(np.float32)
-            layer_mask_3d = np.stack([layer_mask] * 3, axis=2)
+            # Create mask for this layer's content (from the original layer image position),
+            # cropped to the content bounding box: every blend below only touches this ROI
+            layer_roi = None
+            if x2 > x1 and y2 > y1:
+                placed_mask = content_mask(layer_full[y1:y2, x1:x2])
+                bounds = content_bounds(placed_mask)
+                if bounds is not None:
+                    by1, by2, bx1, bx2 = bounds
+                    layer_mask = placed_mask[by1:by2, bx1:bx2]
+                    layer_roi = (slice(y1 + by1, y1 + by2), slice(x1 + bx1, x1 + bx2))
             
             # Apply entrance animation to drawn layer before blending
             if entrance_anim and entrance_anim.get('type') != 'none':
@@ -3113,7 +3681,7 @@ def draw_layered_whiteboard_animations(
                 # Generate entrance animation frames
                 for frame_idx in range(entrance_frames):
                     # Start with current state
-                    anim_frame = variables.drawn_frame.copy()
+                    anim_frame = pool.copy(variables.drawn_frame)
                     
                     # Apply entrance animation to the new layer content
                     if is_push_animation:
@@ -3124,10 +3692,11 @@ def draw_layered_whiteboard_animations(
                             frame_idx,
                             entrance_frames,
                             variables.frame_rate,
-                            hand.copy(),
-                            hand_mask_inv.copy(),
+                            hand,
+                            hand_mask_inv,
                             hand_ht,
-                            hand_wd
+                            hand_wd,
+                            pool=pool
                         )
                     else:
                         # Use standard entrance animation
@@ -3136,28 +3705,24 @@ def draw_layered_whiteboard_animations(
                             entrance_anim,
                             frame_idx,
                             entrance_frames,
-                            variables.frame_rate
+                            variables.frame_rate,
+                            pool=pool
                         )
                     
                     # Blend animated layer with current frame
-                    if opacity < 1.0:
-                        layer_content = layer_animated * layer_mask_3d
-                        old_background = anim_frame * layer_mask_3d
-                        blended_layer = cv2.addWeighted(old_background, 1 - opacity, layer_content, opacity, 0)
-                        anim_frame = (layer_mask_3d * blended_layer + 
-                                     (1 - layer_mask_3d) * anim_frame).astype(np.uint8)
-                    else:
-                        anim_frame = np.where(layer_mask_3d > 0, layer_animated, anim_frame).astype(np.uint8)
+                    if layer_roi is not None:
+                        frame_opacity = timeline_layer_state(
+                            slide_frames, slide_index, layer, variables.frames_written
+                        )[0]
+                        blend_layer_into(anim_frame[layer_roi], layer_animated[layer_roi],
+                                         layer_mask, frame_opacity, pool)
                     
                     # Apply watermark and write frame
-                    if variables.watermark_path:
-                        anim_frame = apply_watermark(
-                            anim_frame, variables.watermark_path,
-                            variables.watermark_position, variables.watermark_opacity,
-                            variables.watermark_scale
-                        )
+                    if variables.watermark:
+                        anim_frame = variables.watermark.apply(anim_frame)
                     variables.video_object.write(anim_frame)
                     variables.frames_written += 1
+                    pool.release(anim_frame, layer_animated)
             
             # Apply path animation if configured
             if path_anim and path_anim.get('enabled', False):
@@ -3171,75 +3736,94 @@ def draw_layered_whiteboard_animations(
                 print(f"    🛤️  Path animation: {path_anim.get('type', 'linear')} " +
                       f"({path_frames} frames, orient={orient_to_path}, draw_path={draw_path})")
                 
-                # Generate path animation frames
-                for frame_idx in range(path_frames):
+                # t sur le chemin (piste layer.N.path de la timeline, sinon profil
+                # de vitesse) et opacité de chaque trame
+                path_start = variables.frames_written
+                path_t = None
+                if slide_frames is not None:
+                    path_t = slide_frames.segment(f"layer.{slide_index}.path", path_start, path_frames)
+                if path_t is None:
+                    path_t = path_progress(path_anim, path_frames)
+                path_opacity = [
+                    timeline_layer_state(slide_frames, slide_index, layer, path_start + frame_idx)[0]
+                    for frame_idx in range(path_frames)
+                ]
+                
+                # Une composition par suite de trames identiques (même t, même
+                # opacité; chaque trame diffère quand le chemin est tracé)
+                frame_idx = 0
+                while frame_idx < path_frames:
+                    run_length = 1
+                    if not draw_path:
+                        while (frame_idx + run_length < path_frames
+                               and path_t[frame_idx + run_length] == path_t[frame_idx]
+                               and path_opacity[frame_idx + run_length] == path_opacity[frame_idx]):
+                            run_length += 1
+                    last_run = frame_idx + run_length == path_frames
+                    skipped = frames_to_skip(variables, run_length)
+                    if skipped == run_length and not last_run:
+                        # Avant start_frame: rien à composer
+                        skip_frames(variables, skipped)
+                        frame_idx += run_length
+                        continue
+                    
                     # Start with current state
-                    anim_frame = variables.drawn_frame.copy()
+                    anim_frame = pool.copy(variables.drawn_frame)
                     
                     # Optionally draw the path progressively
                     if draw_path:
                         progress = frame_idx / max(path_frames - 1, 1)
-                        anim_frame = draw_path_progressive(
+                        draw_path_progressive(
                             anim_frame, 
                             path_anim, 
                             progress,
                             tuple(path_color),
-                            path_thickness
+                            path_thickness,
+                            in_place=True
                         )
                     
-                    # Apply path animation to move/rotate the layer
-                    layer_on_path = apply_path_animation(
+                    # Move/rotate the layer to its point on the path
+                    layer_on_path, path_bounds = place_on_path(
                         layer_vars.drawn_frame,
                         path_anim,
-                        frame_idx,
-                        path_frames,
-                        orient_to_path
+                        path_t[frame_idx],
+                        orient_to_path,
+                        pool=pool,
+                        return_bounds=True
                     )
                     
-                    # Create mask for layer on path
-                    path_layer_mask = np.any(layer_on_path < 250, axis=2).astype(np.float32)
-                    path_layer_mask_3d = np.stack([path_layer_mask] * 3, axis=2)
-                    
-                    # Blend layer on path with current frame
-                    if opacity < 1.0:
-                        layer_content = layer_on_path * path_layer_mask_3d
-                        old_background = anim_frame * path_layer_mask_3d
-                        blended_layer = cv2.addWeighted(old_background, 1 - opacity, layer_content, opacity, 0)
-                        anim_frame = (path_layer_mask_3d * blended_layer + 
-                                     (1 - path_layer_mask_3d) * anim_frame).astype(np.uint8)
-                    else:
-                        anim_frame = np.where(path_layer_mask_3d > 0, layer_on_path, anim_frame).astype(np.uint8)
+                    # Blend layer on path with current frame (the layer is white
+                    # outside the region it was placed in)
+                    if path_bounds is not None:
+                        py1, py2, px1, px2 = path_bounds
+                        path_roi = (slice(py1, py2), slice(px1, px2))
+                        path_layer_mask = content_mask(layer_on_path[path_roi])
+                        blend_layer_into(anim_frame[path_roi], layer_on_path[path_roi],
+                                         path_layer_mask, path_opacity[frame_idx])
                     
                     # Apply watermark and write frame
-                    if variables.watermark_path:
-                        anim_frame = apply_watermark(
-                            anim_frame, variables.watermark_path,
-                            variables.watermark_position, variables.watermark_opacity,
-                            variables.watermark_scale
-                        )
-                    variables.video_object.write(anim_frame)
-                    variables.frames_written += 1
-                
-                # Update drawn_frame to final position
-                variables.drawn_frame = anim_frame.copy()
+                    if variables.watermark:
+                        anim_frame = variables.watermark.apply(anim_frame)
+                    skip_frames(variables, skipped)
+                    write_static_run(variables.video_object, anim_frame, run_length - skipped)
+                    variables.frames_written += run_length - skipped
+                    
+                    # Update drawn_frame to final position
+                    if last_run:
+                        variables.drawn_frame = anim_frame.copy()
+                        opacity = path_opacity[-1]
+                    pool.release(anim_frame, layer_on_path)
+                    frame_idx += run_length
+                applied_states[layer_idx] = (opacity, scale, x_offset, y_offset, path_t[-1] if path_t else 1.0)
             else:
                 # Final blend of layer (only when path animation is NOT used)
-                if opacity < 1.0:
-                    # Blend only the layer's pixels
-                    # Where layer has content: blend old background with new layer content
-                    # Where layer has no content: keep the old frame unchanged
-                    layer_content = layer_vars.drawn_frame * layer_mask_3d
-                    old_background = variables.drawn_frame * layer_mask_3d
-                    blended_layer = cv2.addWeighted(old_background, 1 - opacity, layer_content, opacity, 0)
-                    
-                    # Combine: blended layer where mask=1, old frame where mask=0
-                    variables.drawn_frame = (layer_mask_3d * blended_layer + 
-                                            (1 - layer_mask_3d) * variables.drawn_frame).astype(np.uint8)
-                else:
-                    # No opacity blending, just overlay the layer where it has content
-                    variables.drawn_frame = np.where(layer_mask_3d > 0, 
-                                                    layer_vars.drawn_frame, 
-                                                    variables.drawn_frame).astype(np.uint8)
+                # Where layer has content: blend old background with new layer content
+                # Where layer has no content: keep the old frame unchanged
+                opacity = timeline_layer_state(slide_frames, slide_index, layer, variables.frames_written)[0]
+                if layer_roi is not None:
+                    blend_layer_into(variables.drawn_frame[layer_roi], layer_vars.drawn_frame[layer_roi],
+                                     layer_mask, opacity, pool)
+                applied_states[layer_idx] = (opacity, scale, x_offset, y_offset, None)
             
             # Apply exit animation after layer is complete (if this is the last layer or configured)
             if exit_anim and exit_anim.get('type') != 'none':
@@ -3254,23 +3838,27 @@ def draw_layered_whiteboard_animations(
                         exit_anim,
                         frame_idx,
                         exit_frames,
-                        variables.frame_rate
+                        variables.frame_rate,
+                        pool=pool
                     )
+                    if exit_frame is variables.drawn_frame:
+                        # Type inconnu: ne pas appliquer le watermark sur l'état courant
+                        exit_frame = pool.copy(exit_frame)
                     
-                    if variables.watermark_path:
-                        exit_frame = apply_watermark(
-                            exit_frame, variables.watermark_path,
-                            variables.watermark_position, variables.watermark_opacity,
-                            variables.watermark_scale
-                        )
+                    if variables.watermark:
+                        exit_frame = variables.watermark.apply(exit_frame)
                     variables.video_object.write(exit_frame)
                     variables.frames_written += 1
+                    pool.release(exit_frame)
                 
                 # After exit animation, reset to white or keep final frame
                 # depending on whether there are more layers
                 if layer_idx < len(sorted_layers) - 1:
                     # More layers coming, reset to white
                     variables.drawn_frame = base_canvas.copy()
+                    # Les couches effacées ne reviennent pas dans la pause finale
+                    applied_states.clear()
+                    hold_snapshots.clear()
             # Apply camera transformation if specified
             camera_config = layer.get('camera', None)
             if camera_config:
@@ -3288,32 +3876,25 @@ def draw_layered_whiteboard_animations(
                 effect_type = animation_config.get('type', 'none')
                 if effect_type != 'none':
                     print(f"    🎬 Applying animation effect: {effect_type}")
-                    # Create temporary frames for effect
-                    temp_frames = [variables.drawn_frame.copy()]
+                    # Effect frames are generated on demand from the current state
                     effect_frames = apply_post_animation_effect(
-                        temp_frames,
+                        [variables.drawn_frame],
                         animation_config,
                         variables.frame_rate,
                         variables.resize_wd,
                         variables.resize_ht
                     )
+                    next(effect_frames)  # Skip first frame (already written)
                     
                     # Write additional effect frames
-                    for effect_frame in effect_frames[1:]:  # Skip first frame (already written)
-                        if variables.watermark_path:
-                            effect_frame = apply_watermark(
-                                effect_frame,
-                                variables.watermark_path,
-                                variables.watermark_position,
-                                variables.watermark_opacity,
-                                variables.watermark_scale
-                            )
-                        variables.video_object.write(effect_frame)
-                        variables.frames_written += 1
+                    last_effect_frame = None
+                    for effect_frame, run_length in static_runs(effect_frames):
+                        last_effect_frame = effect_frame
+                        write_camera_frames(variables, effect_frame, run_length)
                     
                     # Update drawn_frame to last effect frame
-                    if len(effect_frames) > 0:
-                        variables.drawn_frame = effect_frames[-1].copy()
+                    if last_effect_frame is not None:
+                        variables.drawn_frame = last_effect_frame.copy()
             
             # Apply particle effects if specified
             particle_config = layer.get('particle_effect', None)
@@ -3324,26 +3905,19 @@ def draw_layered_whiteboard_animations(
                 
                 print(f"    ✨ Applying particle effect: {effect_type} ({particle_frames} frames)")
                 
-                # Generate particle effect frames
+                # Generate particle effect frames (one simulation step per frame)
+                particle_runner = ParticleEffectRunner(
+                    particle_config, variables.drawn_frame.shape, variables.frame_rate
+                )
+                particle_frame = pool.acquire(variables.drawn_frame.shape)
                 for frame_idx in range(particle_frames):
-                    particle_frame = apply_particle_effect(
-                        variables.drawn_frame.copy(),
-                        particle_config,
-                        frame_idx,
-                        particle_frames,
-                        variables.frame_rate
-                    )
+                    particle_runner.render_next(variables.drawn_frame, out=particle_frame)
                     
-                    if variables.watermark_path:
-                        particle_frame = apply_watermark(
-                            particle_frame,
-                            variables.watermark_path,
-                            variables.watermark_position,
-                            variables.watermark_opacity,
-                            variables.watermark_scale
-                        )
+                    if variables.watermark:
+                        variables.watermark.apply(particle_frame)
                     variables.video_object.write(particle_frame)
                     variables.frames_written += 1
+                pool.release(particle_frame)
             
             # Enregistrer les infos de la couche pour l'export JSON
             if variables.export_json:
@@ -3360,6 +3934,8 @@ def draw_layered_whiteboard_animations(
         except Exception as e:
             print(f"    ❌ Erreur lors du dessin de la couche: {e}")
             continue
+        finally:
+            pool.release(layer_full)
     
     # Check if there are camera sequences defined at slide level
     camera_sequence = slide_config.get('cameras', None) if slide_config else None
@@ -3367,29 +3943,26 @@ def draw_layered_whiteboard_animations(
     if camera_sequence and len(camera_sequence) > 0:
         # Advanced camera system: multiple cameras with transitions
         print(f"  🎥 Processing camera sequence with {len(camera_sequence)} camera(s)")
-        camera_frames = generate_camera_sequence_frames(
-            variables.drawn_frame.copy(),
+        camera_state = camera_sequence_arrays(camera_sequence, variables.frame_rate)
+        camera_frame_count = len(camera_state['changed'])
+        
+        # One view per run of identical frames (each hold is one static run);
+        # views before start_frame are not rendered
+        camera_skipped = frames_to_skip(variables, camera_frame_count)
+        skip_frames(variables, camera_skipped)
+        for camera_frame, run_length in camera_sequence_runs(
+            variables.drawn_frame,
             camera_sequence,
             variables.frame_rate,
             variables.resize_wd,
-            variables.resize_ht
-        )
-        
-        # Write all camera sequence frames
-        for camera_frame in camera_frames:
-            if variables.watermark_path:
-                camera_frame = apply_watermark(
-                    camera_frame,
-                    variables.watermark_path,
-                    variables.watermark_position,
-                    variables.watermark_opacity,
-                    variables.watermark_scale
-                )
-            variables.video_object.write(camera_frame)
-            variables.frames_written += 1
-        
-        camera_duration = len(camera_frames) / variables.frame_rate
-        print(f"  ⏱️ Camera sequence: {camera_duration:.2f}s ({len(camera_frames)} frames)")
+            variables.resize_ht,
+            start_frame=camera_skipped,
+            state=camera_state
+        ):
+            write_camera_frames(variables, camera_frame, run_length)
+        
+        camera_duration = camera_frame_count / variables.frame_rate
+        print(f"  ⏱️ Camera sequence: {camera_duration:.2f}s ({camera_frame_count} frames)")
     else:
         # Standard final hold behavior
         # Calculate total frames needed for the specified duration
@@ -3409,25 +3982,58 @@ def draw_layered_whiteboard_animations(
         if animation_frames > total_frames_needed:
             print(f"  ⚠️ Warning: Animation duration ({animation_duration:.2f}s) exceeds specified duration ({variables.end_gray_img_duration_in_sec}s)")
         
-        for i in range(remaining_frames):
+        if slide_frames is not None and remaining_frames > 0:
+            # Pause finale pilotée par la timeline, une composition par suite de trames
+            # identiques. Recomposer à partir de la première couche dont la timeline change
+            # l'état appliqué au dessin; en dessous, l'état de fin du dessin est gardé
+            hold_runs = list(slide_frames.runs(animation_frames, total_frames_needed))
+            hold_base = variables.drawn_frame
+            hold_layers = set()
+            for layer_idx in sorted(hold_snapshots):
+                layer = sorted_layers[layer_idx]
+                applied = applied_states.get(layer_idx)
+                if applied is None:
+                    continue
+                for frame, _ in hold_runs:
+                    opacity, scale, position, path_t = timeline_layer_state(
+                        slide_frames, layer_order[layer_idx], layer, frame
+                    )
+                    state = (opacity, scale, int(round(position.get('x', 0))),
+                             int(round(position.get('y', 0))), path_t)
+                    if state != applied:
+                        hold_base = hold_snapshots[layer_idx]
+                        hold_layers = set(layer_order[layer_idx:])
+                        break
+                if hold_layers:
+                    break
+            compositor = TimelineCompositor(
+                layers_config, slide_frames, total_frames_needed,
+                variables.resize_wd, variables.resize_ht, variables.frame_rate, base_path, pool,
+                base_frame=hold_base, layer_indices=hold_layers
+            )
+            compositor.write(variables, animation_frames, total_frames_needed)
+            print(f"  🕒 Timeline: {len(compositor.frames.property_paths)} propriété(s), "
+                  f"{compositor.compositions} composition(s) pour {remaining_frames} trames")
+        else:
             final_frame = variables.drawn_frame.copy()
             # Appliquer le watermark sur l'image finale uniquement
-            if variables.watermark_path:
-                final_frame = apply_watermark(
-                    final_frame,
-                    variables.watermark_path,
-                    variables.watermark_position,
-                    variables.watermark_opacity,
-                    variables.watermark_scale
-                )
-            variables.video_object.write(final_frame)
-            variables.frames_written += 1
+            if variables.watermark:
+                final_frame = variables.watermark.apply(final_frame)
+            write_static_run(variables.video_object, final_frame, remaining_frames)
+            variables.frames_written += remaining_frames
+    
+    # Fermer l'objet vidéo
+    release_video_object(variables)
     
     end_time = time.time()
     print(f"  ⏱️ Temps de dessin des couches: {end_time - start_time:.2f} secondes")
-    
-    # Fermer l'objet vidéo
-    variables.video_object.release()
+    pool_stats = pool.stats()
+    print(f"  ♻️ Tampons: {pool_stats['allocations']} allocations "
+          f"({pool_stats['allocated_mb']} Mo), {pool_stats['reuses']} réutilisations")
+    layer_stats = get_layer_cache().stats()
+    if layer_stats['misses'] or layer_stats['hits'] or layer_stats['disk_hits']:
+        print(f"  🗂️ Cache de couches: {layer_stats['hits'] + layer_stats['disk_hits']} réutilisations "
+              f"({layer_stats['disk_hits']} depuis le disque), {layer_stats['misses']} rendus")
 
 
 def export_animation_json(variables, json_path):
@@ -3579,85 +4185,130 @@ def apply_aspect_ratio_padding(image, target_width, target_height):
     return canvas
 
 
-def apply_watermark(frame, watermark_path, position='bottom-right', opacity=0.5, scale=0.1):
-    """Apply watermark to a frame.
-    
-    Args:
-        frame: Input frame (numpy array)
-        watermark_path: Path to watermark image
-        position: Position string ('top-left', 'top-right', 'bottom-left', 'bottom-right', 'center')
-        opacity: Watermark opacity (0.0 to 1.0)
-        scale: Scale of watermark relative to frame width (0.0 to 1.0)
-    
-    Returns:
-        Frame with watermark applied
+class PreparedWatermark:
+    """Watermark decoded once and pre-blended for each frame size.
+
+    For every (frame size, position, opacity, scale) the resized watermark is
+    premultiplied by its alpha and cached as uint16 planes, so apply() only
+    blends the covered ROI with integer arithmetic.
     """
-    if not watermark_path or not os.path.exists(watermark_path):
-        return frame
-    
-    try:
-        # Load watermark
-        watermark = cv2.imread(watermark_path, cv2.IMREAD_UNCHANGED)
-        if watermark is None:
+
+    MARGIN = 20
+
+    def __init__(self, image, position='bottom-right', opacity=0.5, scale=0.1):
+        """
+        Args:
+            image: Decoded watermark (BGR, BGRA or grayscale numpy array)
+            position: Position string ('top-left', 'top-right', 'bottom-left', 'bottom-right', 'center')
+            opacity: Watermark opacity (0.0 to 1.0)
+            scale: Scale of watermark relative to frame width (0.0 to 1.0)
+        """
+        if image.ndim == 2:
+            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        self.image = image
+        self.position = position
+        self.opacity = opacity
+        self.scale = scale
+        self._prepared = {}
+
+    @classmethod
+    def load(cls, watermark_path, position='bottom-right', opacity=0.5, scale=0.1):
+        """Decode a watermark file, or return None if it is missing or unreadable."""
+        if not watermark_path or not os.path.exists(watermark_path):
+            return None
+        image = cv2.imread(watermark_path, cv2.IMREAD_UNCHANGED)
+        if image is None:
             print(f"⚠️ Warning: Could not load watermark from {watermark_path}")
-            return frame
-        
-        # Calculate watermark size
-        frame_height, frame_width = frame.shape[:2]
+            return None
+        return cls(image, position, opacity, scale)
+
+    def _prepare(self, frame_height, frame_width, position, opacity, scale):
+        """Build (y1, y2, x1, x2, premultiplied BGR, inverse alpha) for a frame size."""
         watermark_width = int(frame_width * scale)
-        watermark_height = int(watermark.shape[0] * (watermark_width / watermark.shape[1]))
-        watermark_resized = cv2.resize(watermark, (watermark_width, watermark_height))
-        
-        # Handle alpha channel
+        watermark_height = int(self.image.shape[0] * (watermark_width / self.image.shape[1]))
+        if watermark_width <= 0 or watermark_height <= 0:
+            return None
+        watermark_resized = cv2.resize(self.image, (watermark_width, watermark_height))
+
+        # Alpha in [0, 255] including the opacity
+        watermark_bgr = watermark_resized[:, :, :3]
         if watermark_resized.shape[2] == 4:
-            # Has alpha channel
-            watermark_bgr = watermark_resized[:, :, :3]
-            watermark_alpha = watermark_resized[:, :, 3] / 255.0 * opacity
+            alpha = np.rint(watermark_resized[:, :, 3] * opacity)
         else:
-            # No alpha channel, use opacity
-            watermark_bgr = watermark_resized
-            watermark_alpha = np.ones((watermark_height, watermark_width)) * opacity
-        
+            alpha = np.full((watermark_height, watermark_width), round(255 * opacity))
+        alpha = np.clip(alpha, 0, 255).astype(np.uint16)[:, :, np.newaxis]
+
         # Calculate position
-        margin = 20
+        margin = self.MARGIN
         if position == 'top-left':
-            y1, y2 = margin, margin + watermark_height
-            x1, x2 = margin, margin + watermark_width
+            y1, x1 = margin, margin
         elif position == 'top-right':
-            y1, y2 = margin, margin + watermark_height
-            x1, x2 = frame_width - watermark_width - margin, frame_width - margin
+            y1, x1 = margin, frame_width - watermark_width - margin
         elif position == 'bottom-left':
-            y1, y2 = frame_height - watermark_height - margin, frame_height - margin
-            x1, x2 = margin, margin + watermark_width
-        elif position == 'bottom-right':
-            y1, y2 = frame_height - watermark_height - margin, frame_height - margin
-            x1, x2 = frame_width - watermark_width - margin, frame_width - margin
+            y1, x1 = frame_height - watermark_height - margin, margin
         elif position == 'center':
-            y1, y2 = (frame_height - watermark_height) // 2, (frame_height + watermark_height) // 2
-            x1, x2 = (frame_width - watermark_width) // 2, (frame_width + watermark_width) // 2
+            y1, x1 = (frame_height - watermark_height) // 2, (frame_width - watermark_width) // 2
         else:
-            # Default to bottom-right
-            y1, y2 = frame_height - watermark_height - margin, frame_height - margin
-            x1, x2 = frame_width - watermark_width - margin, frame_width - margin
-        
-        # Ensure bounds are within frame
+            # 'bottom-right' and unknown positions
+            y1, x1 = frame_height - watermark_height - margin, frame_width - watermark_width - margin
+        y2, x2 = y1 + watermark_height, x1 + watermark_width
+
+        # Ensure bounds are within frame, cropping the watermark if it doesn't fit
         y1, y2 = max(0, y1), min(frame_height, y2)
         x1, x2 = max(0, x1), min(frame_width, x2)
-        
-        # Adjust watermark size if it doesn't fit
-        actual_height = y2 - y1
-        actual_width = x2 - x1
-        if actual_height != watermark_height or actual_width != watermark_width:
-            watermark_bgr = watermark_bgr[:actual_height, :actual_width]
-            watermark_alpha = watermark_alpha[:actual_height, :actual_width]
-        
-        # Apply watermark using alpha blending
+        if y2 <= y1 or x2 <= x1:
+            return None
+        alpha = alpha[:y2 - y1, :x2 - x1]
+        premultiplied = watermark_bgr[:y2 - y1, :x2 - x1].astype(np.uint16) * alpha
+        return y1, y2, x1, x2, premultiplied, 255 - alpha
+
+    def region(self, frame_height, frame_width, position=None, opacity=None, scale=None):
+        """Return the prepared watermark for a frame size (or None if it is not visible)."""
+        position = self.position if position is None else position
+        opacity = self.opacity if opacity is None else opacity
+        scale = self.scale if scale is None else scale
+        key = (frame_height, frame_width, position, opacity, scale)
+        if key not in self._prepared:
+            self._prepared[key] = self._prepare(frame_height, frame_width, position, opacity, scale)
+        return self._prepared[key]
+
+    def apply(self, frame, position=None, opacity=None, scale=None):
+        """Blend the watermark into frame in place and return the frame."""
+        prepared = self.region(frame.shape[0], frame.shape[1], position, opacity, scale)
+        if prepared is None:
+            return frame
+        y1, y2, x1, x2, premultiplied, alpha_inv = prepared
+
+        # roi * (255 - a) + wm * a, then divide by 255 with rounding
         roi = frame[y1:y2, x1:x2]
-        for c in range(3):
-            roi[:, :, c] = roi[:, :, c] * (1 - watermark_alpha) + watermark_bgr[:, :, c] * watermark_alpha
-        
-        frame[y1:y2, x1:x2] = roi
-        
+        blended = roi * alpha_inv
+        blended += premultiplied
+        blended += 128
+        blended += blended >> 8
+        roi[:] = blended >> 8
+        return frame
+
+
+def apply_watermark(frame, watermark, position='bottom-right', opacity=0.5, scale=0.1):
+    """Apply watermark to a frame.
+    
+    Args:
+        frame: Input frame (numpy array)
+        watermark: PreparedWatermark, or path to watermark image (decoded on every call)
+        position: Position string ('top-left', 'top-right', 'bottom-left', 'bottom-right', 'center')
+        opacity: Watermark opacity (0.0 to 1.0)
+        scale: Scale of watermark relative to frame width (0.0 to 1.0)
+    
+    Returns:
+        Frame with watermark applied
+    """
+    if not isinstance(watermark, PreparedWatermark):
+        watermark = PreparedWatermark.load(watermark, position, opacity, scale)
+        if watermark is None:
+            return frame
+    
+    try:
+        return watermark.apply(frame, position, opacity, scale)
     except Exception as e:
         print(f"⚠️ Warning: Error applying watermark: {e}")
     
@@ -3679,6 +4330,9 @@ class AllVariables:
         watermark_position='bottom-right',
         watermark_opacity=0.5,
         watermark_scale=0.1,
+        crf=DEFAULT_CRF,
+        frame_workers=1,
+        encoder_queue_size=DEFAULT_ENCODER_QUEUE_SIZE,
     ):
         self.frame_rate = frame_rate
         self.resize_wd = resize_wd
@@ -3688,10 +4342,18 @@ class AllVariables:
         self.bg_object_skip_rate = bg_object_skip_rate
         self.end_gray_img_duration_in_sec = end_gray_img_duration_in_sec
         self.export_json = export_json
-        self.watermark_path = watermark_path
-        self.watermark_position = watermark_position
-        self.watermark_opacity = watermark_opacity
-        self.watermark_scale = watermark_scale
+        # Watermark décodé une seule fois pour tout le rendu
+        self.watermark = PreparedWatermark.load(
+            watermark_path, watermark_position, watermark_opacity, watermark_scale
+        )
+        self.crf = crf
+        # Nombre de processus pour le rendu des trames du dessin
+        self.frame_workers = frame_workers
+        # Taille de la file du thread d'encodage (0 = encodage synchrone)
+        self.encoder_queue_size = encoder_queue_size
+        self.encoder_stats = None
+        # Tampons réutilisés par le rendu en couches (voir frame_pool.py)
+        self.buffer_pool = FrameBufferPool()
         
         # Variables qui seront ajoutées plus tard
         self.img_ht = None
@@ -3764,8 +4426,8 @@ def compose_layers(layers_config, target_width, target_height, base_path="."):
                     continue
                 
                 print(f"    📝 Génération de texte pour composition")
-                layer_img = render_text_to_image(
-                    text_config,
+                layer_img = render_layer_raster(
+                    'text', text_config,
                     target_width,
                     target_height
                 )
@@ -3778,8 +4440,8 @@ def compose_layers(layers_config, target_width, target_height, base_path="."):
                 
                 shape_type = shape_config.get('shape', 'circle')
                 print(f"    🔷 Génération de forme pour composition: {shape_type}")
-                layer_img = render_shape_to_image(
-                    shape_config,
+                layer_img = render_layer_raster(
+                    'shape', shape_config,
                     target_width,
                     target_height
                 )
@@ -4136,6 +4798,137 @@ def generate_transition_frames(frame1, frame2, transition_type, num_frames, fps)
     return transition_frames
 
 
+def get_transition_for_slide(index, transition_type, transition_duration, per_slide_transitions=None):
+    """Retourne la transition à appliquer avant la vidéo d'indice index (index >= 1).
+    
+    Args:
+        index: Indice de la vidéo qui suit la transition
+        transition_type: Type de transition par défaut
+        transition_duration: Durée de transition par défaut (secondes)
+        per_slide_transitions: Liste de dicts avec configs de transition par slide
+    
+    Returns:
+        Tuple (type, durée, pause_before) de la transition
+    """
+    current_transition_type = transition_type
+    current_transition_duration = transition_duration
+    pause_duration = 0
+    
+    # Si une configuration par slide existe, l'utiliser
+    if per_slide_transitions and index - 1 < len(per_slide_transitions):
+        slide_trans_config = per_slide_transitions[index - 1]
+        if 'type' in slide_trans_config:
+            current_transition_type = slide_trans_config['type']
+        if 'duration' in slide_trans_config:
+            current_transition_duration = slide_trans_config['duration']
+        pause_duration = slide_trans_config.get('pause_before', 0)
+    
+    return current_transition_type, current_transition_duration, pause_duration
+
+
+def probe_stream_copy_params(video_path):
+    """Lit les paramètres du flux vidéo qui doivent être identiques pour une copie de flux.
+    
+    Returns:
+        Tuple (codec, largeur, hauteur, fps, pix_fmt, profil, extradata)
+    """
+    import av
+    with av.open(video_path, mode="r") as container:
+        ctx = container.streams.video[0].codec_context
+        return (
+            ctx.name, ctx.width, ctx.height, container.streams.video[0].average_rate,
+            ctx.pix_fmt, ctx.profile, bytes(ctx.extradata or b"")
+        )
+
+
+def read_boundary_frames(video_path):
+    """Décode la première et la dernière frame d'une vidéo (BGR).
+    
+    Seul le dernier GOP est décodé pour la dernière frame.
+    """
+    import av
+    with av.open(video_path, mode="r") as container:
+        stream = container.streams.video[0]
+        first_frame = next(container.decode(stream), None)
+        if first_frame is None:
+            return None, None
+        first_frame_np = first_frame.to_ndarray(format='bgr24')
+        
+        last_frame = first_frame
+        if stream.duration:
+            container.seek(stream.start_time + stream.duration, backward=True, any_frame=False, stream=stream)
+        for frame in container.decode(stream):
+            last_frame = frame
+        return first_frame_np, last_frame.to_ndarray(format='bgr24')
+
+
+def concatenate_videos_stream_copy(video_paths, output_path, transition_type='none', transition_duration=0.5, per_slide_transitions=None, crf=18):
+    """Concatène des vidéos H.264 par copie de flux (sans ré-encodage des slides).
+    
+    Les packets H.264 des slides sont recopiés tels quels; seuls les segments de
+    pause/transition entre deux slides sont encodés (avec les mêmes paramètres).
+    Requiert que toutes les vidéos aient le même codec, la même résolution, le même
+    fps, le même pix_fmt et le même profil.
+    
+    Returns:
+        True si la concaténation a réussi, False si la copie de flux n'est pas possible
+        (l'appelant doit alors ré-encoder)
+    """
+    from frame_sink import PyAVFrameSink, remux_segments
+    
+    params = probe_stream_copy_params(video_paths[0])
+    if params[0] != "h264" or any(probe_stream_copy_params(p) != params for p in video_paths[1:]):
+        return False
+    _, width, height, fps, _, _, _ = params
+    
+    temp_dir = tempfile.mkdtemp(prefix="concat_")
+    try:
+        # Construire la liste des segments: slides + segments de transition encodés
+        segments = [video_paths[0]]
+        for i in range(1, len(video_paths)):
+            current_transition_type, current_transition_duration, pause_duration = get_transition_for_slide(
+                i, transition_type, transition_duration, per_slide_transitions
+            )
+            num_pause_frames = int(float(fps) * pause_duration) if pause_duration > 0 else 0
+            num_transition_frames = int(float(fps) * current_transition_duration)
+            
+            if num_pause_frames > 0 or (current_transition_type != 'none' and num_transition_frames > 0):
+                _, last_frame = read_boundary_frames(video_paths[i - 1])
+                first_frame, _ = read_boundary_frames(video_paths[i])
+                transition_frames = generate_transition_frames(
+                    last_frame, first_frame, current_transition_type,
+                    num_transition_frames, float(fps)
+                )
+                
+                if num_pause_frames > 0 or transition_frames:
+                    if num_pause_frames > 0:
+                        print(f"    Ajout d'une pause de {pause_duration}s ({num_pause_frames} frames)")
+                    if current_transition_type != 'none':
+                        print(f"    Transition: {current_transition_type} ({current_transition_duration}s)")
+                    
+                    segment_path = os.path.join(temp_dir, f"transition_{i}.mp4")
+                    sink = PyAVFrameSink(segment_path, fps, width, height, crf=crf)
+                    for _ in range(num_pause_frames):
+                        sink.write(last_frame)
+                    for trans_frame in transition_frames:
+                        sink.write(trans_frame)
+                    sink.release()
+                    
+                    # Le segment doit être compatible avec les slides pour être recopié
+                    if probe_stream_copy_params(segment_path) != params:
+                        return False
+                    segments.append(segment_path)
+            
+            segments.append(video_paths[i])
+        
+        # Recopier les packets de chaque segment en décalant les timestamps
+        remux_segments(segments, output_path, fps)
+        
+        return True
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 def concatenate_videos(video_paths, output_path, transition_type='none', transition_duration=0.5, per_slide_transitions=None, crf=18):
     """Concatène plusieurs vidéos en une seule vidéo finale avec transitions optionnelles.
     
@@ -4163,6 +4956,18 @@ def concatenate_videos(video_paths, output_path, transition_type='none', transit
         if transition_type != 'none':
             print(f"   Transition: {transition_type} ({transition_duration}s)")
         
+        # Chemin rapide: copie des flux H.264 sans ré-encoder les slides
+        try:
+            if concatenate_videos_stream_copy(
+                video_paths, output_path, transition_type, transition_duration,
+                per_slide_transitions, crf
+            ):
+                print(f"✅ Concaténation réussie (copie de flux): {output_path}")
+                return True
+            print("   Paramètres vidéo différents, ré-encodage complet")
+        except Exception as e:
+            print(f"   ⚠️ Copie de flux impossible ({e}), ré-encodage complet")
+        
         # Ouvrir le premier fichier pour obtenir les paramètres
         first_container = av.open(video_paths[0], mode="r")
         first_stream = first_container.streams.video[0]
@@ -4181,111 +4986,93 @@ def concatenate_videos(video_paths, output_path, transition_type='none', transit
         out_stream.height = height
         out_stream.pix_fmt = "yuv420p"
         out_stream.options = {"crf": str(crf)}
+        out_time_base = Fraction(1) / fps
+        out_stream.codec_context.time_base = out_time_base
+        
+        # Nombre de frames déjà encodées (sert de pts en 1/fps)
+        frames_encoded = 0
+        
+        def encode_frame(av_frame):
+            """Encode une frame avec un pts continu et multiplexe les packets."""
+            nonlocal frames_encoded
+            av_frame.pts = frames_encoded
+            av_frame.time_base = out_time_base
+            for packet in out_stream.encode(av_frame):
+                output_container.mux(packet)
+            frames_encoded += 1
+        
+        def encode_ndarray(frame_np):
+            encode_frame(av.VideoFrame.from_ndarray(frame_np, format='bgr24'))
+        
+        def to_output_bgr(av_frame):
+            """Convertit une frame décodée en BGR à la résolution de sortie."""
+            frame_np = av_frame.to_ndarray(format='bgr24')
+            if frame_np.shape[:2] != (height, width):
+                frame_np = cv2.resize(frame_np, (width, height))
+            return frame_np
         
+        # Seule la dernière frame de la vidéo précédente est conservée (pour les transitions)
         last_frame = None
         
-        # Concaténer toutes les vidéos
+        # Concaténer toutes les vidéos en flux: décodage -> redimensionnement optionnel -> encodage
         for i, video_path in enumerate(video_paths):
             print(f"  Ajout de la vidéo {i+1}/{len(video_paths)}: {os.path.basename(video_path)}")
             input_container = av.open(video_path, mode="r")
+            in_stream = input_container.streams.video[0]
+            needs_resize = (in_stream.codec_context.width, in_stream.codec_context.height) != (width, height)
+            decoded_frames = input_container.decode(in_stream)
             
-            first_frame_of_video = None
-            frames_list = []
-            
-            # Lire toutes les frames de cette vidéo
-            for frame in input_container.decode(video=0):
-                frames_list.append(frame)
-            
-            input_container.close()
+            # Lire uniquement la première frame de cette vidéo (pour la transition)
+            first_frame_of_video = next(decoded_frames, None)
             
             # Ajouter la transition si ce n'est pas la première vidéo
-            if i > 0 and last_frame is not None and len(frames_list) > 0:
-                first_frame_of_video = frames_list[0]
-                
-                # Déterminer le type et la durée de transition pour cette slide
-                current_transition_type = transition_type
-                current_transition_duration = transition_duration
-                
-                # Si une configuration par slide existe, l'utiliser
-                if per_slide_transitions and i - 1 < len(per_slide_transitions):
-                    slide_trans_config = per_slide_transitions[i - 1]
-                    if 'type' in slide_trans_config:
-                        current_transition_type = slide_trans_config['type']
-                    if 'duration' in slide_trans_config:
-                        current_transition_duration = slide_trans_config['duration']
+            if i > 0 and last_frame is not None and first_frame_of_video is not None:
+                # Déterminer le type, la durée et la pause de transition pour cette slide
+                current_transition_type, current_transition_duration, pause_duration = get_transition_for_slide(
+                    i, transition_type, transition_duration, per_slide_transitions
+                )
                 
                 # Calculer le nombre de frames pour cette transition
                 current_num_transition_frames = int(float(fps) * current_transition_duration)
                 
                 # Ajouter des frames de pause avant la transition si spécifié
-                pause_duration = 0
-                if per_slide_transitions and i - 1 < len(per_slide_transitions):
-                    pause_duration = per_slide_transitions[i - 1].get('pause_before', 0)
-                
                 if pause_duration > 0:
                     num_pause_frames = int(float(fps) * pause_duration)
                     print(f"    Ajout d'une pause de {pause_duration}s ({num_pause_frames} frames)")
-                    last_frame_np = last_frame.to_ndarray(format='bgr24')
-                    if last_frame_np.shape[:2] != (height, width):
-                        last_frame_np = cv2.resize(last_frame_np, (width, height))
-                    
                     for _ in range(num_pause_frames):
-                        av_frame = av.VideoFrame.from_ndarray(last_frame_np, format='bgr24')
-                        av_frame.pts = None
-                        packets = out_stream.encode(av_frame)
-                        for packet in packets:
-                            output_container.mux(packet)
+                        encode_ndarray(last_frame)
                 
                 # Afficher la transition utilisée
                 if current_transition_type != 'none':
                     print(f"    Transition: {current_transition_type} ({current_transition_duration}s)")
                 
-                # Convertir les frames PyAV en numpy arrays
-                last_frame_np = last_frame.to_ndarray(format='bgr24')
-                first_frame_np = first_frame_of_video.to_ndarray(format='bgr24')
-                
-                # Redimensionner les frames si nécessaire pour correspondre à la résolution de sortie
-                if last_frame_np.shape[:2] != (height, width):
-                    last_frame_np = cv2.resize(last_frame_np, (width, height))
-                if first_frame_np.shape[:2] != (height, width):
-                    first_frame_np = cv2.resize(first_frame_np, (width, height))
-                
-                # Générer les frames de transition
+                # Générer et encoder les frames de transition une par une
                 transition_frames = generate_transition_frames(
-                    last_frame_np, first_frame_np, current_transition_type, 
+                    last_frame, to_output_bgr(first_frame_of_video), current_transition_type,
                     current_num_transition_frames, float(fps)
                 )
-                
-                # Encoder les frames de transition
                 for trans_frame in transition_frames:
-                    # Convertir numpy array en PyAV frame
-                    av_frame = av.VideoFrame.from_ndarray(trans_frame, format='bgr24')
-                    av_frame.pts = None
-                    # encode() retourne une liste de packets
-                    packets = out_stream.encode(av_frame)
-                    for packet in packets:
-                        output_container.mux(packet)
-            
-            # Ajouter toutes les frames de cette vidéo
-            # Pour assurer la compatibilité avec les frames de transition,
-            # convertir les frames décodées en numpy puis en VideoFrame
-            for frame in frames_list:
-                # Convertir en numpy puis recréer le frame
-                frame_np = frame.to_ndarray(format='bgr24')
-                
-                # Redimensionner si nécessaire pour correspondre à la résolution de sortie
-                if frame_np.shape[:2] != (height, width):
-                    frame_np = cv2.resize(frame_np, (width, height))
-                
-                av_frame = av.VideoFrame.from_ndarray(frame_np, format='bgr24')
-                # encode() retourne une liste de packets
-                packets = out_stream.encode(av_frame)
-                for packet in packets:
-                    output_container.mux(packet)
+                    encode_ndarray(trans_frame)
+                del transition_frames
+            
+            # Encoder les frames de cette vidéo au fil du décodage.
+            # Sans redimensionnement, les frames décodées sont transmises telles quelles
+            # à l'encodeur (pas d'aller-retour numpy).
+            frame = first_frame_of_video
+            previous_frame = None
+            while frame is not None:
+                if needs_resize:
+                    encode_ndarray(to_output_bgr(frame))
+                else:
+                    encode_frame(frame)
+                previous_frame = frame
+                frame = next(decoded_frames, None)
             
             # Sauvegarder la dernière frame pour la transition suivante
-            if len(frames_list) > 0:
-                last_frame = frames_list[-1]
+            if previous_frame is not None:
+                last_frame = to_output_bgr(previous_frame)
+            
+            input_container.close()
         
         # Finaliser l'encodage - appeler encode() en boucle jusqu'à ce qu'il n'y ait plus de packets
         try:
@@ -4325,7 +5112,7 @@ def concatenate_videos(video_paths, output_path, transition_type='none', transit
             return False
 
 
-def initiate_sketch_sync(image_path, split_len, frame_rate, object_skip_rate, bg_object_skip_rate, main_img_duration, callback, save_path=save_path, which_platform="linux", export_json=False, aspect_ratio='original', crf=DEFAULT_CRF, watermark_path=None, watermark_position='bottom-right', watermark_opacity=0.5, watermark_scale=0.1):
+def initiate_sketch_sync(image_path, split_len, frame_rate, object_skip_rate, bg_object_skip_rate, main_img_duration, callback, save_path=save_path, which_platform="linux", export_json=False, aspect_ratio='original', crf=DEFAULT_CRF, watermark_path=None, watermark_position='bottom-right', watermark_opacity=0.5, watermark_scale=0.1, frame_workers=1, encoder_queue_size=DEFAULT_ENCODER_QUEUE_SIZE):
     """Version synchrone de initiate_sketch pour l'exécution en ligne de commande (sans Kivy Clock)."""
     global platform
     platform = which_platform
@@ -4373,25 +5160,36 @@ def initiate_sketch_sync(image_path, split_len, frame_rate, object_skip_rate, bg
             object_skip_rate=object_skip_rate, bg_object_skip_rate=bg_object_skip_rate, 
             end_gray_img_duration_in_sec=main_img_duration, export_json=export_json,
             watermark_path=watermark_path, watermark_position=watermark_position,
-            watermark_opacity=watermark_opacity, watermark_scale=watermark_scale
+            watermark_opacity=watermark_opacity, watermark_scale=watermark_scale,
+            crf=crf, frame_workers=frame_workers, encoder_queue_size=encoder_queue_size
+        )
+
+        # Encodage H.264 direct si PyAV est disponible, sinon vidéo brute à convertir
+        frame_sink = create_frame_sink(
+            ffmpeg_video_path, frame_rate, img_wd, img_ht, crf=crf,
+            raw_path=save_video_path, platform=platform, segmented=frame_workers > 1
         )
 
         draw_whiteboard_animations(
-            image_bgr, mask_path, hand_path, hand_mask_path, save_video_path, variables
+            image_bgr, mask_path, hand_path, hand_mask_path, save_video_path, variables,
+            frame_sink=frame_sink
         )
         
         # Export JSON if requested
         if export_json:
             export_animation_json(variables, json_export_path)
         
-        ff_stat = ffmpeg_convert(source_vid=save_video_path, dest_vid=ffmpeg_video_path, platform=platform, crf=crf)
-        
-        if ff_stat:
-            final_result = {"status": True, "message": f"{ffmpeg_video_path}"}
-            os.unlink(save_video_path)
-            print(f"Vidéo brute supprimée: {save_video_path}")
+        if not frame_sink.needs_conversion:
+            final_result = {"status": True, "message": f"{frame_sink.path}"}
         else:
-            final_result = {"status": True, "message": f"{save_video_path}"} 
+            ff_stat = ffmpeg_convert(source_vid=save_video_path, dest_vid=ffmpeg_video_path, platform=platform, crf=crf)
+            
+            if ff_stat:
+                final_result = {"status": True, "message": f"{ffmpeg_video_path}"}
+                os.unlink(save_video_path)
+                print(f"Vidéo brute supprimée: {save_video_path}")
+            else:
+                final_result = {"status": True, "message": f"{save_video_path}"} 
         
         # Add JSON path to result if exported
         if export_json:
@@ -4403,7 +5201,94 @@ def initiate_sketch_sync(image_path, split_len, frame_rate, object_skip_rate, bg
     callback(final_result)
 
 
-def process_multiple_images(image_paths, split_len, frame_rate, object_skip_rate, bg_object_skip_rate, main_img_duration, which_platform="linux", export_json=False, transition='none', transition_duration=0.5, per_slide_config=None, aspect_ratio='original', crf=DEFAULT_CRF, watermark_path=None, watermark_position='bottom-right', watermark_opacity=0.5, watermark_scale=0.1, audio_config=None, background_music=None, music_volume=0.5, music_fade_in=0, music_fade_out=0, enable_typewriter_sound=False, enable_drawing_sound=False):
+def render_slide_job(job, capture_output=False):
+    """Rend une slide dans sa propre vidéo.
+    
+    Utilisée directement en mode séquentiel et dans les processus du pool
+    avec --slide-workers. Les erreurs sont retournées au lieu d'être levées.
+    
+    Args:
+        job: Paramètres de la slide préparés par process_multiple_images
+        capture_output: Capturer les messages pour les afficher plus tard dans l'ordre
+    
+    Returns:
+        dict avec 'video', 'json_path', 'error' et 'log' (messages capturés)
+    """
+    global platform
+    platform = job['platform']
+    result = {'video': None, 'json_path': None, 'error': None, 'log': ''}
+    log = io.StringIO()
+    
+    with contextlib.ExitStack() as stack:
+        if capture_output:
+            stack.enter_context(contextlib.redirect_stdout(log))
+            stack.enter_context(contextlib.redirect_stderr(log))
+        try:
+            frame_rate, img_wd, img_ht = job['frame_rate'], job['img_wd'], job['img_ht']
+            save_video_path, ffmpeg_video_path = job['save_video_path'], job['ffmpeg_video_path']
+            
+            # Créer les variables
+            variables = AllVariables(
+                frame_rate=frame_rate, resize_wd=img_wd, resize_ht=img_ht, split_len=job['split_len'],
+                object_skip_rate=job['skip_rate'], bg_object_skip_rate=job['bg_skip_rate'],
+                end_gray_img_duration_in_sec=job['duration'], export_json=job['export_json'],
+                watermark_path=job['watermark_path'], watermark_position=job['watermark_position'],
+                watermark_opacity=job['watermark_opacity'], watermark_scale=job['watermark_scale'],
+                crf=job['crf'], frame_workers=job['frame_workers'],
+                encoder_queue_size=job['encoder_queue_size']
+            )
+            
+            # Encodage H.264 direct si PyAV est disponible, sinon vidéo brute à convertir
+            # (par segments si le dessin est rendu dans plusieurs processus)
+            frame_sink = create_frame_sink(
+                ffmpeg_video_path, frame_rate, img_wd, img_ht, crf=job['crf'],
+                raw_path=save_video_path, platform=platform,
+                segmented=job['frame_workers'] > 1 and not job['layers']
+            )
+            
+            # Générer l'animation (avec ou sans couches)
+            if job['layers']:
+                # Animation multi-couches
+                draw_layered_whiteboard_animations(
+                    job['layers'], hand_path, hand_mask_path, save_video_path, variables, base_path,
+                    job['slide_config'], frame_sink=frame_sink, timeline_config=job.get('timeline')
+                )
+            else:
+                # Animation simple d'une seule image
+                draw_whiteboard_animations(
+                    job['image_bgr'], job['mask_path'], hand_path, hand_mask_path, save_video_path, variables,
+                    frame_sink=frame_sink
+                )
+            
+            # Export JSON si demandé
+            if job['export_json']:
+                export_animation_json(variables, job['json_export_path'])
+                result['json_path'] = job['json_export_path']
+            
+            if not frame_sink.needs_conversion:
+                # Déjà encodée en H.264
+                result['video'] = frame_sink.path
+                print(f"  ✅ Vidéo générée: {os.path.basename(frame_sink.path)}")
+            else:
+                # Convertir en H.264
+                ff_stat = ffmpeg_convert(source_vid=save_video_path, dest_vid=ffmpeg_video_path, platform=platform, crf=job['crf'])
+                
+                if ff_stat:
+                    result['video'] = ffmpeg_video_path
+                    os.unlink(save_video_path)
+                    print(f"  ✅ Vidéo générée: {os.path.basename(ffmpeg_video_path)}")
+                else:
+                    result['video'] = save_video_path
+                    print(f"  ✅ Vidéo générée (sans conversion): {os.path.basename(save_video_path)}")
+        
+        except Exception as e:
+            result['error'] = str(e)
+    
+    result['log'] = log.getvalue()
+    return result
+
+
+def process_multiple_images(image_paths, split_len, frame_rate, object_skip_rate, bg_object_skip_rate, main_img_duration, which_platform="linux", export_json=False, transition='none', transition_duration=0.5, per_slide_config=None, aspect_ratio='original', crf=DEFAULT_CRF, watermark_path=None, watermark_position='bottom-right', watermark_opacity=0.5, watermark_scale=0.1, audio_config=None, background_music=None, music_volume=0.5, music_fade_in=0, music_fade_out=0, enable_typewriter_sound=False, enable_drawing_sound=False, save_path=save_path, slide_workers=1, frame_workers=1, encoder_queue_size=DEFAULT_ENCODER_QUEUE_SIZE):
     """Traite plusieurs images et génère une vidéo combinée.
     
     Args:
@@ -4431,6 +5316,10 @@ def process_multiple_images(image_paths, split_len, frame_rate, object_skip_rate
         music_fade_out: Music fade-out duration in seconds
         enable_typewriter_sound: Enable typewriter sounds for text animations
         enable_drawing_sound: Enable drawing sounds for animations
+        save_path: Dossier de sortie des vidéos
+        slide_workers: Nombre de processus pour rendre les slides en parallèle (1 = séquentiel)
+        frame_workers: Nombre de processus pour rendre le dessin de chaque slide image (1 = séquentiel)
+        encoder_queue_size: Nombre de tampons entre le rendu et le thread d'encodage (0 = synchrone)
     """
     global platform
     platform = which_platform
@@ -4506,9 +5395,34 @@ def process_multiple_images(image_paths, split_len, frame_rate, object_skip_rate
         print("⚠️ Audio requested but pydub is not installed. Audio features disabled.")
         print("   Install with: pip install pydub")
     
+    # Timeline globale: ses temps sont ceux d'une présentation à une seule slide;
+    # avec plusieurs slides, chaque slide déclare sa propre "timeline"
+    global_timeline_config = per_slide_config.get('timeline') if per_slide_config else None
+    if global_timeline_config and num_items > 1:
+        print("⚠️ Timeline globale ignorée avec plusieurs slides: utilisez 'timeline' dans chaque slide")
+        global_timeline_config = None
+    
     # Préparer les configurations de transition par slide
     transition_configs = []
     
+    # Rendu des slides en parallèle: chaque slide a ses propres variables et son fichier
+    executor = None
+    num_workers = min(slide_workers, num_items)
+    if num_workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=cv2.setNumThreads, initargs=(1,)
+        )
+    pending_slides = []
+    
+    def collect_slide_result(idx, slide_result):
+        if slide_result['error'] is not None:
+            print(f"  ❌ Erreur lors du traitement de l'image {idx}: {slide_result['error']}")
+            return
+        generated_videos.append(slide_result['video'])
+        if slide_result['json_path']:
+            json_exports.append(slide_result['json_path'])
+    
     # Traiter chaque slide/image
     for idx in range(1, num_items + 1):
         # Determine if this is an image-based or layer-based slide
@@ -4637,46 +5551,49 @@ def process_multiple_images(image_paths, split_len, frame_rate, object_skip_rate
                         break
             transition_configs.append(transition_config)
             
-            # Créer les variables
-            variables = AllVariables(
-                frame_rate=frame_rate, resize_wd=img_wd, resize_ht=img_ht, split_len=split_len,
-                object_skip_rate=slide_skip_rate, bg_object_skip_rate=bg_object_skip_rate,
-                end_gray_img_duration_in_sec=slide_duration, export_json=export_json,
-                watermark_path=watermark_path, watermark_position=watermark_position,
-                watermark_opacity=watermark_opacity, watermark_scale=watermark_scale
-            )
-            
-            # Générer l'animation (avec ou sans couches)
-            if layers:
-                # Animation multi-couches
-                draw_layered_whiteboard_animations(
-                    layers, hand_path, hand_mask_path, save_video_path, variables, base_path, slide_config
-                )
-            else:
-                # Animation simple d'une seule image
-                draw_whiteboard_animations(
-                    image_bgr, mask_path, hand_path, hand_mask_path, save_video_path, variables
-                )
-            
-            # Export JSON si demandé
-            if export_json:
-                export_animation_json(variables, json_export_path)
-                json_exports.append(json_export_path)
-            
-            # Convertir en H.264
-            ff_stat = ffmpeg_convert(source_vid=save_video_path, dest_vid=ffmpeg_video_path, platform=platform, crf=crf)
-            
-            if ff_stat:
-                generated_videos.append(ffmpeg_video_path)
-                os.unlink(save_video_path)
-                print(f"  ✅ Vidéo générée: {os.path.basename(ffmpeg_video_path)}")
-            else:
-                generated_videos.append(save_video_path)
-                print(f"  ✅ Vidéo générée (sans conversion): {os.path.basename(save_video_path)}")
+            job = {
+                'image_bgr': image_bgr, 'mask_path': mask_path,
+                'layers': layers, 'slide_config': slide_config,
+                'img_wd': img_wd, 'img_ht': img_ht, 'split_len': split_len,
+                'frame_rate': frame_rate, 'skip_rate': slide_skip_rate,
+                'bg_skip_rate': bg_object_skip_rate, 'duration': slide_duration,
+                'export_json': export_json, 'crf': crf, 'platform': platform,
+                'frame_workers': frame_workers, 'encoder_queue_size': encoder_queue_size,
+                'watermark_path': watermark_path, 'watermark_position': watermark_position,
+                'watermark_opacity': watermark_opacity, 'watermark_scale': watermark_scale,
+                'save_video_path': save_video_path, 'ffmpeg_video_path': ffmpeg_video_path,
+                'json_export_path': json_export_path,
+                'timeline': slide_config.get('timeline', global_timeline_config),
+            }
         
         except Exception as e:
             print(f"  ❌ Erreur lors du traitement de l'image {idx}: {e}")
             continue
+        
+        if executor is not None:
+            # Rendu en arrière-plan; les journaux sont affichés dans l'ordre des slides
+            pending_slides.append((idx, executor.submit(render_slide_job, job, True)))
+            print(f"  ⏳ Rendu confié au pool de processus")
+        else:
+            collect_slide_result(idx, render_slide_job(job))
+    
+    if executor is not None:
+        print("\n" + "="*60)
+        print(f"⚡ RENDU PARALLÈLE ({num_workers} processus)")
+        print("="*60)
+        
+        # Assembler les résultats dans l'ordre des slides
+        for idx, future in pending_slides:
+            try:
+                slide_result = future.result()
+            except Exception as e:
+                # Le processus de rendu s'est arrêté brutalement
+                slide_result = {'video': None, 'json_path': None, 'log': '',
+                                'error': f"{type(e).__name__}: {e}"}
+            print(f"\n🎞️ Slide {idx}/{num_items}")
+            print(slide_result['log'], end='')
+            collect_slide_result(idx, slide_result)
+        executor.shutdown()
     
     # Vérifier qu'au moins une vidéo a été générée
     if not generated_videos:
@@ -4881,8 +5798,35 @@ def get_split_lens(image_path):
 
 # --- Configuration CLI (Ligne de Commande) ---
 
-def main():
-    """Fonction principale pour gérer les arguments CLI et lancer l'animation."""
+# Options propres au mode batch, qui ne sont pas transmises aux rendus individuels
+BATCH_ONLY_OPTIONS = {
+    'help', 'image_paths', 'config', 'batch', 'batch_parallel', 'threads', 'output_dir',
+    'background', 'list_checkpoints', 'list_presets', 'get_split_lens', 'resume',
+}
+
+
+def get_batch_render_args(parser, args):
+    """Arguments (Namespace) transmis à chaque rendu du mode batch.
+    
+    Copie de args où les options propres au batch reprennent leur valeur par
+    défaut; les chemins d'images éventuels sont conservés.
+    """
+    defaults = parser.parse_args([])
+    render_args = argparse.Namespace(**vars(args))
+    for name in BATCH_ONLY_OPTIONS - {'image_paths'}:
+        if hasattr(defaults, name):
+            setattr(render_args, name, getattr(defaults, name))
+    return render_args
+
+
+def main(argv=None, args=None):
+    """Fonction principale pour gérer les arguments CLI et lancer l'animation.
+    
+    Args:
+        argv: Liste d'arguments (par défaut: sys.argv[1:])
+        args: Arguments déjà analysés (Namespace), utilisés à la place de argv
+            (rendus du mode batch)
+    """
     parser = argparse.ArgumentParser(
         description="Crée une vidéo d'animation style tableau blanc à partir d'une ou plusieurs images. "
         "Utilisez aussi --get-split-lens [image_path] pour voir les valeurs 'split_len' recommandées."
@@ -5067,7 +6011,60 @@ def main():
         type=int,
         default=None,
         metavar='N',
-        help="Nombre de threads pour le traitement parallèle (par défaut: auto-détecté)."
+        help="Nombre de processus pour le traitement parallèle en mode batch (par défaut: nombre de CPU)."
+    )
+    
+    parser.add_argument(
+        '--slide-workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help="Nombre de processus pour rendre les slides en parallèle (par défaut: 1, rendu séquentiel). "
+        "Les vidéos sont toujours assemblées dans l'ordre des slides."
+    )
+    
+    parser.add_argument(
+        '--frame-workers',
+        type=int,
+        default=1,
+        metavar='N',
+        help="Nombre de processus pour rendre et encoder le dessin d'une slide image par segments "
+        "(par défaut: 1, rendu séquentiel). Nécessite PyAV."
+    )
+    
+    parser.add_argument(
+        '--encoder-queue',
+        type=int,
+        default=DEFAULT_ENCODER_QUEUE_SIZE,
+        metavar='N',
+        help=f"Nombre de trames en attente d'encodage dans le thread d'écriture (par défaut: {DEFAULT_ENCODER_QUEUE_SIZE}). "
+        "0 désactive le thread (encodage synchrone)."
+    )
+    
+    parser.add_argument(
+        '--glyph-cache-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help="Dossier du cache disque des contours de glyphes (texte en mode svg_path). "
+        "Les polices déjà vues ne sont plus analysées lors des rendus suivants."
+    )
+    
+    parser.add_argument(
+        '--layer-cache-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help="Dossier du cache disque des couches texte et forme déjà rendues. "
+        "Les couches identiques (même configuration et même taille) ne sont plus redessinées."
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        type=str,
+        default=None,
+        metavar='DIR',
+        help=f"Dossier de sortie des vidéos (par défaut: {save_path}; en mode batch: ./batch_output, un sous-dossier par configuration)."
     )
     
     parser.add_argument(
@@ -5157,7 +6154,14 @@ def main():
         help="Chemin pour exporter l'audio mixé séparément (wav, mp3, etc.)."
     )
 
-    args = parser.parse_args()
+    if args is None:
+        args = parser.parse_args(argv)
+    output_dir = args.output_dir or save_path
+    # Dossiers de cache aussi transmis aux processus de rendu via l'environnement
+    if args.glyph_cache_dir:
+        set_glyph_cache_dir(args.glyph_cache_dir)
+    if args.layer_cache_dir:
+        set_layer_cache_dir(args.layer_cache_dir)
     
     # Handle list presets command
     if args.list_presets:
@@ -5218,32 +6222,19 @@ def main():
                 print("-" * 60)
             return
         
-        # Handle batch processing
+        # Handle batch processing: each config is rendered like `--config` in its own process
         if args.batch:
             print(f"📦 Batch mode: processing {len(args.batch)} configuration(s)")
+            max_workers = (args.threads or os.cpu_count() or 1) if args.batch_parallel else 1
             results = process_batch(
                 args.batch,
                 parallel=args.batch_parallel,
-                max_workers=args.threads or 2
+                max_workers=max_workers,
+                output_dir=args.output_dir or DEFAULT_BATCH_OUTPUT_DIR,
+                render_args=get_batch_render_args(parser, args)
             )
-            
-            # Process each config in batch
-            for i, config_file in enumerate(args.batch):
-                print(f"\n{'='*60}")
-                print(f"Processing {i+1}/{len(args.batch)}: {config_file}")
-                print(f"{'='*60}")
-                
-                # Temporarily override args.config
-                original_config = args.config
-                args.config = config_file
-                
-                # Note: Full batch processing would recursively call the render
-                # For now, we just prepare the structure
-                results[i]['status'] = 'ready'
-                
-                args.config = original_config
-            
-            print(f"\n✅ Batch processing prepared for {len(args.batch)} configurations")
+            if any(result['status'] != 'completed' for result in results):
+                sys.exit(1)
             return
         
         # Handle background rendering
@@ -5414,7 +6405,10 @@ def main():
             watermark_path=args.watermark,
             watermark_position=args.watermark_position,
             watermark_opacity=args.watermark_opacity,
-            watermark_scale=args.watermark_scale
+            watermark_scale=args.watermark_scale,
+            save_path=output_dir,
+            frame_workers=args.frame_workers,
+            encoder_queue_size=args.encoder_queue
         )
     else:
         # Plusieurs images - utiliser la nouvelle méthode
@@ -5441,7 +6435,11 @@ def main():
             music_fade_in=args.music_fade_in,
             music_fade_out=args.music_fade_out,
             enable_typewriter_sound=args.enable_typewriter_sound,
-            enable_drawing_sound=args.enable_drawing_sound
+            enable_drawing_sound=args.enable_drawing_sound,
+            save_path=output_dir,
+            slide_workers=args.slide_workers,
+            frame_workers=args.frame_workers,
+            encoder_queue_size=args.encoder_queue
         )
         
         print("\n" + "="*60)